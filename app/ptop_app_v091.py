@@ -1,6 +1,7 @@
 # PTOP 통합 앱 v0.91 - 두호/국제 통합 버전
 import streamlit as st
 import pandas as pd
+import numpy as np
 import openpyxl
 from openpyxl import load_workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
@@ -9,7 +10,6 @@ from datetime import date, timedelta
 import os
 import io
 import re
-from difflib import SequenceMatcher
 import shutil
 import os
 from pathlib import Path
@@ -619,26 +619,13 @@ def parse_width_m_from_standard(std: str, fallback=DEFAULT_SPAN_WIDTH_M):
     """
     if not std:
         return fallback
-    s = str(std)
-    m = re.search(r'[Ww\uFF37\ubc15]?\s*[-_×x]?\s*(\d{3,5})', s)
-    if m:
-        try:
-            mm = float(m.group(1))
-            if mm > 10:
-                return round(mm/1000.0, 3)
-            return mm
-        except:
-            pass
-    m2 = re.search(r'(\d{3,5})', s)
-    if m2:
-        try:
-            mm = float(m2.group(1))
-            if mm > 10:
-                return round(mm/1000.0, 3)
-            return mm
-        except:
-            pass
-    return fallback
+    from utils.spec_parser import width_mm
+    mm = width_mm(str(std))
+    if mm is None:
+        return fallback
+    if mm > 10:
+        return round(mm/1000.0, 3)
+    return mm
 
 PIPE_STANDARD_LENGTH_M = 6.0
 
@@ -654,7 +641,12 @@ def _safe_float(x, default=0.0):
 class UnifiedQuotationSystem:
     """통합 업무자동화 시스템"""
     
-    def __init__(self, tenant_id=None):
+    def __init__(self, tenant_id=None, background=False):
+        """
+        Args:
+            tenant_id: 테넌트 ID (None이면 URL 파라미터/세션에서)
+            background: 백그라운드 워밍용 (세션 상태를 건드리지 않고 데이터도 미리 로드하지 않음)
+        """
         # 테넌트 ID 설정
         self.tenant_id = tenant_id or get_tenant_from_params()
         
@@ -675,7 +667,7 @@ class UnifiedQuotationSystem:
         }
         
         # 세션 상태 확인 및 초기화
-        current_tenant = st.session_state.get('current_tenant')
+        current_tenant = self.tenant_id if background else st.session_state.get('current_tenant')
         if current_tenant != self.tenant_id:
             # 테넌트가 변경된 경우 관련 세션 상태 초기화
             keys_to_clear = ['material_items', 'model_span_plan', 'last_material_data', 
@@ -684,7 +676,6 @@ class UnifiedQuotationSystem:
                 if key in st.session_state:
                     del st.session_state[key]
             st.session_state.current_tenant = self.tenant_id
-            st.cache_data.clear()
         
         # Supabase + PtopEngine 초기화
         import sys
@@ -698,21 +689,32 @@ class UnifiedQuotationSystem:
         import os
         from app.config_supabase import SUPABASE_URL, SUPABASE_KEY
         from utils.ptop_engine import PtopEngine
+        from utils.bom_explosion import BomExplosionEngine
+        self._catalog_index = None
+        self._catalog_views = None
 
         try:
             # 환경변수에서 Supabase 설정 읽기 (demo 테넌트용 동적 설정)
             supabase_url = os.getenv('SUPABASE_URL') or SUPABASE_URL
             supabase_key = os.getenv('SUPABASE_KEY') or SUPABASE_KEY
 
-            supabase = create_client(supabase_url, supabase_key)
+            # PTOP_BACKEND=sqlite: 로컬 SQLite 미러 사용 (python -m utils.sqlite_backend 로 동기화)
+            if os.getenv('PTOP_BACKEND', '').lower() == 'sqlite':
+                from utils.sqlite_backend import SqliteClient
+                supabase = SqliteClient(os.getenv('PTOP_SQLITE_PATH', 'ptop_local.db'))
+            else:
+                supabase = create_client(supabase_url, supabase_key)
             self.engine = PtopEngine(supabase, tenant_id=self.tenant_id)
+            self.bom_explosion = BomExplosionEngine(self.engine)
             print(f"[INFO] PtopEngine 초기화 성공 (tenant: {self.tenant_id})")
         except Exception as e:
-            st.error(f"Supabase 연결 실패: {e}")
+            if not background:
+                st.error(f"Supabase 연결 실패: {e}")
             raise
 
-        # 데이터 로드 (캐싱용)
-        self.load_data()
+        # 데이터 로드 (캐싱용, 워밍이 끝난 테넌트는 공유 카탈로그를 바로 반환)
+        if not background:
+            self.load_data()
     
     def _ukey(self, scope, *parts):
         import re
@@ -720,108 +722,166 @@ class UnifiedQuotationSystem:
         return f"v091_{self.tenant_id}_{scope}_" + "_".join(norm)
 
 
-    @st.cache_data
-    def load_data(_self):
-        """Supabase에서 데이터 로드 (PtopEngine 사용)"""
-        import pandas as pd
+    # Supabase → Excel 호환 컬럼명 (테이블별)
+    CATALOG_COLUMN_MAPS = {
+        'pricing': {
+            'model_name': '모델명', 'unit_price': '단가', 'unit': '단위', 'standard': '규격',
+        },
+        'main_materials': {
+            'product_name': '품목', 'standard': '규격', 'unit_length_m': '파이프길이(m)', 'unit_price': '단가',
+        },
+        'sub_materials': {
+            'product_name': '품목', 'standard': '규격', 'unit': '단위', 'unit_price': '단가',
+            'notes': '비고', 'supplier': '업체명',
+        },
+        'inventory': {
+            'item_id': '자재ID', 'product_name': '재질', 'standard': '규격', 'thickness': '두께',
+            'unit_length_m': '파이프길이(m)', 'unit_price': '단가', 'current_quantity': '잔여재고',
+            'unit': '단위', 'supplier': '공급업체', 'notes': '비고',
+        },
+    }
 
-        try:
-            engine = _self.engine
-            data = {}
+    @classmethod
+    def _convert_catalog_columns(cls, table, df):
+        """카탈로그 테이블 하나의 NULL 처리, 컬럼명 변환 (Supabase → Excel 호환), 규격 키 추가"""
+        if df.empty:
+            return df
 
-            # Supabase에서 데이터 가져오기
-            data['models'] = engine.get_all_models()
-            data['pricing'] = engine.search_pricing('')
-            data['main_materials'] = engine.search_main_materials('')
-            data['sub_materials'] = engine.search_sub_materials('')
-            data['inventory'] = engine.search_inventory('')
+        from utils.spec_parser import add_spec_columns
 
-            # 컬럼명 변환 (Supabase → Excel 호환)
-            
-            # models 컬럼명 변환
-            if not data['models'].empty and 'identifier_number' in data['models'].columns:
-                data['models']['식별번호'] = data['models']['identifier_number']
-
-            # pricing 컬럼명 변환
-            if not data['pricing'].empty:
-                pricing_map = {}
-                if 'model_name' in data['pricing'].columns:
-                    pricing_map['model_name'] = '모델명'
-                if 'unit_price' in data['pricing'].columns:
-                    pricing_map['unit_price'] = '단가'
-                if 'unit' in data['pricing'].columns:
-                    pricing_map['unit'] = '단위'
-                if 'standard' in data['pricing'].columns:
-                    pricing_map['standard'] = '규격'
-                if pricing_map:
-                    data['pricing'].rename(columns=pricing_map, inplace=True)
-
-            # main_materials: NULL 값 처리 후 컬럼명 변환
-            if not data['main_materials'].empty:
-                if 'unit_length_m' in data['main_materials'].columns:
-                    data['main_materials']['unit_length_m'] = data['main_materials']['unit_length_m'].fillna(6.0)
-
-                main_materials_map = {}
-                if 'product_name' in data['main_materials'].columns:
-                    main_materials_map['product_name'] = '품목'
-                if 'standard' in data['main_materials'].columns:
-                    main_materials_map['standard'] = '규격'
-                if 'unit_length_m' in data['main_materials'].columns:
-                    main_materials_map['unit_length_m'] = '파이프길이(m)'
-                if 'unit_price' in data['main_materials'].columns:
-                    main_materials_map['unit_price'] = '단가'
-                if main_materials_map:
-                    data['main_materials'].rename(columns=main_materials_map, inplace=True)
-
-            # sub_materials 컬럼명 변환
-            if not data['sub_materials'].empty:
-                sub_materials_map = {}
-                if 'product_name' in data['sub_materials'].columns:
-                    sub_materials_map['product_name'] = '품목'
-                if 'standard' in data['sub_materials'].columns:
-                    sub_materials_map['standard'] = '규격'
-                if 'unit' in data['sub_materials'].columns:
-                    sub_materials_map['unit'] = '단위'
-                if 'unit_price' in data['sub_materials'].columns:
-                    sub_materials_map['unit_price'] = '단가'
-                if 'notes' in data['sub_materials'].columns:
-                    sub_materials_map['notes'] = '비고'
-                if 'supplier' in data['sub_materials'].columns:
-                    sub_materials_map['supplier'] = '업체명'
-                if sub_materials_map:
-                    data['sub_materials'].rename(columns=sub_materials_map, inplace=True)
-
-            # inventory 컬럼명 변환
-            if not data['inventory'].empty:
-                inventory_map = {}
-                if 'item_id' in data['inventory'].columns:
-                    inventory_map['item_id'] = '자재ID'
-                if 'product_name' in data['inventory'].columns:
-                    inventory_map['product_name'] = '재질'
-                if 'standard' in data['inventory'].columns:
-                    inventory_map['standard'] = '규격'
-                if 'thickness' in data['inventory'].columns:
-                    inventory_map['thickness'] = '두께'
-                if 'unit_length_m' in data['inventory'].columns:
-                    inventory_map['unit_length_m'] = '파이프길이(m)'
-                if 'unit_price' in data['inventory'].columns:
-                    inventory_map['unit_price'] = '단가'
-                if 'current_quantity' in data['inventory'].columns:
-                    inventory_map['current_quantity'] = '잔여재고'
-                if 'unit' in data['inventory'].columns:
-                    inventory_map['unit'] = '단위'
-                if 'supplier' in data['inventory'].columns:
-                    inventory_map['supplier'] = '공급업체'
-                if 'notes' in data['inventory'].columns:
-                    inventory_map['notes'] = '비고'
-                if inventory_map:
-                    data['inventory'].rename(columns=inventory_map, inplace=True)
+        # models: 식별번호 컬럼 추가
+        if table == 'models':
+            if 'identifier_number' in df.columns:
+                df['식별번호'] = df['identifier_number']
+            return add_spec_columns(table, df)
+
+        # main_materials: 파이프 길이 NULL → 6m
+        if table == 'main_materials' and 'unit_length_m' in df.columns:
+            df['unit_length_m'] = df['unit_length_m'].fillna(6.0)
+
+        column_map = {k: v for k, v in cls.CATALOG_COLUMN_MAPS.get(table, {}).items() if k in df.columns}
+        if column_map:
+            df.rename(columns=column_map, inplace=True)
+        # 규격 키 컬럼 (spec_key/spec_norm) - 자재 매칭에서 정규식 대신 키 비교
+        return add_spec_columns(table, df)
+
+    def _catalog_snapshot(self):
+        """테넌트 카탈로그 스냅샷 (pyarrow가 없거나 PTOP_SNAPSHOT_DIR를 설정하지 않았으면 None)"""
+        from utils.catalog_snapshot import snapshot_for
+
+        return snapshot_for(self.tenant_id, os.getenv('PTOP_BACKEND', '').lower() or 'supabase')
+
+    def _load_catalog_tables(self, tables=None):
+        """
+        카탈로그 테이블 조회 + 컬럼 변환 (SharedCatalog 로더)
+
+        프로세스의 첫 전체 로드는 로컬 스냅샷(Arrow)으로 증분 동기화 상태를 복원하므로
+        Supabase에서는 스냅샷 이후 변경분만 받는다. 변경이 없는 테이블은 현재 공유 카탈로그나
+        스냅샷의 정규화 테이블(메모리 맵)을 그대로 쓴다.
 
+        Args:
+            tables: 다시 읽을 테이블 목록 (None이면 전체 + 빈 BOM 테이블)
+
+        Returns:
+            CatalogLoad (테이블, 로드 시간, 메모리 압축 리포트, 스냅샷에서 가져온 테이블 버전)
+        """
+        import pandas as pd
+        from utils.catalog_compaction import compact_frame
+        from utils.shared_catalog import CatalogLoad, get_catalog_registry
+
+        data = {}
+        timings = {}
+        memory = {}
+        versions = {}
+
+        current = get_catalog_registry().current(self.tenant_id)
+        load_start = time.perf_counter()
+        restored = self._restore_catalog_snapshot() if tables is None else None
+        if restored is not None:
+            timings['snapshot'] = round(time.perf_counter() - load_start, 3)
+
+        # Supabase에서 데이터 가져오기 - 테이블 동시 조회, 도착 순서대로 컬럼명 변환
+        # (증분 동기화: 두 번째 로드부터는 updated_at 이후 변경분만 조회)
+        for table, df, elapsed in self.engine.iter_catalog(tables=tables, incremental=True):
+            timings[table] = round(elapsed, 3)
+            sync = self.engine.sync_info(table)
+            # 변경 없음 (또는 변경분 조회 실패로 빈 결과) - 이미 정규화한 테이블 재사용
+            unchanged = sync is not None and (not sync['changed'] or (df.empty and sync['rows'] > 0))
+            if unchanged and current is not None and table in current.tables:
+                data[table] = current.tables[table]
+                versions[table] = current.table_versions[table]
+                memory[table] = current.memory_report.get(table) or compact_frame(data[table], table)[1]
+                continue
+            if unchanged and restored is not None and table in restored['tables']:
+                # 스냅샷 이후 변경 없음 - 스냅샷의 정규화 테이블(메모리 맵) 사용
+                manifest = restored['manifest']
+                data[table] = restored['tables'][table]
+                versions[table] = manifest['table_versions'][table]
+                memory[table] = manifest['memory_report'].get(table) or compact_frame(data[table], table)[1]
+                continue
+            # 공유 카탈로그에 올리기 전 메모리 압축 (관리 컬럼 제거, category/Arrow 문자열, 다운캐스트)
+            data[table], memory[table] = compact_frame(self._convert_catalog_columns(table, df), table)
+        timings['total'] = round(time.perf_counter() - load_start, 3)
+        print(f"[INFO] load_data 완료 (tenant: {self.tenant_id}) - " +
+              ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()))
+        print(f"[INFO] 카탈로그 압축 (tenant: {self.tenant_id}) - " +
+              ", ".join(f"{k} -{r['saved'] / 1024:.0f}KB" for k, r in memory.items()))
+
+        if tables is None:
             # BOM은 특정 모델에 대해서만 조회하므로 빈 DF로 초기화
             data['bom'] = pd.DataFrame()
             data['bom1'] = pd.DataFrame(columns=['model_id','material_name','standard','unit','quantity','category','notes'])
+        return CatalogLoad(data, timings, memory, versions)
 
-            return data
+    def _restore_catalog_snapshot(self):
+        """
+        스냅샷으로 증분 동기화 상태 복원 (이 프로세스에서 아직 동기화하지 않은 테이블만)
+
+        Returns:
+            CatalogSnapshot.load() 결과 (스냅샷이 없거나 이미 동기화 중이면 None)
+        """
+        snapshot = self._catalog_snapshot()
+        if snapshot is None:
+            return None
+        restored = snapshot.load()
+        if restored is None:
+            return None
+        watermarks = restored['manifest'].get('watermarks', {})
+        seeded = False
+        for table, raw in restored['raw'].items():
+            if self.engine.sync_info(table) is None:
+                self.engine.seed_sync(table, raw, watermarks.get(table))
+                seeded = True
+        return restored if seeded else None
+
+    def _save_catalog_snapshot(self, catalog):
+        """공유 카탈로그 새 버전을 스냅샷으로 저장 (마지막 저장본과 같거나 저장에 실패한 버전이면 건너뜀)"""
+        snapshot = self._catalog_snapshot()
+        if snapshot is None or not snapshot.needs_save(catalog.version):
+            return
+        raw_frames = {}
+        watermarks = {}
+        for table in catalog.tables:
+            sync = self.engine.sync_info(table)
+            if sync is not None:
+                raw_frames[table] = sync['frame']
+                watermarks[table] = sync['watermark']
+        snapshot.save_if_changed(catalog, raw_frames, watermarks)
+
+    def load_data(self):
+        """
+        카탈로그 데이터 (테넌트별 프로세스 공유 카탈로그의 읽기용 뷰)
+
+        첫 호출만 Supabase에서 로드하고(로컬 스냅샷이 있으면 변경분만), 이후에는 세션/호출 간에
+        같은 DataFrame을 copy-on-write 사본으로 돌려준다 (반환값을 수정해도 공유 카탈로그는 바뀌지 않음).
+        카탈로그를 수정한 뒤에는 refresh_catalog()로 바뀐 테이블만 다시 읽는다.
+        """
+        from utils.shared_catalog import get_catalog_registry
+
+        try:
+            catalog = get_catalog_registry().get_or_load(self.tenant_id, self._load_catalog_tables)
+            self._save_catalog_snapshot(catalog)
+            return catalog.view()
 
         except Exception as e:
             st.error(f"데이터 로드 실패: {e}")
@@ -837,6 +897,49 @@ class UnifiedQuotationSystem:
                 'bom1': pd.DataFrame()
             }
 
+    def refresh_catalog(self, tables=None):
+        """
+        카탈로그 수정 후 호출 - 다음 load_data()에서 바뀐 테이블만 다시 읽어 새 버전 생성
+
+        Args:
+            tables: 수정한 테이블 목록 (None이면 전체)
+        """
+        from utils.shared_catalog import get_catalog_registry
+
+        get_catalog_registry().invalidate(self.tenant_id, tables)
+
+    def _shared_catalog(self, data):
+        """data(load_data() 결과)의 공유 카탈로그 (공유 카탈로그가 아니면 None)"""
+        from utils.shared_catalog import get_catalog_registry
+
+        return get_catalog_registry().get(self.tenant_id, data.get('catalog_version'))
+
+    def warm_catalog(self, refresh=False):
+        """
+        공유 카탈로그 로드 + 파생 색인 구축 (백그라운드 워밍용, 요청 처리 중에는 호출하지 않음)
+
+        Args:
+            refresh: True면 현재 카탈로그를 계속 제공하면서 변경분을 반영한 새 버전으로 교체
+
+        Returns:
+            카탈로그 버전
+        """
+        from utils.model_search import get_model_search_index
+        from utils.shared_catalog import get_catalog_registry
+
+        if refresh:
+            get_catalog_registry().refresh(self.tenant_id, self._load_catalog_tables)
+        data = self.load_data()
+        if data.get('catalog_version') is None:
+            raise RuntimeError("카탈로그 로드 실패")
+
+        # 첫 요청에서 만들던 색인을 미리 구축 (버전당 한 번, 세션 간 공유)
+        self.catalog_index(data)
+        self.catalog_views(data).sub_material_search_index()  # 품목 초성/자모 색인 포함
+        self.material_matcher(data)
+        get_model_search_index(data['models'], data['table_versions'].get('models')).prepare()
+        return data['catalog_version']
+
     def save_to_bom1_sheet(self, material_data):
         """BOM에 수동 자재 저장 (Supabase)"""
         try:
@@ -850,7 +953,6 @@ class UnifiedQuotationSystem:
             )
 
             if success:
-                st.cache_data.clear()
                 st.success(f"BOM에 '{material_data['material_name']}' 추가 완료")
                 return True
             else:
@@ -865,13 +967,105 @@ class UnifiedQuotationSystem:
         """BOM 데이터 로드 (Supabase - 더 이상 BOM1 시트 사용 안함)"""
         return pd.DataFrame(columns=['model_id', 'material_name', 'standard', 'quantity', 'unit', 'category', 'notes'])
     
-    def search_model_price(self, model_name):
-        """모델 단가 검색"""
-        data = self.load_data()
-        if not data:
-            return None
+    def catalog_index(self, data=None):
+        """
+        카탈로그 인덱스 반환 (카탈로그 버전이 바뀐 경우에만 재구축)
+
+        Args:
+            data: load_data() 결과 (None이면 직접 로드)
+
+        Returns:
+            CatalogIndex
+        """
+        from utils.catalog_index import CatalogIndex
+
+        if data is None:
+            data = self.load_data()
+        version = data.get('catalog_version')
+        catalog = self._shared_catalog(data)
+        if catalog is not None:
+            # 공유 카탈로그 버전당 한 번 (세션 간 공유)
+            return catalog.derived('catalog_index', lambda: CatalogIndex(data, version), tables=('models', 'pricing'))
+        index = getattr(self, '_catalog_index', None)
+        if index is None or version is None or index.version != version:
+            index = CatalogIndex(data, version)
+            self._catalog_index = index
+        return index
+
+    def catalog_views(self, data=None):
+        """
+        카탈로그 파생 뷰 반환 (바뀐 테이블의 뷰만 다시 계산)
+
+        Args:
+            data: load_data() 결과 (None이면 직접 로드)
+
+        Returns:
+            CatalogViews
+        """
+        from utils.catalog_views import CatalogViews
+
+        if data is None:
+            data = self.load_data()
+        catalog = self._shared_catalog(data)
+        if catalog is not None:
+            return catalog.derived('catalog_views', lambda: CatalogViews(data))
+        views = getattr(self, '_catalog_views', None)
+        if views is None:
+            views = CatalogViews(data)
+            self._catalog_views = views
+        else:
+            views.refresh(data)
+        return views
+
+    def material_matcher(self, data=None):
+        """
+        자재 일괄 매칭기 반환 (main_materials/sub_materials 버전이 바뀐 경우에만 재구축)
 
-        pricing_df = data.get('pricing')
+        Args:
+            data: load_data() 결과 (None이면 직접 로드)
+
+        Returns:
+            MaterialMatcher
+        """
+        from utils.material_matcher import MaterialMatcher
+
+        if data is None:
+            data = self.load_data()
+        table_versions = data.get('table_versions') or {}
+        versions = (table_versions.get('main_materials'), table_versions.get('sub_materials'))
+        catalog = self._shared_catalog(data)
+        if catalog is not None:
+            return catalog.derived(
+                'material_matcher',
+                lambda: MaterialMatcher(data.get('main_materials'), data.get('sub_materials')),
+                tables=('main_materials', 'sub_materials')
+            )
+        matcher = getattr(self, '_material_matcher', None)
+        if matcher is None or None in versions or getattr(self, '_material_matcher_versions', None) != versions:
+            matcher = MaterialMatcher(data.get('main_materials'), data.get('sub_materials'))
+            self._material_matcher = matcher
+            self._material_matcher_versions = versions
+        return matcher
+
+    def _search_narrowing(self, state_key):
+        """검색창별 타이핑 범위 축소 상태 (세션에 보관, 테넌트가 바뀌면 새로 생성)"""
+        from utils.model_search import QueryNarrowing
+
+        narrowing = st.session_state.get(state_key)
+        if not isinstance(narrowing, QueryNarrowing) or narrowing.tenant_id != self.tenant_id:
+            narrowing = QueryNarrowing(self.tenant_id)
+            st.session_state[state_key] = narrowing
+        return narrowing
+
+    def search_model_price(self, model_name, index=None):
+        """모델 단가 검색 (index: 반복 호출 시 catalog_index() 결과 재사용)"""
+        if index is None:
+            data = self.load_data()
+            if not data:
+                return None
+            index = self.catalog_index(data)
+
+        pricing_df = index.pricing
         if pricing_df is None or len(pricing_df) == 0:
             if st.session_state.get("_DBG", False):
                 st.warning("[DEBUG] pricing_df is empty or missing")
@@ -883,11 +1077,10 @@ class UnifiedQuotationSystem:
             return None
 
         model_clean = str(model_name).strip()
-        col = pricing_df['모델명'].astype(str).str.strip()
-        exact_match = pricing_df[col == model_clean]
+        exact_match = index.price_row(model_clean)
 
-        if not exact_match.empty:
-            return exact_match.iloc[0]
+        if exact_match is not None:
+            return exact_match
 
         if st.session_state.get("_DBG", False):
             st.warning(f"[DEBUG] price_miss(find_model_price): model={model_clean} | available_cols={list(pricing_df.columns)} | rows={len(pricing_df)}")
@@ -898,6 +1091,7 @@ class UnifiedQuotationSystem:
         """견적서 생성"""
         quotation_items = []
         total_supply_price = 0
+        index = self.catalog_index()
         
         for item in items:
             # 수동 입력 자재 처리
@@ -922,7 +1116,7 @@ class UnifiedQuotationSystem:
                 continue
 
             # 일반 모델 처리
-            price_info = self.search_model_price(item['model_name'])
+            price_info = self.search_model_price(item['model_name'], index=index)
             
             if price_info is None:
                 st.warning(f"'{item['model_name']}' 모델의 단가를 찾을 수 없습니다.")
@@ -967,95 +1161,33 @@ class UnifiedQuotationSystem:
         if not isinstance(quotation_data, dict):
             return purchase_items
 
-        plan = {}
-        try:
-            plan = quotation_data.get('site_info', {}).get('model_span_plan', {}) or {}
-        except Exception:
-            plan = {}
-
-        models_df = data.get('models', pd.DataFrame())
-        model_cat_map = {}
-        if not models_df.empty:
-            name_col = 'model_name' if 'model_name' in models_df.columns else None
-            cat_col = 'category' if 'category' in models_df.columns else None
-            if name_col and cat_col:
-                for _, r in models_df.iterrows():
-                    model_cat_map[str(r[name_col])] = str(r[cat_col])
-
-        # 안전한 중첩 접근: site_info.total_span_count
-        total_span_count = int(safe_get_nested(quotation_data, ['site_info', 'total_span_count'], 1))
-
         # 안전한 items 접근
         items = safe_get(quotation_data, 'items', [])
         if not items:
             return purchase_items
 
-        for item in items:
-            # 필수 필드 검증: model_name, quantity
-            if not validate_dict_keys(item, ['model_name', 'quantity']):
-                continue  # 불완전한 항목은 건너뜀
-
-            try:
-                model_name = item['model_name']
-                item_quantity = float(item['quantity'])
-
-                model_info = data['models'][data['models']['model_name'] == model_name]
-
-                if not model_info.empty:
-                    model_id = model_info.iloc[0]['model_id']
-                    model_bom = self.engine.get_bom(model_id)
-
-                    # BOM 데이터 유효성 검증 (Empty DataFrame 체크)
-                    if model_bom is None or model_bom.empty:
-                        print(f"[WARNING] BOM not found for model: {model_name} (model_id: {model_id})")
-                        continue  # 다음 item으로 진행
-
-                    for _, bom_item in model_bom.iterrows():
-                        multiplier = total_span_count
-                        if model_name in plan:
-                            multiplier = int(plan[model_name].get('span_count', multiplier))
-                        model_cat = model_cat_map.get(model_name, '')
-                        if '차양' in str(model_cat):
-                            multiplier = 1
-
-                        per_span_qty = float(bom_item['quantity'])
-                        required_quantity = item_quantity * per_span_qty * multiplier
-
-                        if 'PIPE' in str(bom_item['category']).upper():
-                            required_quantity = self._calculate_pipe_count(
-                                required_quantity,
-                                bom_item['standard'],
-                                data
-                            )
-                            unit = 'EA'
-                        else:
-                            unit = bom_item['unit']
+        try:
+            # 견적 전체를 한 번에 전개: (항목 × BOM 행) → (자재명, 규격) 합산
+            models_df = data.get('models', pd.DataFrame())
+            span_plan = self.bom_explosion.build_span_plan(
+                quotation_data, models_df, use_item_quantity=True, catalog_index=self.catalog_index(data)
+            )
+            exploded = self.bom_explosion.explode(span_plan)
 
-                        existing_item = None
-                        for purchase_item in purchase_items:
-                            if (purchase_item['material_name'] == bom_item['material_name'] and
-                                purchase_item['standard'] == bom_item['standard']):
-                                existing_item = purchase_item
-                                break
+            missing = set(span_plan['quote_model_name']) - set(exploded.get('quote_model_name', []))
+            for model_name in missing:
+                print(f"[WARNING] BOM not found for model: {model_name}")
 
-                        if existing_item:
-                            existing_item['quantity'] += required_quantity
-                        else:
-                            purchase_items.append({
-                                'material_name': bom_item['material_name'],
-                                'standard': bom_item['standard'],
-                                'unit': unit,
-                                'quantity': required_quantity,
-                                'category': bom_item['category'],
-                                'model_reference': model_name
-                            })
-            except Exception as e:
-                # 개별 항목 처리 실패는 로그하고 계속
-                import traceback
-                print(f"[ERROR] Item processing failed for model: {item.get('model_name', 'N/A')}")
-                print(f"[ERROR] Exception: {e}")
-                print(f"[ERROR] Traceback: {traceback.format_exc()}")
-                continue
+            pipe_lengths = {
+                standard: self._get_pipe_stock_length(standard, data)
+                for standard in self.bom_explosion.pipe_standards(exploded)
+            }
+            purchase_df = self.bom_explosion.aggregate_purchase_lines(exploded, pipe_lengths)
+            purchase_items = purchase_df.to_dict('records')
+        except Exception as e:
+            import traceback
+            print(f"[ERROR] Purchase item explosion failed: {e}")
+            print(f"[ERROR] Traceback: {traceback.format_exc()}")
 
         return purchase_items
 
@@ -1147,80 +1279,54 @@ class UnifiedQuotationSystem:
 
     def _generate_material_items_with_pricing(self, quotation_data, data):
         """BOM 데이터에 단가 정보를 결합한 자재 목록 생성"""
-        import math
-
-        plan = {}
-        try:
-            plan = quotation_data.get('site_info', {}).get('model_span_plan', {}) or {}
-        except Exception:
-            plan = {}
-
-        import pandas as pd
         models_df = data.get('models', pd.DataFrame())
-        model_cat_map = {}
-        if not models_df.empty:
-            name_col = 'model_name' if 'model_name' in models_df.columns else None
-            cat_col = 'category' if 'category' in models_df.columns else None
-            if name_col and cat_col:
-                for _, r in models_df.iterrows():
-                    model_cat_map[str(r[name_col])] = str(r[cat_col])
-
-        span_width_m = _safe_float(quotation_data['site_info'].get('span_width_m'), DEFAULT_SPAN_WIDTH_M)
-        total_span_count = int(quotation_data['site_info'].get('total_span_count', 1))
-
-        material_items_by_model = {}
-
-        for item in quotation_data['items']:
-            model_name = item.get('model_name', '')
-
-            if item.get('source') == 'MANUAL':
-                continue
-
-            model_info = data['models'][data['models']['model_name'] == model_name]
-            if not model_info.empty:
-                model_id = model_info.iloc[0]['model_id']
-                model_bom = self.engine.get_bom(model_id)
-
-                if model_name not in material_items_by_model:
-                    material_items_by_model[model_name] = []
-
-                for _, bom_item in model_bom.iterrows():
-                    category = str(bom_item['category'])
-                    material_name = bom_item['material_name']
-                    bom_standard = bom_item['standard']
-
-                    per_span_qty = _safe_float(bom_item['quantity'], 0.0)
-                    unit = bom_item['unit']
-
-                    if category == 'MANUAL':
-                        unit_price = _safe_float(bom_item.get('unit_price', 0.0))
-                        actual_standard = bom_standard
-                    else:
-                        material_info = self._find_material_info_by_category(
-                            category, bom_standard, data, material_name
-                        )
-
-                        unit_price = _safe_float(material_info.get('단가', 0.0))
-                        actual_standard = material_info.get('완전규격', material_info.get('규격', bom_standard))
+        span_plan = self.bom_explosion.build_span_plan(
+            quotation_data, models_df, use_item_quantity=False, skip_manual=True,
+            catalog_index=self.catalog_index(data)
+        )
+        exploded = self.bom_explosion.explode(span_plan)
+
+        if not exploded.empty:
+            # 단가/완전규격은 (카테고리, 규격, 자재명) 조합 전체를 한 번에 매칭
+            is_manual = exploded['category'].astype(str) == 'MANUAL'
+            lookup_columns = ['category', 'standard', 'material_name']
+            lookup_keys = exploded.loc[~is_manual, lookup_columns].drop_duplicates()
+            matches = self.material_matcher(data).match(lookup_keys)
+            self._report_unmatched_materials(matches)
+
+            joined = exploded[lookup_columns].merge(
+                matches[lookup_columns + ['완전규격', '단가']], on=lookup_columns, how='left'
+            )
+            looked_up_price = pd.Series(joined['단가'].fillna(0.0).to_numpy(), index=exploded.index)
+            looked_up_spec = pd.Series(
+                joined['완전규격'].where(joined['완전규격'].notna(), exploded['standard'].to_numpy()).to_numpy(),
+                index=exploded.index,
+            )
 
-                    if '×' in actual_standard or '×' in actual_standard:
-                        actual_standard = actual_standard.split('×')[0].split('×')[0]
+            unit_price = pd.to_numeric(exploded['unit_price'].where(is_manual, looked_up_price), errors='coerce').fillna(0.0)
+            actual_standard = exploded['standard'].where(is_manual, looked_up_spec).fillna('').astype(str)
+            actual_standard = actual_standard.str.split('×').str[0]
 
-                    enhanced_standard = actual_standard
+            is_pipe = exploded['is_pipe']
+            total_pipes = np.ceil(exploded['total_quantity'] / PIPE_STANDARD_LENGTH_M).fillna(0).astype(int)
+            pipe_notes = f"파이프 소모량: {PIPE_STANDARD_LENGTH_M:.0f}m×" + total_pipes.astype(str) + "본"
 
-                    material_items_by_model[model_name].append({
-                        'material_name': material_name,
-                        'standard': enhanced_standard,
-                        'unit': unit,
-                        'quantity': per_span_qty,
-                        'category': category,
-                        'unit_price': unit_price,
-                        'model_name': model_name,
-                        'notes': ''
-                    })
+            lines = pd.DataFrame({
+                'material_name': exploded['material_name'],
+                'standard': actual_standard,
+                'unit': exploded['unit'].where(~is_pipe, 'M'),
+                'quantity': exploded['total_quantity'],
+                'category': exploded['category'],
+                'unit_price': unit_price,
+                'model_name': exploded['quote_model_name'],
+                'notes': pipe_notes.where(is_pipe, ''),
+            })
+            lines_by_model = {name: group.to_dict('records') for name, group in lines.groupby('model_name', sort=False)}
+        else:
+            lines_by_model = {}
 
         final_material_items = []
-        for model_name, model_materials in material_items_by_model.items():
+        for model_name in span_plan['quote_model_name'].drop_duplicates():
             final_material_items.append({
                 'material_name': f"=== 모델: {model_name} ===",
                 'standard': '',
@@ -1232,231 +1338,24 @@ class UnifiedQuotationSystem:
                 'notes': '',
                 'is_header': True
             })
-
-            for m in model_materials:
-                per_span_qty = _safe_float(m.get('quantity', 0.0), 0.0)
-                category_upper = str(m.get('category', '')).upper()
-                unit = m.get('unit', 'EA')
-                out_unit = unit
-                notes = str(m.get('notes', ''))
-                unit_price_safe = _safe_float(m.get('unit_price'), 0.0)
-
-                multiplier = int(quotation_data['site_info'].get('total_span_count', 1))
-                if model_name in plan:
-                    multiplier = int(plan[model_name].get('span_count', multiplier))
-                model_cat = model_cat_map.get(model_name, '')
-                if '차양' in str(model_cat):
-                    multiplier = 1
-
-                total_qty = per_span_qty * multiplier
-
-                if 'PIPE' in category_upper:
-                    import math
-                    total_length_m = total_qty
-                    total_pipes = math.ceil(total_length_m / PIPE_STANDARD_LENGTH_M)
-                    out_unit = 'M'
-                    pipe_note = f"파이프 소모량: {PIPE_STANDARD_LENGTH_M:.0f}m×{total_pipes}본"
-                    notes = f"{notes} | {pipe_note}".strip(" |")
-
-                final_material_items.append({
-                    'material_name': m['material_name'],
-                    'standard': m['standard'],
-                    'unit': out_unit,
-                    'quantity': total_qty,
-                    'category': m.get('category', ''),
-                    'unit_price': unit_price_safe,
-                    'model_name': model_name,
-                    'notes': notes
-                })
+            final_material_items.extend(lines_by_model.get(model_name, []))
 
         return final_material_items
 
-    def _find_material_info_by_category(self, category, standard, data, material_name=None):
-        """카테고리로 자재 정보 찾기"""
-        
-        if 'main_materials' in data:
-            main_materials = data['main_materials']
-            try:
-                if not isinstance(main_materials, pd.DataFrame) or main_materials.empty or '품목' not in main_materials.columns:
-                    raise ValueError("main_materials is not a valid DataFrame or missing '품목' column")
-
-                category_match = main_materials[
-                    main_materials['품목'].astype(str).str.strip() == str(category).strip()
-                ]
-
-                if not category_match.empty:
-                    bom_standard = str(standard).strip()
-                    
-                    for _, material_row in category_match.iterrows():
-                        main_spec = str(material_row['규격']).strip() if pd.notna(material_row['규격']) else ''
-                        
-                        if self._compare_specs_order_agnostic(bom_standard, main_spec):
-                            return self._create_material_result_from_main(material_row, category)
-                    
-                    st.session_state.debug_messages.append(f"🟡 [자재 매칭 주의] 카테고리 '{category}'는 찾았지만, 규격 '{standard}'와 일치하는 항목이 main_materials에 없습니다. 부자재에서 검색합니다.")
-                
-            except Exception as e:
-                st.session_state.debug_messages.append(f"main_materials 검색 오류: {e}")
-        
-        if 'sub_materials' in data:
-            sub_materials = data['sub_materials']
-            try:
-                if not isinstance(sub_materials, pd.DataFrame) or sub_materials.empty:
-                    raise ValueError("sub_materials is not a valid DataFrame or is empty")
-
-                if material_name and '품목' in sub_materials.columns:
-                    material_name_match = sub_materials[
-                        sub_materials['품목'].astype(str).str.contains(str(material_name), na=False, case=False)
-                    ]
-                    if not material_name_match.empty:
-                        material_row = material_name_match.iloc[0]
-                        return self._create_material_result_from_sub(material_row)
-
-                if '규격' in sub_materials.columns:
-                    # 표준 정규화 (x → *)
-                    normalized_search = self._normalize_special_chars(str(standard))
-                    # DB 값도 정규화하여 비교
-                    standard_match = sub_materials[
-                        sub_materials['규격'].astype(str).apply(
-                            lambda x: normalized_search in self._normalize_special_chars(x)
-                        )
-                    ]
-                    if not standard_match.empty:
-                        material_row = standard_match.iloc[0]
-                        return self._create_material_result_from_sub(material_row)
-
-            except Exception as e:
-                st.session_state.debug_messages.append(f"sub_materials 검색 오류: {e}")
-        
-        st.session_state.debug_messages.append(f"❌ [자재 찾기 실패] 카테고리: '{category}' / 규격: '{standard}' / 자재명: '{material_name}'을 main_materials와 sub_materials에서 찾을 수 없습니다.")
-        return self._create_empty_result()
-    
-    def _compare_specs_order_agnostic(self, bom_spec, main_spec):
-        """순서 무관 규격 비교"""
-        if not bom_spec or not main_spec:
-            return False
-        
-        if self._compare_complete_specs(bom_spec, main_spec):
-            return True
-        
-        return self._compare_with_reversed_dimensions(bom_spec, main_spec)
-
-    def _compare_with_reversed_dimensions(self, bom_spec, main_spec):
-        """치수 순서를 바꿔서 비교"""
-        import re
-
-        # x 또는 * 모두 매칭하도록 정규표현식 수정
-        bom_match = re.match(r'(\d+)[x*](\d+)[x*](.+)', bom_spec, re.IGNORECASE)
-        main_match = re.match(r'(\d+)[x*](\d+)[x*](.+)', main_spec, re.IGNORECASE)
-        
-        if bom_match and main_match:
-            bom_dim1, bom_dim2, bom_thickness = bom_match.groups()
-            main_dim1, main_dim2, main_thickness = main_match.groups()
-            
-            if bom_thickness.strip() == main_thickness.strip():
-                if ((bom_dim1 == main_dim2 and bom_dim2 == main_dim1) or
-                    (bom_dim1 == main_dim1 and bom_dim2 == main_dim2)):
-                    return True
-        
-        return False
+    def _report_unmatched_materials(self, matches):
+        """미매칭 자재를 리포트 한 건으로 기록 (st.session_state.material_match_report)"""
+        from utils.material_matcher import MaterialMatcher
 
-    def _compare_complete_specs(self, bom_spec, main_spec):
-        """완전한 규격 비교"""
-        if not bom_spec or not main_spec:
-            return False
-        
-        bom_clean = str(bom_spec).strip()
-        main_clean = str(main_spec).strip()
-        
-        if bom_clean == main_clean:
-            return True
-        
-        bom_normalized = self._normalize_special_chars(bom_clean)
-        main_normalized = self._normalize_special_chars(main_clean)
-        
-        return bom_normalized == main_normalized
-
-    def _normalize_special_chars(self, spec):
-        """특수문자 정규화"""
-        # x, X 를 * 로 정규화 (DB 표준 형식)
-        normalized = spec.replace('x', '*').replace('X', '*')
-        # 지름 기호 정규화
-        normalized = normalized.replace('∅', 'Ø').replace('Φ', 'Ø').replace('φ', 'Ø')
-        normalized = normalized.upper()
-        return normalized
-    
-    def _create_empty_result(self):
-        """빈칸 결과 생성"""
-        return {
-            '완전규격': '',
-            '단가': '',
-            '품목': '',
-            '규격': ''
-        }
-
-    def _create_material_result_from_main(self, material_row, category):
-        """main_Materials 결과 생성"""
-        main_spec = str(material_row['규격']).strip()
-        pipe_length = material_row.get('파이프길이(m)', 6.0)
-        unit_price = float(material_row['단가']) if pd.notna(material_row['단가']) else 0
-        
-        if any(pipe_word in category.upper() for pipe_word in ['PIPE', '파이프']):
-            unit_price = unit_price / pipe_length if pipe_length > 0 else unit_price     
-
-        if any(pipe_word in category.upper() for pipe_word in ['PIPE', '파이프']):
-            full_specification = f"{main_spec}×{pipe_length}m"
-        else:
-            full_specification = main_spec
-        
-        return {
-            '완전규격': full_specification,
-            '단가': unit_price,
-            '품목': material_row['품목'],
-            '규격': material_row['규격']
-        }
-
-    def _create_material_result_from_sub(self, material_row):
-        """sub_Materials 결과 생성"""
-        unit_price = float(material_row['단가']) if pd.notna(material_row['단가']) else 0
-        spec = str(material_row['규격']).strip()
-        
-        return {
-            '완전규격': spec,
-            '단가': unit_price,
-            '품목': material_row['품목'],
-            '규격': material_row['규격']
-        }
-    
-    def _calculate_pipe_count(self, required_length_m, pipe_standard, data):
-        """파이프 길이를 고려한 실제 발주 개수 계산"""
-        import math
+        report = MaterialMatcher.unmatched_report(matches)
+        st.session_state.material_match_report = report
+        if not report.empty:
+            st.session_state.setdefault('debug_messages', []).append(
+                f"❌ [자재 찾기 실패] {len(report)}건이 main_materials와 sub_materials에서 매칭되지 않았습니다. (아래 미매칭 자재 리포트 참고)"
+            )
 
-        main_materials = data.get('main_materials', pd.DataFrame())
-
-        if isinstance(main_materials, pd.DataFrame) and not main_materials.empty and '규격' in main_materials.columns:
-            pipe_match = main_materials[
-                main_materials['규격'].astype(str).str.contains(pipe_standard, na=False, case=False)
-            ]
-        else:
-            pipe_match = pd.DataFrame()
-        
-        if not pipe_match.empty:
-            try:
-                standard_length = 6.0
-                if '길이' in pipe_match.columns:
-                    standard_length = float(pipe_match.iloc[0]['길이'])
-                elif '단위길이' in pipe_match.columns:
-                    standard_length = float(pipe_match.iloc[0]['단위길이'])
-                elif '파이프길이(m)' in pipe_match.columns:
-                    standard_length = float(pipe_match.iloc[0]['파이프길이(m)'])
-            except:
-                standard_length = 6.0
-        else:
-            standard_length = 6.0
-        
-        required_pipes = math.ceil(required_length_m / standard_length)
-        
-        return required_pipes    
+    def _get_pipe_stock_length(self, pipe_standard, data):
+        """main_materials에서 규격에 해당하는 파이프 원자재 길이(m) 조회 (기본 6m, 카탈로그 버전별 재사용)"""
+        return self.catalog_views(data).pipe_length(pipe_standard)
 
     def _get_specification_with_length_fixed(self, material_name, standard, data):
         """규격에 파이프 길이 정보 추가"""
@@ -1475,23 +1374,8 @@ class UnifiedQuotationSystem:
             is_pipe = 'PIPE' in category
         
         if is_pipe:
-            main_materials = data['main_materials']
-            
-            pipe_match = main_materials[
-                main_materials['규격'].astype(str).str.contains(str(standard), na=False, case=False)
-            ]
-            
-            pipe_length = 6.0
-            
-            if not pipe_match.empty:
-                if '파이프길이(m)' in pipe_match.columns:
-                    try:
-                        length_value = pipe_match.iloc[0]['파이프길이(m)']
-                        if pd.notna(length_value) and length_value > 0:
-                            pipe_length = float(length_value)
-                    except:
-                        pipe_length = 6.0
-            
+            # 규격 키 → 원자재 길이 조회표 (카탈로그 버전별 재사용)
+            pipe_length = self._get_pipe_stock_length(standard, data)
             return f"{standard}×{pipe_length}m"
         
         return standard
@@ -1589,44 +1473,8 @@ class UnifiedQuotationSystem:
         return material_groups
 
     def _find_material_type(self, material_name, standard, data):
-        """자재의 재질 타입 확인"""
-        main_materials = data['main_materials']
-        
-        possible_item_columns = ['품목', 'Item', 'item_name', 'material_name', '자재명']
-        possible_spec_columns = ['규격', 'Spec', 'specification', 'standard', '사양']
-        
-        item_column = None
-        spec_column = None
-        
-        for col in possible_item_columns:
-            if col in main_materials.columns:
-                item_column = col
-                break
-        
-        for col in possible_spec_columns:
-            if col in main_materials.columns:
-                spec_column = col
-                break
-        
-        if item_column and spec_column:
-            material_match = main_materials[
-                (main_materials[item_column].str.contains(material_name, na=False)) |
-                (main_materials[spec_column].str.contains(standard, na=False))
-            ]
-            
-            if not material_match.empty:
-                material_info = material_match.iloc[0]
-                possible_material_columns = ['재질', 'Material', 'material_type', '소재']
-                
-                for mat_col in possible_material_columns:
-                    if mat_col in material_info:
-                        material_type = material_info[mat_col]
-                        if 'STS' in str(material_type).upper():
-                            return 'STS'
-                        elif '아연도' in str(material_type):
-                            return '아연도'
-        
-        return '아연도'
+        """자재의 재질 타입 확인 ((품목, 규격) → 재질 조회표, 카탈로그 버전별 재사용)"""
+        return self.catalog_views(data).material_type(material_name, standard)
 
     def _create_single_purchase_order(self, quotation_data, purchase_items, delivery_location, supplier_info):
         """단일 발주서 생성"""
@@ -1695,12 +1543,7 @@ class UnifiedQuotationSystem:
             
             plan = (quotation_data.get('site_info', {}) or {}).get('model_span_plan', {}) or {}
 
-            data = self.load_data()
-            models_df = data.get('models', pd.DataFrame())
-            model_category_map = {}
-            if not models_df.empty and 'model_name' in models_df.columns and 'category' in models_df.columns:
-                for _, r in models_df.iterrows():
-                    model_category_map[str(r['model_name'])] = str(r.get('category', ''))
+            index = self.catalog_index()
 
             non_manual_items = [item for item in quotation_data['items'] if item.get('source') != 'MANUAL']
 
@@ -1708,7 +1551,7 @@ class UnifiedQuotationSystem:
                 row = start_row + idx
 
                 model_name = item.get('model_name', '')
-                category = model_category_map.get(model_name, '')
+                category = index.category(model_name)
 
                 qty_m = float((plan.get(model_name, {}) or {}).get('total_length_m', 0) or 0)
 
@@ -1797,13 +1640,16 @@ class UnifiedQuotationSystem:
                 )
                 if search_query:
                     data = self.load_data()
-                    if 'material_search_system' not in st.session_state:
-                        st.session_state.material_search_system = EnhancedModelSearch(data['models'])
-                    search_system = st.session_state.material_search_system
+                    search_system = EnhancedModelSearch(
+                        data['models'], data.get('table_versions', {}).get('models'), self.tenant_id,
+                        self._search_narrowing('material_search_narrowing')
+                    )
                     results = search_system.search_models(search_query)
 
                     if not results.empty:
                         st.write(f"🔍 검색 결과: {len(results)}개 모델")
+                        if results.attrs.get('match_mode') == 'fuzzy':
+                            st.caption("정확히 일치하는 모델이 없어 비슷한 모델을 표시합니다.")
                         if 'display_count' not in st.session_state:
                             st.session_state.display_count = 5
                         show_n = min(st.session_state.display_count, len(results))
@@ -1872,14 +1718,22 @@ class UnifiedQuotationSystem:
                 )
                 if search_material:
                     data = self.load_data()
-                    sub_df = data['sub_materials'].copy()
+                    sub_df = data['sub_materials']
 
                     if sub_df.empty or '품목' not in sub_df.columns:
                         st.warning("부자재 데이터가 없습니다.")
                     else:
-                        mask_item = sub_df['품목'].astype(str).str.contains(search_material, case=False, na=False)
-                        mask_spec = sub_df['규격'].astype(str).str.contains(search_material, case=False, na=False) if '규격' in sub_df.columns else False
-                        search_results = sub_df[mask_item | mask_spec]
+                        # 품목/규격 부분 일치 + 초성/자모 검색 (예: 'ㅂㅌ' → 볼트), 최근 검색 결과 재사용
+                        from utils.model_search import cached_search_positions
+
+                        views = self.catalog_views(data)
+                        narrowing = self._search_narrowing('sub_material_search_narrowing')
+                        positions = cached_search_positions(
+                            self.tenant_id, 'sub_material_search', views.versions.get('sub_materials'),
+                            search_material,
+                            lambda: tuple(views.search_sub_materials(search_material, narrowing))
+                        )
+                        search_results = sub_df.iloc[list(positions)]
 
                         if not search_results.empty:
                             st.write(f"🔍 '{search_material}' 검색 결과: {len(search_results)}개")
@@ -1992,17 +1846,12 @@ class UnifiedQuotationSystem:
                 ):
                     st.session_state.debug_messages = []
 
-                    data = self.load_data()
-                    models_df = data['models'].copy()
-                    name_to_id = {}
-                    if 'model_name' in models_df.columns and 'model_id' in models_df.columns:
-                        for _, r in models_df.iterrows():
-                            name_to_id[str(r['model_name']).strip()] = r['model_id']
+                    index = self.catalog_index()
 
                     for item in st.session_state.material_items:
                         if item.get('source') == 'MANUAL':
                             mname = str(item.get('model_name', '')).strip()
-                            mid = name_to_id.get(mname)
+                            mid = index.model_id(mname)
                             if mid:
                                 material_data = {
                                     'material_name': item.get('material_name', ''),
@@ -2115,8 +1964,8 @@ class UnifiedQuotationSystem:
                         if st.button("💾 BOM 시트에 직접 반영", type="primary", key=self._ukey("apply_bom_edits", len(edits or []))):
                             ok = self._apply_bom_edits(edits)
                             if ok:
-                                _ = st.success("✅ BOM 시트에 반영 완료 (앱 캐시 갱신)")
-                                st.cache_data.clear()
+                                # 변경된 모델의 BOM 캐시는 엔진에서 무효화됨 (전체 캐시 초기화 불필요)
+                                _ = st.success("✅ BOM 시트에 반영 완료")
                             else:
                                 st.error("BOM 반영 실패. 로그를 확인하세요.")
 
@@ -2214,13 +2063,8 @@ class UnifiedQuotationSystem:
 
         try:
             data = self.load_data()
-            models_df = data['models'].copy()
-            bom_df = data['bom'].copy()
-
-            name_to_id = {}
-            if 'model_name' in models_df.columns and 'model_id' in models_df.columns:
-                for _, r in models_df.iterrows():
-                    name_to_id[str(r['model_name']).strip()] = r['model_id']
+            index = self.catalog_index(data)
+            bom_df = data['bom']  # load_data() 뷰는 copy-on-write라 수정해도 공유 카탈로그 불변
 
             required_cols = ['model_id','material_name','standard','unit','quantity','category','notes']
             for c in required_cols:
@@ -2229,7 +2073,7 @@ class UnifiedQuotationSystem:
 
             for row in edits:
                 mname = str(row.get("model_name","")).strip()
-                mid = name_to_id.get(mname, None)
+                mid = index.model_id(mname)
                 if not mid:
                     st.warning(f"모델명 매핑 실패: '{mname}' (해당 행은 건너뜀)")
                     continue
@@ -2274,7 +2118,7 @@ class UnifiedQuotationSystem:
                 edited_model_ids = set()
                 for row in edits:
                     mname = str(row.get("model_name","")).strip()
-                    mid = name_to_id.get(mname, None)
+                    mid = index.model_id(mname)
                     if mid:
                         edited_model_ids.add(mid)
 
@@ -2298,7 +2142,7 @@ class UnifiedQuotationSystem:
 
                 for row in edits:
                     mname = str(row.get("model_name","")).strip()
-                    mid = name_to_id.get(mname, None)
+                    mid = index.model_id(mname)
                     if not mid:
                         continue
 
@@ -2769,14 +2613,16 @@ class UnifiedQuotationSystem:
 
         if search_query:
             data = self.load_data()
-            if 'quote_search_system' not in st.session_state:
-                st.session_state.quote_search_system = EnhancedModelSearch(data['models'])
-
-            search_system = st.session_state.quote_search_system
+            search_system = EnhancedModelSearch(
+                data['models'], data.get('table_versions', {}).get('models'), self.tenant_id,
+                self._search_narrowing('quote_search_narrowing')
+            )
             results = search_system.search_models(search_query)
 
             if not results.empty:
                 st.write(f"🔍 **검색 결과: {len(results)}개 모델**")
+                if results.attrs.get('match_mode') == 'fuzzy':
+                    st.caption("정확히 일치하는 모델이 없어 비슷한 모델을 표시합니다.")
 
                 if 'quote_display_count' not in st.session_state:
                     st.session_state.quote_display_count = 5
@@ -3063,203 +2909,48 @@ class UnifiedQuotationSystem:
 
 # 기존 검색 시스템 클래스들 유지
 class EnhancedModelSearch:
-    """고급 모델 검색 시스템"""
+    """고급 모델 검색 시스템 (카탈로그 버전별 역색인 사용)"""
     
-    def __init__(self, models_df):
+    def __init__(self, models_df, version=None, tenant_id=None, narrowing=None):
+        """
+        Args:
+            models_df: load_data()['models']
+            version: models 테이블 버전 (data['table_versions']['models'], None이면 계산)
+            tenant_id: 지정하면 테넌트별 최근 검색 결과 LRU 사용
+            narrowing: 검색창별 타이핑 범위 축소 상태 (QueryNarrowing)
+        """
+        from utils.model_search import SEARCH_COLUMNS, get_model_search_index
+
         self.models_df = models_df
-        self.search_columns = ['model_name', 'category', 'model_standard', '식별번호', 'description']
+        self.search_columns = list(SEARCH_COLUMNS)
+        self.index = get_model_search_index(models_df, version)
+        self.tenant_id = tenant_id
+        self.narrowing = narrowing
 
     def _ukey(self, scope, *parts):
         import re
         norm = [re.sub(r'[^0-9A-Za-z]+', '_', str(p)) for p in parts if p is not None]
         return "v091_search_" + scope + "_" + "_".join(norm)
     
-    def search_models(self, query, max_results=50):
-        """통합 검색 함수"""
-        if not query or not query.strip():
-            return self.models_df.head(20)
-        
-        query = query.strip()
-        search_results = []
-        
-        if query.isdigit():
-            results = self._search_by_identifier(query)
-            search_results.extend(results)
-        
-        dimension_results = self._search_by_dimensions(query)
-        search_results.extend(dimension_results)
-        
-        for column in self.search_columns:
-            if column in self.models_df.columns:
-                column_results = self._search_in_column(query, column)
-                search_results.extend(column_results)
-        
-        unique_results = self._remove_duplicates_and_score(search_results, query)
-        
-        sorted_results = sorted(unique_results, key=lambda x: x['relevance_score'], reverse=True)
-        
-        if sorted_results:
-            result_df = pd.DataFrame([item['model'] for item in sorted_results[:max_results]])
-            return result_df
-        else:
-            return pd.DataFrame()
-    
-    def _search_by_identifier(self, query):
-        """식별번호 검색"""
-        results = []
-        
-        if '식별번호' in self.models_df.columns:
-            mask = self.models_df['식별번호'].astype(str).str.contains(query, case=False, na=False)
-            matched = self.models_df[mask]
-            
-            for _, row in matched.iterrows():
-                results.append({
-                    'model': row.to_dict(),
-                    'match_type': 'identifier',
-                    'match_column': '식별번호',
-                    'match_value': str(row['식별번호'])
-                })
-        
-        return results
-    
-    def _search_by_dimensions(self, query):
-        """치수 기반 검색"""
-        results = []
-
-        patterns = [
-            r'w(\d+)', r'width(\d+)', r'폭(\d+)',
-            r'h(\d+)', r'height(\d+)', r'높이(\d+)',
-            r'(\d+)w', r'(\d+)h'
-        ]
-
-        # 쿼리 정규화: x 를 * 로 변환
-        normalized_query = self._normalize_search_string(query)
-        query_lower = normalized_query.lower()
-        extracted_numbers = []
-
-        for pattern in patterns:
-            matches = re.findall(pattern, query_lower)
-            extracted_numbers.extend(matches)
-
-        if query.isdigit() and int(query) >= 1000:
-            extracted_numbers.append(query)
-
-        if extracted_numbers and 'model_standard' in self.models_df.columns:
-            for number in extracted_numbers:
-                # DB 값도 정규화하여 비교 (* 로 통일)
-                mask = self.models_df['model_standard'].astype(str).apply(
-                    lambda x: number in self._normalize_search_string(x)
-                )
-                matched = self.models_df[mask]
-
-                for _, row in matched.iterrows():
-                    results.append({
-                        'model': row.to_dict(),
-                        'match_type': 'dimension',
-                        'match_column': 'model_standard',
-                        'match_value': row['model_standard']
-                    })
-
-        return results
-    
-    def _normalize_search_string(self, s: str) -> str:
-        """검색 문자열 정규화: x 와 * 를 모두 * 로 통일"""
-        if not isinstance(s, str):
-            return str(s)
-        # x, X 를 * 로 변환 (DB 표준 형식에 맞춤)
-        return s.replace('x', '*').replace('X', '*').lower()
+    def search_models(self, query, max_results=50, fuzzy=True):
+        """
+        통합 검색 함수 (식별번호 / 치수 / 컬럼 부분 일치, 관련도 상위 max_results개)
 
-    def _search_in_column(self, query, column):
-        """특정 컬럼에서 부분 검색 (정규화된 문자열 비교)"""
-        results = []
-
-        try:
-            # 검색 쿼리 정규화
-            normalized_query = self._normalize_search_string(query)
-
-            # DB 값도 정규화하여 비교
-            mask = self.models_df[column].astype(str).apply(
-                lambda x: normalized_query in self._normalize_search_string(x)
-            )
-            matched = self.models_df[mask]
-
-            for _, row in matched.iterrows():
-                results.append({
-                    'model': row.to_dict(),
-                    'match_type': 'partial',
-                    'match_column': column,
-                    'match_value': str(row[column])
-                })
-        except Exception:
-            pass
-
-        return results
-    
-    def _remove_duplicates_and_score(self, search_results, query):
-        """중복 제거 및 관련도 점수 계산"""
-        unique_models = {}
-        
-        for result in search_results:
-            model = result['model']
-            model_id = model.get('model_id', '') or model.get('model_name', '')
-            
-            if model_id not in unique_models:
-                relevance_score = self._calculate_relevance_score(result, query)
-                
-                unique_models[model_id] = {
-                    'model': model,
-                    'relevance_score': relevance_score,
-                    'match_info': [result]
-                }
-            else:
-                unique_models[model_id]['match_info'].append(result)
-                new_score = self._calculate_relevance_score(result, query)
-                if new_score > unique_models[model_id]['relevance_score']:
-                    unique_models[model_id]['relevance_score'] = new_score
-        
-        return list(unique_models.values())
-    
-    def _calculate_relevance_score(self, result, query):
-        """관련도 점수 계산"""
-        score = 0
-        query_lower = query.lower()
-        
-        type_scores = {
-            'identifier': 100,
-            'dimension': 80,
-            'partial': 50
-        }
-        
-        score += type_scores.get(result['match_type'], 0)
-        
-        column_weights = {
-            'model_name': 30,
-            'category': 20,
-            'model_standard': 25,
-            '식별번호': 35,
-            'description': 10
-        }
-        
-        score += column_weights.get(result['match_column'], 0)
-        
-        match_value = str(result['match_value']).lower()
-        similarity = SequenceMatcher(None, query_lower, match_value).ratio()
-        score += similarity * 50
-        
-        if query_lower in match_value or match_value in query_lower:
-            score += 20
-        
-        return score
+        fuzzy=True면 일치 결과가 없을 때 오타를 허용한 유사 검색 결과를 반환
+        (results.attrs['match_mode'] == 'fuzzy')
+        """
+        return self.index.search(query, max_results, fuzzy=fuzzy, narrowing=self.narrowing, tenant=self.tenant_id)
 
 
 # 검색 인터페이스 함수들
 def create_enhanced_search_interface(models_df, quotation_system, bom_df):
     """고급 검색 인터페이스"""
     
-    if 'unified_search_system' not in st.session_state:
-        st.session_state.unified_search_system = EnhancedModelSearch(models_df)
-    
-    search_system = st.session_state.unified_search_system
+    # 검색 인덱스는 models 버전별로 공유되므로 매번 만들어도 재구축되지 않음
+    search_system = EnhancedModelSearch(
+        models_df, tenant_id=getattr(quotation_system, 'tenant_id', None),
+        narrowing=quotation_system._search_narrowing('unified_search_narrowing')
+    )
     
     col1, col2 = st.columns([3, 1])
     
@@ -3267,7 +2958,7 @@ def create_enhanced_search_interface(models_df, quotation_system, bom_df):
         search_query = st.text_input(
             "통합 모델 검색",
             placeholder="모델명, 카테고리, 치수(W2000, H1200), 식별번호 등 입력",
-            help="예: '디자인형', 'DAL', '2000', '24614649', 'W2000×H1200'",
+            help="예: '디자인형', 'DAL', '2000', '24614649', 'W2000×H1200', 'W1800-2200', 'W~2000'",
             key="unified_search"
         )
     
@@ -3280,7 +2971,10 @@ def create_enhanced_search_interface(models_df, quotation_system, bom_df):
                 search_results = search_system.search_models(search_query)
                 
                 if not search_results.empty:
-                    st.success(f"검색 결과: {len(search_results)}개 모델 발견")
+                    if search_results.attrs.get('match_mode') == 'fuzzy':
+                        st.info(f"정확히 일치하는 모델이 없어 비슷한 모델 {len(search_results)}개를 표시합니다.")
+                    else:
+                        st.success(f"검색 결과: {len(search_results)}개 모델 발견")
                     display_unified_search_results(search_results, search_query, quotation_system, bom_df)
                 else:
                     st.warning("검색 결과가 없습니다. 다른 키워드로 시도해보세요.")
@@ -3348,7 +3042,9 @@ def show_unified_search_tips():
     **검색 방법:**
     - **모델명**: `DAL`, `DHART`, `DHWS`, `DST` 등
     - **카테고리**: `디자인형` 입력시 디자인형울타리 전체 검색
-    - **치수**: `2000`, `1200`, `W2000`, `H1500` 등
+    - **치수**: `2000`, `1200`, `W2000`, `H1500` 등 (숫자만 입력하면 폭 또는 높이 일치)
+    - **치수 범위**: `W1800-2200`, `H900~1500` (양끝 포함)
+    - **근접 치수**: `W~2000` (가장 가까운 폭의 모델)
     - **식별번호**: `24614649`, `25320309` 등 8자리 숫자
     - **복합 검색**: `DAL 2000` (DAL 시리즈 중 2000 폭)
     """)
@@ -3696,12 +3392,41 @@ def save_generated_document_to_archive(
         return False, f"문서 저장 중 오류: {str(e)}\n{error_details}"
 
 
+_warm_systems = {}  # 워밍 스레드 전용 {테넌트: UnifiedQuotationSystem} (주기 갱신마다 클라이언트를 새로 만들지 않음)
+
+
+def _warm_tenant_catalog(tenant_id, refresh=False):
+    """CatalogWarmer 작업 - 테넌트 카탈로그 로드/색인 (백그라운드 스레드)"""
+    qs = _warm_systems.get(tenant_id)
+    if qs is None:
+        qs = UnifiedQuotationSystem(tenant_id, background=True)
+        _warm_systems[tenant_id] = qs
+    return qs.warm_catalog(refresh)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_catalog_warmer():
+    """프로세스당 하나의 카탈로그 워밍 스레드 (PTOP_WARMUP_TENANTS가 비어 있으면 None)"""
+    from utils.catalog_warmup import CatalogWarmer, warmup_interval, warmup_tenants
+
+    tenants = warmup_tenants()
+    if not tenants:
+        return None
+    return CatalogWarmer(tenants, _warm_tenant_catalog, warmup_interval()).start()
+
+
 # 메인 애플리케이션
 def main(mode="pilot"):
     # Initialize session state for debug messages
     if 'debug_messages' not in st.session_state:
         st.session_state.debug_messages = []
 
+    # 카탈로그 백그라운드 워밍 (프로세스당 한 번 시작)
+    try:
+        _get_catalog_warmer()
+    except Exception as e:
+        print(f"❌ 카탈로그 워밍 시작 오류: {e}")
+
     # 테넌트 ID 가져오기
     tenant_id = get_tenant_from_params()
     
@@ -3740,8 +3465,13 @@ def main(mode="pilot"):
         with st.expander("메시지 보기", expanded=True):
             for msg in st.session_state.debug_messages:
                 st.warning(msg)
+            report = st.session_state.get('material_match_report')
+            if report is not None and not report.empty:
+                st.markdown("**미매칭 자재 리포트**")
+                st.dataframe(report, use_container_width=True, hide_index=True)
             if st.button("디버그 메시지 지우기"):
                 st.session_state.debug_messages = []
+                st.session_state.material_match_report = None
                 st.rerun()
     
     # 시스템 초기화
@@ -3761,18 +3491,24 @@ def main(mode="pilot"):
         st.metric("모델 수", len(data['models']))
         st.metric("단가 정보", len(data['pricing']))
         st.metric("BOM 항목", len(data['bom']))
+        if data.get('memory_report'):
+            from utils.catalog_compaction import memory_report_frame
+            with st.expander("카탈로그 메모리 (압축 전/후)"):
+                st.dataframe(memory_report_frame(data['memory_report']), use_container_width=True, hide_index=True)
+        from utils.shared_catalog import get_catalog_registry
+        flights = {**get_catalog_registry().flight_stats(qs.tenant_id), **qs.engine.flight_stats()}
+        if any(stats['shared'] for stats in flights.values()):
+            with st.expander("동시 조회 병합 (키별 대기 시간)"):
+                flight_df = pd.DataFrame.from_dict(flights, orient='index')
+                st.dataframe(flight_df[flight_df['shared'] > 0][['calls', 'runs', 'shared', 'avg_wait_sec', 'max_wait_sec']],
+                             use_container_width=True)
         
         st.header("🏢 회사 정보")
         st.info(f'**회사명**\n{tenant_info["display_name"]}\n금속구조물\n제작 설치 전문업체')
        
         if len(data['models']) > 0:
-            model_prefixes = {}
-            for _, model in data['models'].iterrows():
-                prefix = model['model_name'].split('-')[0][:4]
-                model_prefixes[prefix] = model_prefixes.get(prefix, 0) + 1
-            
             st.header("🗂️ 모델 시리즈")
-            top_series = sorted(model_prefixes.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_series = qs.catalog_views(data).series_prefix_counts(top_n=5)
             for prefix, count in top_series:
                 st.write(f"• {prefix}***: {count}개")
     
@@ -3830,7 +3566,7 @@ def main(mode="pilot"):
                     
                 return spec
             
-            inventory_display = data['inventory'].copy()
+            inventory_display = data['inventory']
             inventory_display['완전규격'] = inventory_display.apply(create_full_specification, axis=1)
 
             display_columns = ['item_id', '재질', '완전규격', '잔여재고', '단위', '단가']
@@ -3898,9 +3634,8 @@ def main(mode="pilot"):
                 )
                 
                 if selected_model_for_bom:
-                    model_info_df = data['models'][data['models']['model_name'] == selected_model_for_bom]
-                    if not model_info_df.empty:
-                        model_info = model_info_df.iloc[0]
+                    model_info = qs.catalog_index(data).model(selected_model_for_bom)
+                    if model_info is not None:
                         model_bom = qs.engine.get_bom(model_info['model_id'])
                         
                         if not model_bom.empty:
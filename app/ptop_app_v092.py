@@ -164,7 +164,7 @@ def _render_bom_editor(qs: UnifiedQuotationSystem, data: dict, tenant_id: str):
         return
     try:
         with st.spinner("모델 검색 중..."):
-            models = qs.engine.search_models(str(keyword).strip())
+            models = qs.engine.search_models(str(keyword).strip(), profile='editor')
             if not isinstance(models, pd.DataFrame):
                 models = pd.DataFrame()
     except Exception as e:
@@ -191,7 +191,7 @@ def _render_bom_editor(qs: UnifiedQuotationSystem, data: dict, tenant_id: str):
     try:
         with st.spinner("BOM 불러오는 중..."):
             q = qs.engine.db.schema('ptop').table('bom')\
-                .select('material_name,standard,quantity,unit,category,created_at,updated_at')\
+                .select(qs.engine.profile_columns('bom', 'editor'))\
                 .eq('tenant_id', tenant_id)\
                 .eq('model_id', model_id)\
                 .order('created_at', desc=False)\
@@ -276,23 +276,25 @@ def _render_bom_editor(qs: UnifiedQuotationSystem, data: dict, tenant_id: str):
             added_session_key = f"bom_added_keys_{model_id}"
             session_added = set(st.session_state.get(added_session_key, []))
 
-            # 1) 삭제 처리: MANUAL 분류 전체 삭제 허용(안전 정책)
+            # 1) 삭제 처리: MANUAL 분류 전체 삭제 허용(안전 정책) - 일괄 삭제
             refused_deletes = []
+            manual_deletes = []
             for k in deleted:
                 orig_cat = (aux_map.get(k, {}) or {}).get('category')
                 if str(orig_cat).upper() == 'MANUAL':
-                    qs.engine.delete_bom_item(model_id=model_id, material_name=k[0], standard=k[1])
+                    manual_deletes.append(k)
                 else:
                     refused_deletes.append(k)
+            failed_rows = []
+            if manual_deletes:
+                outcomes = qs.engine.delete_bom_items(model_id, manual_deletes)
+                failed_rows += [o for o in outcomes if o['status'] == 'failed']
 
             # 2) 추가 처리: 새로 추가된 행 insert
             upsert_rows = []
             for k in added:
                 row = edited[(edited['자재명'].astype(str).str.strip() == k[0]) & (edited['규격'].astype(str).str.strip() == k[1])].iloc[0]
                 upsert_rows.append({
-                    'tenant_id': tenant_id,
-                    'model_id': model_id,
-                    'model_name': sel_name,
                     'material_name': k[0],
                     'standard': k[1],
                     'quantity': float(row.get('수량') or 0),
@@ -315,9 +317,6 @@ def _render_bom_editor(qs: UnifiedQuotationSystem, data: dict, tenant_id: str):
                 if changed:
                     new_key = (str(row_n.get('자재명')).strip(), str(row_n.get('규격')).strip())
                     upsert_rows.append({
-                        'tenant_id': tenant_id,
-                        'model_id': model_id,
-                        'model_name': sel_name,
                         'material_name': new_key[0],
                         'standard': new_key[1],
                         'quantity': float(row_n.get('수량') or 0),
@@ -329,29 +328,19 @@ def _render_bom_editor(qs: UnifiedQuotationSystem, data: dict, tenant_id: str):
                     })
                     session_added.add(new_key)
 
-            # 배치 업서트 실행
+            # 배치 업서트 실행 (청크당 요청 1회, 실패 청크는 insert로 재시도, 행별 결과 반환)
             if upsert_rows:
-                try:
-                    qs.engine.db.schema('ptop').table('bom').upsert(upsert_rows, on_conflict='tenant_id,model_id,material_name,standard').execute()
-                except Exception:
-                    # 폴백: 개별 추가
-                    for r in upsert_rows:
-                        qs.engine.add_bom_item(model_id=r['model_id'], material_data={
-                            'material_name': r['material_name'],
-                            'standard': r['standard'],
-                            'quantity': r['quantity'],
-                            'unit': r['unit'],
-                            'category': r['category'],
-                            'material_type': r.get('material_type','SUB'),
-                            'notes': r.get('notes',''),
-                            'unit_price': r.get('unit_price',0),
-                        })
+                outcomes = qs.engine.upsert_bom_items(model_id, upsert_rows)
+                failed_rows += [o for o in outcomes if o['status'] == 'failed']
 
             # 세션 저장
             st.session_state[added_session_key] = list(session_added)
 
             if refused_deletes:
                 st.warning(f"삭제 불가 항목이 복원됩니다(관리자만 삭제 가능): {len(refused_deletes)}건")
+            if failed_rows:
+                st.warning("저장 실패 항목: " + ", ".join(f"{o['material_name']} ({o['standard']})" for o in failed_rows[:10])
+                           + (f" 외 {len(failed_rows) - 10}건" if len(failed_rows) > 10 else ""))
             st.success("변경사항을 반영했습니다.")
             st.rerun()
         except Exception as e:
@@ -390,35 +379,20 @@ def _render_bom_editor(qs: UnifiedQuotationSystem, data: dict, tenant_id: str):
             }
             ok1 = qs.engine.add_bom_item(model_id=model_id, material_data=payload)
 
-            # 2) sub_materials에도 저장(재사용 가능하도록)
-            try:
-                # Prefer UPSERT to avoid duplicates on (tenant_id, product_name, standard)
-                qs.engine.db.schema('ptop').table('sub_materials').upsert({
-                    'tenant_id': tenant_id,
-                    'product_name': mat_name,
-                    'standard': standard,
-                    'unit': unit,
-                    'unit_price': unit_price,
-                    'notes': notes,
-                    'supplier': supplier or None,
-                }, on_conflict='tenant_id,product_name,standard').execute()
-                ok2 = True
-            except Exception as e:
-                # Fallback to insert if upsert not supported
-                try:
-                    qs.engine.db.schema('ptop').table('sub_materials').insert({
-                        'tenant_id': tenant_id,
-                        'product_name': mat_name,
-                        'standard': standard,
-                        'unit': unit,
-                        'unit_price': unit_price,
-                        'notes': notes,
-                        'supplier': supplier or None,
-                    }).execute()
-                    ok2 = True
-                except Exception as e2:
-                    ok2 = False
-                    st.warning(f"sub_materials 저장 실패: {e2}")
+            # 2) sub_materials에도 저장(재사용 가능하도록, 부자재 캐시만 무효화)
+            ok2 = qs.engine.upsert_sub_material({
+                'product_name': mat_name,
+                'standard': standard,
+                'unit': unit,
+                'unit_price': unit_price,
+                'notes': notes,
+                'supplier': supplier or None,
+            })
+            if not ok2:
+                st.warning("sub_materials 저장 실패")
+            else:
+                # 공유 카탈로그는 부자재 테이블만 다시 읽어 새 버전으로 교체
+                qs.refresh_catalog(['sub_materials'])
 
             if ok1:
                 st.success("BOM에 추가되었습니다.")
@@ -823,8 +797,13 @@ def main(mode: str = "pilot"):
         with st.expander("메시지 보기", expanded=True):
             for msg in st.session_state.debug_messages:
                 st.warning(msg)
+            report = st.session_state.get('material_match_report')
+            if report is not None and not report.empty:
+                st.markdown("**미매칭 자재 리포트**")
+                st.dataframe(report, use_container_width=True, hide_index=True)
             if st.button("지우기"):
                 st.session_state.debug_messages = []
+                st.session_state.material_match_report = None
                 st.rerun()
 
     qs = _ensure_qs(tenant_id)
@@ -0,0 +1,117 @@
+"""EngineCache - 무효화 세대와 동시 조회 병합"""
+
+import threading
+import time
+
+from utils.engine_cache import EngineCache
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class BlockingLoader:
+    """release될 때까지 멈추는 loader (호출 횟수 기록)"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.entered.set()
+        assert self.release.wait(5)
+        return self.value
+
+
+def _in_thread(fn):
+    thread = threading.Thread(target=fn)
+    thread.start()
+    return thread
+
+
+def test_invalidating_other_tenant_keeps_in_flight_load_cached():
+    cache = EngineCache()
+    loader = BlockingLoader(['b-row'])
+    leader = _in_thread(lambda: cache.get_or_load('b', 'models', 'all', loader))
+    assert loader.entered.wait(5)
+
+    cache.invalidate('a')
+    cache.invalidate('a', 'models')
+    waiter = _in_thread(lambda: cache.get_or_load('b', 'models', 'all', loader))
+    _wait_until(lambda: cache._flights.in_flight() == 1 and
+                cache._flights._flights[('b', 'models', 'all', cache._scope_generation('b', 'models'))].waiters == 1)
+    loader.release.set()
+    leader.join(5)
+    waiter.join(5)
+
+    assert loader.calls == 1
+    assert cache.get('b', 'models', 'all') == (True, ['b-row'])
+    assert cache.flight_stats('b')['b/models/all']['shared'] == 1
+
+
+def test_invalidating_same_table_during_load_skips_caching():
+    cache = EngineCache()
+    loader = BlockingLoader(['old'])
+    leader = _in_thread(lambda: cache.get_or_load('a', 'bom', 'M1', loader))
+    assert loader.entered.wait(5)
+
+    cache.invalidate('a', 'bom', 'M1')
+    loader.release.set()
+    leader.join(5)
+
+    assert cache.get('a', 'bom', 'M1') == (False, None)
+
+
+def test_invalidating_tenant_during_load_skips_caching():
+    cache = EngineCache()
+    loader = BlockingLoader(['old'])
+    leader = _in_thread(lambda: cache.get_or_load('a', 'pricing', 'all', loader))
+    assert loader.entered.wait(5)
+
+    cache.invalidate('a')
+    loader.release.set()
+    leader.join(5)
+
+    assert cache.get('a', 'pricing', 'all') == (False, None)
+    cache.set('a', 'other', 'k', 1)
+    assert cache.get('a', 'other', 'k') == (True, 1)
+
+
+def test_coalesce_splits_only_invalidated_scope():
+    cache = EngineCache()
+    before_a = cache._scope_generation('a', 'catalog_sync')
+    before_b = cache._scope_generation('b', 'catalog_sync')
+    before_models = cache._scope_generation('a', 'models')
+    cache.invalidate('a', 'catalog_sync', 'models')
+    assert cache._scope_generation('a', 'catalog_sync') != before_a
+    assert cache._scope_generation('b', 'catalog_sync') == before_b
+    assert cache._scope_generation('a', 'models') == before_models
+
+    cache.clear()
+    assert cache._scope_generation('b', 'catalog_sync') != before_b
+
+
+def test_pinned_entries_survive_lru_and_drop_on_invalidate():
+    cache = EngineCache(max_entries=2)
+    cache.pin('a', 'catalog_sync', 'models', {'watermark': 'w1'})
+    for i in range(10):
+        cache.set('a', 'bom', str(i), i)
+    assert cache.get_pinned('a', 'catalog_sync', 'models') == (True, {'watermark': 'w1'})
+
+    cache.invalidate('a', 'catalog_sync', 'models')
+    assert cache.get_pinned('a', 'catalog_sync', 'models') == (False, None)
+
+
+def test_pin_skips_state_read_before_invalidate():
+    cache = EngineCache()
+    generation = cache.generation('a', 'catalog_sync')
+    cache.invalidate('a', 'catalog_sync', 'sub_materials')  # 조회 중에 쓰기 경로가 초기화
+    assert not cache.pin('a', 'catalog_sync', 'sub_materials', {'watermark': 'old'}, generation)
+    assert cache.get_pinned('a', 'catalog_sync', 'sub_materials') == (False, None)
@@ -0,0 +1,111 @@
+"""SharedCatalog / CatalogRegistry - 무효화, fork, 백그라운드 갱신"""
+
+import threading
+
+import pandas as pd
+
+from utils.shared_catalog import CatalogLoad, CatalogRegistry, SharedCatalog
+
+
+def _tables(**overrides):
+    tables = {
+        'models': pd.DataFrame({'model_id': ['M1', 'M2'], 'model_name': ['DAL01', 'DAL02']}),
+        'sub_materials': pd.DataFrame({'품목': ['볼트'], '규격': ['M12']}),
+        'pricing': pd.DataFrame({'모델명': ['DAL01'], '단가': [1000]}),
+    }
+    tables.update(overrides)
+    return tables
+
+
+class Loader:
+    """load_tables 대역 - 호출 기록, block이 설정되면 release될 때까지 멈춤"""
+
+    def __init__(self):
+        self.calls = []
+        self.contents = _tables()
+        self.block = None
+        self.entered = threading.Event()
+
+    def __call__(self, tables):
+        self.calls.append(tables)
+        self.entered.set()
+        if self.block is not None:
+            assert self.block.wait(5)
+        names = tables if tables is not None else list(self.contents)
+        return CatalogLoad({name: self.contents[name] for name in names}, {}, {}, {})
+
+
+def _in_thread(fn):
+    result = {}
+
+    def run():
+        result['value'] = fn()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, result
+
+
+def test_invalidate_during_load_keeps_table_stale():
+    registry = CatalogRegistry()
+    loader = Loader()
+    registry.get_or_load('t', loader)
+    registry.invalidate('t', ['pricing'])
+
+    loader.block = threading.Event()
+    thread, _ = _in_thread(lambda: registry.get_or_load('t', loader))
+    assert loader.entered.wait(5)
+    loader.entered.clear()
+    registry.invalidate('t', ['sub_materials'])  # 로드 중에 들어온 쓰기
+    loader.block.set()
+    thread.join(5)
+
+    assert loader.calls[1] == ['pricing']
+    assert registry.stats()['t']['stale']
+    loader.block = None
+    registry.get_or_load('t', loader)
+    assert 'sub_materials' in loader.calls[2]
+    assert not registry.stats()['t']['stale']
+
+
+def test_fork_keeps_derived_only_for_unchanged_tables():
+    catalog = SharedCatalog('t', _tables())
+    models_index = catalog.derived('models_index', object, tables=('models', 'pricing'))
+    sub_index = catalog.derived('sub_index', object, tables=('sub_materials',))
+    untracked = catalog.derived('untracked', object)
+
+    forked = catalog.fork({'sub_materials': pd.DataFrame({'품목': ['너트'], '규격': ['M12']})})
+
+    assert forked.version != catalog.version
+    assert forked.tables['models'] is catalog.tables['models']
+    assert forked.derived('models_index', object) is models_index
+    assert forked.derived('sub_index', object) is not sub_index
+    assert forked.derived('untracked', object) is not untracked
+
+
+def test_fork_with_same_content_keeps_version():
+    catalog = SharedCatalog('t', _tables())
+    forked = catalog.fork({'sub_materials': _tables()['sub_materials'].copy()})
+    assert forked.version == catalog.version
+
+
+def test_refresh_does_not_block_get_or_load():
+    registry = CatalogRegistry()
+    loader = Loader()
+    first = registry.get_or_load('t', loader)
+
+    loader.block = threading.Event()
+    loader.contents = _tables(pricing=pd.DataFrame({'모델명': ['DAL01'], '단가': [2000]}))
+    refresh, refreshed = _in_thread(lambda: registry.refresh('t', loader))
+    assert loader.entered.wait(5)
+
+    reader, read = _in_thread(lambda: registry.get_or_load('t', loader))
+    reader.join(5)
+    assert not reader.is_alive()
+    assert read['value'] is first
+
+    loader.block.set()
+    refresh.join(5)
+    assert refreshed['value'].version != first.version
+    assert registry.get_or_load('t', loader) is refreshed['value']
+    assert registry.get('t', first.version) is first  # 이전 버전을 들고 있는 세션용
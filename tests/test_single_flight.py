@@ -0,0 +1,95 @@
+"""SingleFlight - 같은 키 동시 호출 병합"""
+
+import threading
+import time
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def _start_calls(flights, key, fn, waiters):
+    """leader 실행이 fn 안에서 멈춘 동안 waiters개 호출을 붙임 → (스레드 목록, 결과/예외 목록)"""
+    results = []
+    lock = threading.Lock()
+
+    def call():
+        try:
+            value = flights.do(key, fn)
+        except Exception as e:
+            value = e
+        with lock:
+            results.append(value)
+
+    threads = [threading.Thread(target=call) for _ in range(waiters + 1)]
+    threads[0].start()
+    _wait_until(lambda: flights.in_flight() == 1)
+    for thread in threads[1:]:
+        thread.start()
+
+    def attached():
+        with flights._lock:
+            return flights._flights[key].waiters == waiters
+    _wait_until(attached)
+    return threads, results
+
+
+def test_waiters_receive_leader_result():
+    flights = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def load():
+        runs.append(1)
+        release.wait(5)
+        return {'rows': [1, 2, 3]}
+
+    threads, results = _start_calls(flights, 'k', load, waiters=4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(runs) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    stats = flights.stats()['k']
+    assert (stats['runs'], stats['shared'], stats['max_waiters']) == (1, 4, 4)
+
+
+def test_waiters_receive_leader_exception():
+    flights = SingleFlight()
+    release = threading.Event()
+    error = RuntimeError("load failed")
+
+    def load():
+        release.wait(5)
+        raise error
+
+    threads, results = _start_calls(flights, 'k', load, waiters=3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 4
+    assert all(result is error for result in results)
+    assert flights.stats()['k']['errors'] == 4
+    assert flights.in_flight() == 0
+
+
+def test_failed_result_is_not_kept():
+    flights = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flights.do('k', fail)
+    assert flights.do('k', lambda: 42) == 42
@@ -0,0 +1,210 @@
+"""
+BomExplosionEngine - 견적 전체 BOM 전개 엔진
+견적 항목 × BOM 행 × 경간 배수를 한 번에 계산
+
+PtopEngine.calculate_bom_for_spans() 위에서 동작:
+- 견적 항목 → 경간 계획(span plan) DataFrame 변환
+- BOM 일괄 조회 + 한 번의 merge로 전개
+- 발주 항목은 (자재명, 규격) 기준 groupby 한 번으로 합산
+"""
+
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from utils.ptop_engine import PtopEngine
+
+
+class BomExplosionEngine:
+    """
+    견적 단위 BOM 전개 엔진
+
+    Usage:
+        explosion = BomExplosionEngine(engine)
+
+        plan = explosion.build_span_plan(quotation_data, models_df)
+        exploded = explosion.explode(plan)
+        purchase_df = explosion.aggregate_purchase_lines(exploded, pipe_lengths)
+    """
+
+    # 차양 카테고리는 경간 배수를 적용하지 않음 (세트 단위 1 고정)
+    FIXED_SPAN_CATEGORY_KEYWORD = '차양'
+
+    # span plan 컬럼 (BOM 컬럼명과 겹치지 않도록 접두어 사용)
+    PLAN_COLUMNS = ['line_no', 'quote_model_name', 'model_id', 'item_quantity', 'span_multiplier', 'span_count']
+
+    def __init__(self, engine: PtopEngine):
+        """
+        BomExplosionEngine 초기화
+
+        Args:
+            engine: PtopEngine 인스턴스 (테넌트 귀속)
+        """
+        self.engine = engine
+
+    # ========================================================================
+    # 경간 계획
+    # ========================================================================
+
+    def build_span_plan(self, quotation_data: Dict, models_df: pd.DataFrame,
+                        use_item_quantity: bool = True, skip_manual: bool = False,
+                        catalog_index=None) -> pd.DataFrame:
+        """
+        견적 항목을 경간 계획 DataFrame으로 변환
+
+        경간 배수 규칙:
+        - 기본: site_info.total_span_count
+        - site_info.model_span_plan에 모델이 있으면 해당 span_count
+        - 모델 카테고리에 '차양'이 포함되면 1
+
+        Args:
+            quotation_data: 견적 데이터 (site_info, items)
+            models_df: 모델 목록 DataFrame (model_name, model_id, category)
+            use_item_quantity: True면 span_count = 항목 수량 × 경간 배수 (발주),
+                False면 span_count = 경간 배수 (자재내역서)
+            skip_manual: True면 source == 'MANUAL' 항목 제외
+            catalog_index: CatalogIndex (있으면 models_df 대신 인덱스의 모델 매핑 사용)
+
+        Returns:
+            PLAN_COLUMNS 컬럼의 DataFrame (모델을 찾지 못한 항목, 발주 시 수량이 없는 항목은 제외)
+        """
+        if not isinstance(quotation_data, dict):
+            return pd.DataFrame(columns=self.PLAN_COLUMNS)
+
+        site_info = quotation_data.get('site_info', {}) or {}
+        plan = site_info.get('model_span_plan', {}) or {}
+        try:
+            total_span_count = int(site_info.get('total_span_count', 1))
+        except (TypeError, ValueError):
+            total_span_count = 1
+
+        if catalog_index is not None:
+            name_to_id, name_to_category = catalog_index.model_id_by_name, catalog_index.category_by_name
+        else:
+            name_to_id, name_to_category = self._model_maps(models_df)
+
+        rows = []
+        for line_no, item in enumerate(quotation_data.get('items', []) or []):
+            if not isinstance(item, dict) or 'model_name' not in item:
+                continue
+            if skip_manual and item.get('source') == 'MANUAL':
+                continue
+
+            model_name = item['model_name']
+            model_key = str(model_name).strip()
+            if model_key not in name_to_id:
+                continue
+
+            # 발주는 수량이 필수 - 수량이 없는(None) 불완전한 항목은 건너뜀
+            if use_item_quantity and item.get('quantity') is None:
+                continue
+            try:
+                item_quantity = float(item['quantity']) if use_item_quantity else 1.0
+            except (TypeError, ValueError):
+                continue
+
+            multiplier = total_span_count
+            if model_name in plan:
+                multiplier = int((plan[model_name] or {}).get('span_count', multiplier))
+            if self.FIXED_SPAN_CATEGORY_KEYWORD in name_to_category.get(model_key, ''):
+                multiplier = 1
+
+            rows.append({
+                'line_no': line_no,
+                'quote_model_name': model_name,
+                'model_id': name_to_id[model_key],
+                'item_quantity': item_quantity,
+                'span_multiplier': multiplier,
+                'span_count': item_quantity * multiplier,
+            })
+
+        return pd.DataFrame(rows, columns=self.PLAN_COLUMNS)
+
+    @staticmethod
+    def _model_maps(models_df: pd.DataFrame):
+        """모델명(공백 제거) → model_id / category 매핑 (동일 모델명은 첫 행 우선)"""
+        if models_df is None or models_df.empty or 'model_name' not in models_df.columns:
+            return {}, {}
+
+        names = models_df['model_name'].astype(str).str.strip()
+        first_models = models_df[~names.duplicated()]
+        first_names = names[~names.duplicated()]
+        name_to_id = {}
+        if 'model_id' in first_models.columns:
+            name_to_id = dict(zip(first_names, first_models['model_id']))
+        name_to_category = {}
+        if 'category' in first_models.columns:
+            name_to_category = dict(zip(first_names, first_models['category'].astype(object).fillna('').astype(str)))
+        return name_to_id, name_to_category
+
+    # ========================================================================
+    # 전개 / 집계
+    # ========================================================================
+
+    def explode(self, span_plan: pd.DataFrame) -> pd.DataFrame:
+        """
+        경간 계획 전체를 BOM 행 단위로 전개
+
+        Args:
+            span_plan: build_span_plan() 결과
+
+        Returns:
+            (견적 행 × BOM 행) DataFrame
+            - per-span 'quantity', 'total_quantity' (= quantity × span_count)
+            - 'is_pipe' (카테고리에 PIPE 포함 여부)
+        """
+        exploded = self.engine.calculate_bom_for_spans(span_plan)
+        if exploded.empty:
+            return exploded
+
+        exploded['quantity'] = pd.to_numeric(exploded['quantity'], errors='coerce').fillna(0.0)
+        exploded['total_quantity'] = exploded['total_quantity'].fillna(0.0)
+        exploded['is_pipe'] = self.engine._is_pipe_category(exploded)
+        return exploded
+
+    def aggregate_purchase_lines(self, exploded: pd.DataFrame,
+                                 pipe_lengths: Optional[Dict[str, float]] = None) -> pd.DataFrame:
+        """
+        전개 결과를 발주 항목으로 합산 (자재명 + 규격 기준 groupby)
+
+        PIPE는 규격별 원자재 길이로 나눠 올림한 본수(EA)로 환산한다.
+
+        Args:
+            exploded: explode() 결과
+            pipe_lengths: {규격: 원자재 길이(m)} (없으면 PIPE_STANDARD_LENGTH_M)
+
+        Returns:
+            material_name, standard, unit, quantity, category, model_reference 컬럼의
+            DataFrame (첫 등장 순서 유지)
+        """
+        columns = ['material_name', 'standard', 'unit', 'quantity', 'category', 'model_reference']
+        if exploded is None or exploded.empty:
+            return pd.DataFrame(columns=columns)
+
+        is_pipe = exploded['is_pipe']
+        stock_length = exploded['standard'].map(pipe_lengths or {}).fillna(self.engine.PIPE_STANDARD_LENGTH_M)
+        total = exploded['total_quantity']
+        pipe_count = np.ceil(total / stock_length)
+
+        lines = pd.DataFrame({
+            'material_name': exploded['material_name'],
+            'standard': exploded['standard'],
+            'unit': exploded['unit'].where(~is_pipe, 'EA'),
+            'quantity': total.where(~is_pipe, pipe_count),
+            'category': exploded['category'],
+            'model_reference': exploded['quote_model_name'],
+        })
+
+        return lines.groupby(['material_name', 'standard'], sort=False, dropna=False).agg(
+            unit=('unit', 'first'),
+            quantity=('quantity', 'sum'),
+            category=('category', 'first'),
+            model_reference=('model_reference', 'first'),
+        ).reset_index()[columns]
+
+    @staticmethod
+    def pipe_standards(exploded: pd.DataFrame) -> List[str]:
+        """전개 결과에서 PIPE 행의 고유 규격 목록"""
+        if exploded is None or exploded.empty:
+            return []
+        return exploded.loc[exploded['is_pipe'], 'standard'].dropna().astype(str).unique().tolist()
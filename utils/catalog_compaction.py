@@ -0,0 +1,147 @@
+"""
+카탈로그 DataFrame 메모리 압축 - 카탈로그 로드 시 테이블별로 한 번 적용
+한 서버 프로세스에 여러 테넌트 카탈로그를 올릴 수 있도록 공유 카탈로그의 크기를 줄인다
+
+- 화면에서 쓰지 않는 관리 컬럼 제거 (tenant_id, id, created_at, updated_at, deleted_at)
+- 반복이 많은 문자열 컬럼 → category (카테고리/단위/업체명 등, 고유값 비율이 낮을 때만)
+- 나머지 문자열 컬럼 → Arrow 문자열 (pyarrow가 있을 때만, NaN 의미 유지)
+- 숫자 컬럼 다운캐스트 (값이 바뀌지 않을 때만, 단가/재고 수량/파이프 길이는 그대로)
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 화면/매칭/검색 어디에서도 읽지 않는 컬럼 (증분 동기화는 엔진 내부 사본을 사용)
+DROP_COLUMNS = ('tenant_id', 'id', 'created_at', 'updated_at', 'deleted_at')
+
+# 테이블별 category 후보 컬럼 (컬럼 변환 후 이름 기준)
+CATEGORY_COLUMNS = {
+    'models': ('category',),
+    'pricing': ('단위',),
+    'main_materials': ('품목', 'material_type'),
+    'sub_materials': ('단위', '업체명'),
+    'inventory': ('재질', '단위', '공급업체'),
+}
+CATEGORY_MAX_UNIQUE_RATIO = 0.5  # 고유값 비율이 이보다 높으면 category로 바꾸지 않음
+
+# 곱셈/나눗셈에 쓰이는 금액/수량/길이 컬럼 - 오버플로/정밀도 손실을 피하려고 다운캐스트 제외
+PRECISION_COLUMNS = ('단가', '잔여재고', '파이프길이(m)')
+
+
+def _arrow_string_dtype():
+    """NaN을 결측값으로 쓰는 Arrow 문자열 dtype (pyarrow/pandas가 지원하지 않으면 None)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    for build in (lambda: pd.StringDtype('pyarrow', na_value=np.nan), lambda: pd.StringDtype('pyarrow_numpy')):
+        try:
+            return build()
+        except (TypeError, ValueError, ImportError):
+            continue
+    return None
+
+
+ARROW_STRING_DTYPE = _arrow_string_dtype()
+
+
+def _is_text(series: pd.Series) -> bool:
+    """문자열 컬럼인지 (결측값 외에는 모두 str)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return False
+    if isinstance(series.dtype, pd.StringDtype):
+        return True
+    if series.dtype != object:
+        return False
+    values = series.dropna()
+    return all(isinstance(value, str) for value in values)
+
+
+def _downcast(series: pd.Series) -> Optional[pd.Series]:
+    """값이 그대로인 더 작은 숫자 dtype (줄일 수 없으면 None)"""
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return None
+    if pd.api.types.is_integer_dtype(series.dtype) and series.dtype.itemsize > 1:
+        smaller = pd.to_numeric(series, downcast='integer')
+    elif pd.api.types.is_float_dtype(series.dtype) and series.dtype.itemsize > 4:
+        smaller = series.astype(np.float32)
+        same = (smaller.astype(series.dtype) == series) | series.isna()
+        if not same.all():
+            return None
+    else:
+        return None
+    return smaller if smaller.dtype.itemsize < series.dtype.itemsize else None
+
+
+def compact_frame(df: pd.DataFrame, table: str = '') -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    DataFrame 메모리 압축 (새 DataFrame 반환, 값은 그대로)
+
+    Args:
+        df: 컬럼 변환이 끝난 카탈로그 테이블
+        table: 테이블명 (CATEGORY_COLUMNS 조회용)
+
+    Returns:
+        (압축된 DataFrame, 리포트 {'before', 'after', 'saved', 'dropped', 'categorical', 'arrow', 'downcast'})
+    """
+    before = int(df.memory_usage(index=True, deep=True).sum())
+    report: Dict[str, Any] = {'before': before, 'after': before, 'saved': 0,
+                              'dropped': [], 'categorical': [], 'arrow': [], 'downcast': []}
+    if df.empty:
+        return df, report
+
+    report['dropped'] = [column for column in DROP_COLUMNS if column in df.columns]
+    compact = df.drop(columns=report['dropped'])
+
+    columns = {}
+    category_columns = CATEGORY_COLUMNS.get(table, ())
+    for column in compact.columns:
+        series = compact[column]
+        if column in category_columns and _is_text(series):
+            unique = series.nunique(dropna=True)
+            if unique <= len(series) * CATEGORY_MAX_UNIQUE_RATIO:
+                columns[column] = series.astype('category')
+                report['categorical'].append(column)
+                continue
+        if ARROW_STRING_DTYPE is not None and _is_text(series) and series.dtype != ARROW_STRING_DTYPE:
+            columns[column] = series.astype(ARROW_STRING_DTYPE)
+            report['arrow'].append(column)
+            continue
+        if column not in PRECISION_COLUMNS:
+            smaller = _downcast(series)
+            if smaller is not None:
+                columns[column] = smaller
+                report['downcast'].append(column)
+    if columns:
+        compact = compact.assign(**columns)
+
+    after = int(compact.memory_usage(index=True, deep=True).sum())
+    report['after'] = after
+    report['saved'] = before - after
+    return compact, report
+
+
+def memory_report_frame(reports: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """
+    테이블별 압축 리포트 표
+
+    Args:
+        reports: {테이블: compact_frame() 리포트}
+
+    Returns:
+        테이블/압축 전/후/절감(bytes)/절감률(%) DataFrame
+    """
+    rows = [
+        {
+            '테이블': table,
+            '압축 전(bytes)': report['before'],
+            '압축 후(bytes)': report['after'],
+            '절감(bytes)': report['saved'],
+            '절감률(%)': round(report['saved'] / report['before'] * 100, 1) if report['before'] else 0.0,
+        }
+        for table, report in reports.items()
+    ]
+    return pd.DataFrame(rows, columns=['테이블', '압축 전(bytes)', '압축 후(bytes)', '절감(bytes)', '절감률(%)'])
@@ -0,0 +1,142 @@
+"""
+CatalogIndex - 로드된 카탈로그의 모델/단가 조회 인덱스
+load_data() 결과(컬럼 변환 후)로 한 번 만들고 카탈로그 버전이 바뀔 때만 재구축
+
+- 모델명 → 모델 행 / model_id / 카테고리
+- model_id → 모델 행
+- 모델명 → 가격표 행 (search_model_price와 같은 첫 행 우선)
+"""
+
+from typing import Any, Dict, Optional
+import hashlib
+
+import pandas as pd
+
+
+def table_version(df: pd.DataFrame) -> str:
+    """
+    테이블 하나의 내용 기반 버전 (행 해시 합산)
+
+    Args:
+        df: 테이블 DataFrame
+
+    Returns:
+        16자리 16진수 버전
+    """
+    digest = hashlib.sha1(f"{len(df)}:{','.join(map(str, df.columns))}".encode('utf-8'))
+    if not df.empty:
+        try:
+            row_hash = int(pd.util.hash_pandas_object(df, index=False).sum())
+        except TypeError:
+            row_hash = int(pd.util.hash_pandas_object(df.astype(str), index=False).sum())
+        digest.update(str(row_hash).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def table_versions(data: Dict[str, Any]) -> Dict[str, str]:
+    """load_data() 결과의 테이블별 버전 {테이블: 버전}"""
+    return {table: table_version(df) for table, df in data.items() if isinstance(df, pd.DataFrame)}
+
+
+def catalog_version(data: Dict[str, Any], versions: Optional[Dict[str, str]] = None) -> str:
+    """
+    카탈로그 내용 기반 버전 문자열
+
+    테이블별 버전을 합치므로 같은 내용이면 같은 버전이 나온다.
+
+    Args:
+        data: load_data() 결과
+        versions: table_versions() 결과 (None이면 계산)
+
+    Returns:
+        16자리 16진수 버전
+    """
+    versions = versions if versions is not None else table_versions(data)
+    joined = '|'.join(f"{table}:{versions[table]}" for table in sorted(versions))
+    return hashlib.sha1(joined.encode('utf-8')).hexdigest()[:16]
+
+
+def _name_keys(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.strip()
+
+
+class CatalogIndex:
+    """
+    모델/단가 dict 인덱스 (조회 O(1))
+
+    Usage:
+        index = CatalogIndex(data)
+        price_row = index.price_row('DAL01-2012')
+        model_id = index.model_id('DAL01-2012')
+    """
+
+    def __init__(self, data: Dict[str, Any], version: Optional[str] = None):
+        """
+        CatalogIndex 초기화
+
+        Args:
+            data: load_data() 결과 (models: model_name/model_id/category, pricing: 모델명)
+            version: 카탈로그 버전 (None이면 data['catalog_version'] 또는 계산값)
+        """
+        self.version = version or data.get('catalog_version') or catalog_version(data)
+
+        models = data.get('models')
+        self.models = models if isinstance(models, pd.DataFrame) else pd.DataFrame()
+        pricing = data.get('pricing')
+        self.pricing = pricing if isinstance(pricing, pd.DataFrame) else pd.DataFrame()
+
+        self._model_pos_by_name: Dict[str, int] = {}
+        self._model_pos_by_id: Dict[str, int] = {}
+        self.model_id_by_name: Dict[str, Any] = {}
+        self.category_by_name: Dict[str, str] = {}
+        if not self.models.empty and 'model_name' in self.models.columns:
+            names = _name_keys(self.models['model_name'])
+            first = ~names.duplicated()
+            positions = pd.Series(range(len(self.models)), index=self.models.index)
+            self._model_pos_by_name = dict(zip(names[first], positions[first]))
+            if 'model_id' in self.models.columns:
+                self.model_id_by_name = dict(zip(names[first], self.models.loc[first, 'model_id']))
+                ids = self.models['model_id'].astype(str)
+                first_id = ~ids.duplicated()
+                self._model_pos_by_id = dict(zip(ids[first_id], positions[first_id]))
+            if 'category' in self.models.columns:
+                self.category_by_name = dict(zip(
+                    names[first], self.models.loc[first, 'category'].astype(object).fillna('').astype(str)
+                ))
+
+        self._price_pos_by_name: Dict[str, int] = {}
+        if not self.pricing.empty and '모델명' in self.pricing.columns:
+            names = _name_keys(self.pricing['모델명'])
+            first = ~names.duplicated()
+            positions = pd.Series(range(len(self.pricing)), index=self.pricing.index)
+            self._price_pos_by_name = dict(zip(names[first], positions[first]))
+
+    # ========================================================================
+    # 조회
+    # ========================================================================
+
+    def model(self, model_name: str) -> Optional[pd.Series]:
+        """모델명으로 모델 행 조회 (없으면 None)"""
+        pos = self._model_pos_by_name.get(str(model_name).strip())
+        return None if pos is None else self.models.iloc[pos]
+
+    def model_by_id(self, model_id) -> Optional[pd.Series]:
+        """model_id로 모델 행 조회 (없으면 None)"""
+        pos = self._model_pos_by_id.get(str(model_id))
+        return None if pos is None else self.models.iloc[pos]
+
+    def model_id(self, model_name: str):
+        """모델명 → model_id (없으면 None)"""
+        return self.model_id_by_name.get(str(model_name).strip())
+
+    def category(self, model_name: str) -> str:
+        """모델명 → 카테고리 (없으면 '')"""
+        return self.category_by_name.get(str(model_name).strip(), '')
+
+    def price_row(self, model_name: str) -> Optional[pd.Series]:
+        """모델명으로 가격표 행 조회 (단가/단위/규격, 없으면 None)"""
+        pos = self._price_pos_by_name.get(str(model_name).strip())
+        return None if pos is None else self.pricing.iloc[pos]
+
+    def __len__(self) -> int:
+        return len(self._model_pos_by_name)
@@ -0,0 +1,254 @@
+"""
+CatalogSnapshot - 테넌트 카탈로그의 로컬 Arrow(Feather) 스냅샷
+서버 재시작/새 워커 프로세스가 Supabase에서 전체 카탈로그를 다시 받지 않도록 디스크에 보관
+
+- 정규화된 카탈로그 테이블(컬럼 변환 + 압축 후)과 증분 동기화용 원본 테이블을 함께 저장
+- 비압축 Feather(Arrow IPC)라 메모리 맵으로 읽음 (복사 없음, 워커 간 페이지 캐시 공유)
+- manifest.json: 카탈로그/테이블 버전, updated_at 워터마크, 압축 리포트
+- 파일명에 테이블 버전을 붙이고 manifest를 마지막에 교체하므로 다른 워커가 읽는 중에도 안전
+- pyarrow가 없으면 비활성 (snapshot_for()가 None 반환)
+
+저장 위치: PTOP_SNAPSHOT_DIR (설정하지 않으면 비활성)
+- 앱 전용 디렉터리를 지정 (만드는 디렉터리는 소유자만 접근 가능한 0700)
+- 읽을 때 manifest의 테넌트가 다르면 무시
+"""
+
+from typing import Any, Dict, Optional
+import json
+import os
+import re
+import threading
+import time
+
+import pandas as pd
+
+
+SNAPSHOT_FORMAT = 1  # 정규화 방식(컬럼 변환/압축)이 바뀌면 올려서 이전 스냅샷 무시
+MANIFEST_NAME = 'manifest.json'
+DIR_MODE = 0o700  # 스냅샷에는 카탈로그 전체(단가 포함)가 들어 있으므로 소유자만 접근
+CLEANUP_GRACE_SEC = 600  # 이보다 최근에 쓴 파일은 정리하지 않음 (다른 워커가 저장 중일 수 있음)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    feather = None
+    ARROW_AVAILABLE = False
+
+
+def snapshot_root() -> Optional[str]:
+    """스냅샷 루트 디렉터리 (PTOP_SNAPSHOT_DIR, 설정하지 않았으면 None = 비활성)"""
+    return os.getenv('PTOP_SNAPSHOT_DIR') or None
+
+
+def _safe_name(text: str) -> str:
+    return re.sub(r'[^0-9A-Za-z_.-]+', '_', str(text))
+
+
+def _make_private_dirs(directory: str) -> None:
+    """directory까지 없는 디렉터리를 DIR_MODE로 생성 (os.makedirs의 mode는 마지막 디렉터리에만 적용)"""
+    parent = os.path.dirname(os.path.abspath(directory))
+    if not os.path.isdir(parent):
+        _make_private_dirs(parent)
+    try:
+        os.mkdir(directory, DIR_MODE)
+    except FileExistsError:
+        pass
+
+
+class CatalogSnapshot:
+    """
+    테넌트 하나의 카탈로그 스냅샷
+
+    Usage:
+        snapshot = snapshot_for('dooho', 'supabase')
+        restored = snapshot.load()                 # {'manifest', 'tables', 'raw'} 또는 None
+        snapshot.save_if_changed(catalog, raw_frames, watermarks)
+    """
+
+    def __init__(self, directory: str, tenant: str):
+        """
+        CatalogSnapshot 초기화
+
+        Args:
+            directory: 테넌트 스냅샷 디렉터리
+            tenant: 테넌트 ID (manifest의 테넌트와 다르면 읽지 않음)
+        """
+        self.directory = directory
+        self.tenant = tenant
+        self.saved_version: Optional[str] = None  # 이 프로세스에서 마지막으로 저장/복원한 카탈로그 버전
+        self.failed_version: Optional[str] = None  # 마지막으로 저장에 실패한 버전 (같은 버전은 다시 시도하지 않음)
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # 읽기
+    # ========================================================================
+
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        """manifest.json (없거나 형식/테넌트가 다르면 None)"""
+        try:
+            with open(os.path.join(self.directory, MANIFEST_NAME), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('format') != SNAPSHOT_FORMAT:
+            return None
+        if manifest.get('tenant') != self.tenant:
+            print(f"❌ 카탈로그 스냅샷 테넌트 불일치 ({self.directory}): {manifest.get('tenant')} != {self.tenant}")
+            return None
+        return manifest
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷을 메모리 맵으로 읽기
+
+        Returns:
+            {'manifest': dict, 'tables': {테이블: 정규화 DataFrame}, 'raw': {테이블: 원본 DataFrame}}
+            (스냅샷이 없거나 읽을 수 없으면 None)
+        """
+        manifest = self.manifest()
+        if manifest is None:
+            return None
+        try:
+            tables = {table: self._read(name) for table, name in manifest['files'].items()}
+            raw = {table: self._read(name) for table, name in manifest['raw_files'].items()}
+        except Exception as e:
+            print(f"❌ 카탈로그 스냅샷 읽기 오류 ({self.directory}): {e}")
+            return None
+        self.saved_version = manifest.get('catalog_version')
+        return {'manifest': manifest, 'tables': tables, 'raw': raw}
+
+    def _read(self, name: str) -> pd.DataFrame:
+        table = feather.read_table(os.path.join(self.directory, name), memory_map=True)
+        return table.to_pandas(split_blocks=True)
+
+    # ========================================================================
+    # 쓰기
+    # ========================================================================
+
+    def needs_save(self, version: Optional[str]) -> bool:
+        """마지막 저장본과 다르고, 이미 저장에 실패한 버전도 아닌지"""
+        return version not in (self.saved_version, self.failed_version)
+
+    def save_if_changed(self, catalog, raw_frames: Dict[str, pd.DataFrame],
+                        watermarks: Dict[str, Optional[str]]) -> bool:
+        """
+        카탈로그 버전이 마지막 저장본과 다를 때만 저장 (저장에 실패한 버전은 다시 시도하지 않음)
+
+        Args:
+            catalog: SharedCatalog
+            raw_frames: 테이블별 증분 동기화 원본 DataFrame (PtopEngine.sync_info()['frame'])
+            watermarks: 테이블별 updated_at 워터마크
+
+        Returns:
+            저장했는지 여부
+        """
+        if not self.needs_save(catalog.version):
+            return False
+        with self._lock:
+            if not self.needs_save(catalog.version):
+                return False
+            try:
+                self._save(catalog, raw_frames, watermarks)
+            except Exception as e:
+                print(f"❌ 카탈로그 스냅샷 저장 오류 ({self.directory}): {e}")
+                self.failed_version = catalog.version
+                return False
+            self.saved_version = catalog.version
+            return True
+
+    def _save(self, catalog, raw_frames: Dict[str, pd.DataFrame], watermarks: Dict[str, Optional[str]]) -> None:
+        _make_private_dirs(self.directory)
+        files = {}
+        raw_files = {}
+        for table, df in catalog.tables.items():
+            version = catalog.table_versions[table]
+            files[table] = self._write(f"{_safe_name(table)}-{version}.arrow", df)
+            if table in raw_frames:
+                raw_files[table] = self._write(f"{_safe_name(table)}-{version}.raw.arrow", raw_frames[table])
+
+        manifest = {
+            'format': SNAPSHOT_FORMAT,
+            'tenant': catalog.tenant,
+            'catalog_version': catalog.version,
+            'table_versions': catalog.table_versions,
+            'watermarks': {table: watermarks.get(table) for table in raw_files},
+            'memory_report': catalog.memory_report,
+            'files': files,
+            'raw_files': raw_files,
+            'saved_at': time.time(),
+        }
+        self._replace(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, default=str).encode('utf-8'))
+        self._remove_unused(set(files.values()) | set(raw_files.values()))
+
+    def _write(self, name: str, df: pd.DataFrame) -> str:
+        """비압축 Feather로 저장 (이미 있으면 그대로 사용 - 파일명에 버전 포함)"""
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path):
+            try:
+                os.utime(path)  # 다른 워커의 정리 대상에서 빠지도록 수정 시각 갱신
+                return name
+            except OSError:
+                pass  # 그 사이 정리됨 - 다시 저장
+        table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, path)
+        return name
+
+    def _replace(self, name: str, content: bytes) -> None:
+        path = os.path.join(self.directory, name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def _remove_unused(self, keep: set) -> None:
+        """
+        manifest에서 빠진 이전 버전 파일 정리 (다른 프로세스가 맵핑 중이어도 POSIX에서는 안전)
+
+        여러 워커가 같은 디렉터리에 저장할 수 있으므로 지금 디스크에 있는 manifest의 파일과
+        CLEANUP_GRACE_SEC 안에 쓴 파일(다른 워커가 manifest를 교체하기 전일 수 있음)은 남긴다.
+        """
+        current = self.manifest()
+        if current is not None:
+            keep = keep | set(current['files'].values()) | set(current['raw_files'].values())
+        cutoff = time.time() - CLEANUP_GRACE_SEC
+        for name in os.listdir(self.directory):
+            if not name.endswith('.arrow') or name in keep:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass  # Windows에서 맵핑 중인 파일, 다른 워커가 먼저 정리한 파일 등 - 다음 저장 때 다시 시도
+
+
+_snapshots: Dict[str, CatalogSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def snapshot_for(tenant: str, namespace: str = '') -> Optional[CatalogSnapshot]:
+    """
+    테넌트 스냅샷 (프로세스 공유, pyarrow가 없거나 비활성이면 None)
+
+    Args:
+        tenant: 테넌트 ID
+        namespace: 데이터 출처 구분 (예: 'supabase', 'sqlite') - 출처별로 따로 저장
+
+    Returns:
+        CatalogSnapshot 또는 None
+    """
+    root = snapshot_root()
+    if not ARROW_AVAILABLE or root is None:
+        return None
+    directory = os.path.join(root, _safe_name(namespace or 'default'), _safe_name(tenant))
+    with _snapshots_lock:
+        snapshot = _snapshots.get(directory)
+        if snapshot is None:
+            snapshot = CatalogSnapshot(directory, tenant)
+            _snapshots[directory] = snapshot
+        return snapshot
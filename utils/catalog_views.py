@@ -0,0 +1,362 @@
+"""
+CatalogViews - 로드된 카탈로그에서 파생되는 화면용 뷰
+카탈로그 버전당 한 번 계산하고, 원본 테이블이 바뀐 뷰만 다시 계산
+
+- models: 카테고리별 모델, 모델 시리즈(접두어) 개수, 식별번호 ↔ 모델명
+- main_materials: 파이프 규격(규격 키) → 원자재 길이(m), (품목, 규격) → 재질(아연도/STS)
+- sub_materials: 품목/규격 부분 일치 + 품목 초성/자모 검색 색인
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.catalog_index import table_version
+from utils.spec_parser import spec_key, spec_key_series
+
+
+class CatalogViews:
+    """
+    카탈로그 파생 뷰 (지연 계산 + 테이블 버전별 캐시)
+
+    Usage:
+        views = CatalogViews(data)
+        views.series_prefix_counts(top_n=5)
+        views.pipe_length('75*75*2.0T')
+        views.material_type('각파이프', '75*75*2.0T')
+        views.refresh(new_data)   # 바뀐 테이블의 뷰만 무효화
+    """
+
+    DEFAULT_PIPE_LENGTH_M = 6.0  # 파이프 원자재 기본 길이
+    DEFAULT_MATERIAL_TYPE = '아연도'  # 재질 정보가 없을 때 발주 그룹
+    PIPE_LENGTH_COLUMNS = ('길이', '단위길이', '파이프길이(m)')
+    MATERIAL_ITEM_COLUMNS = ('품목', 'Item', 'item_name', 'material_name', '자재명')
+    MATERIAL_SPEC_COLUMNS = ('규격', 'Spec', 'specification', 'standard', '사양')
+    MATERIAL_TYPE_COLUMNS = ('재질', 'Material', 'material_type', '소재')
+    SERIES_PREFIX_LENGTH = 4  # 모델 시리즈 접두어 길이 (모델명 '-' 앞 4자)
+
+    # 뷰 이름 → 원본 테이블
+    VIEW_TABLES = {
+        'models_by_category': 'models',
+        'series_prefix_counts': 'models',
+        'identifier_to_model': 'models',
+        'model_to_identifier': 'models',
+        'pipe_length_table': 'main_materials',
+        'pipe_lengths': 'main_materials',
+        'material_type_table': 'main_materials',
+        'material_types': 'main_materials',
+        'sub_material_search_index': 'sub_materials',
+    }
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        CatalogViews 초기화
+
+        Args:
+            data: load_data() 결과 (table_versions가 있으면 재사용)
+        """
+        self.data: Dict[str, Any] = {}
+        self.versions: Dict[str, str] = {}
+        self.catalog_version: Optional[str] = None
+        self._views: Dict[str, Any] = {}
+        self.refresh(data)
+
+    def refresh(self, data: Dict[str, Any]) -> List[str]:
+        """
+        새 카탈로그 반영 (버전이 바뀐 테이블의 뷰만 무효화)
+
+        Args:
+            data: load_data() 결과
+
+        Returns:
+            무효화된 뷰 이름 목록
+        """
+        if data.get('catalog_version') is not None and data.get('catalog_version') == self.catalog_version:
+            return []
+
+        versions = data.get('table_versions') or {}
+        changed = set()
+        for table in set(self.VIEW_TABLES.values()):
+            df = data.get(table)
+            if not isinstance(df, pd.DataFrame):
+                df = pd.DataFrame()
+            version = versions.get(table) or table_version(df)
+            if self.versions.get(table) != version:
+                changed.add(table)
+                self.versions[table] = version
+            self.data[table] = df
+
+        dropped = [name for name, table in self.VIEW_TABLES.items() if table in changed and name in self._views]
+        for name in dropped:
+            del self._views[name]
+        self.catalog_version = data.get('catalog_version')
+        return dropped
+
+    def _view(self, name: str, build: Callable[[], Any]) -> Any:
+        if name not in self._views:
+            self._views[name] = build()
+        return self._views[name]
+
+    # ========================================================================
+    # models 파생 뷰
+    # ========================================================================
+
+    def _models(self) -> pd.DataFrame:
+        return self.data.get('models', pd.DataFrame())
+
+    def models_by_category(self) -> Dict[str, List[str]]:
+        """카테고리 → 모델명 목록 (모델 순서 유지)"""
+        def build():
+            models = self._models()
+            if models.empty or 'model_name' not in models.columns or 'category' not in models.columns:
+                return {}
+            grouped = models.groupby(models['category'].astype(object).fillna('').astype(str), sort=False)['model_name']
+            return {category: names.astype(str).tolist() for category, names in grouped}
+        return self._view('models_by_category', build)
+
+    def series_prefix_counts(self, top_n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        모델 시리즈(모델명 '-' 앞 4자) 개수
+
+        Args:
+            top_n: 상위 N개만 반환 (None이면 전체)
+
+        Returns:
+            [(접두어, 개수), ...] 개수 내림차순 (동률은 먼저 나온 접두어 우선)
+        """
+        def build():
+            models = self._models()
+            if models.empty or 'model_name' not in models.columns:
+                return []
+            prefixes = models['model_name'].astype(str).str.split('-').str[0].str[:self.SERIES_PREFIX_LENGTH]
+            counts = prefixes.value_counts(sort=False).sort_values(ascending=False, kind='stable')
+            return list(zip(counts.index.tolist(), counts.astype(int).tolist()))
+        counts = self._view('series_prefix_counts', build)
+        return counts if top_n is None else counts[:top_n]
+
+    def identifier_to_model(self) -> Dict[str, str]:
+        """식별번호 → 모델명 (같은 식별번호는 첫 모델 우선)"""
+        def build():
+            models = self._models()
+            column = '식별번호' if '식별번호' in models.columns else 'identifier_number'
+            if models.empty or column not in models.columns or 'model_name' not in models.columns:
+                return {}
+            valid = models[models[column].notna()]
+            ids = valid[column].astype(str).str.strip()
+            keep = (ids != '') & ~ids.duplicated()
+            return dict(zip(ids[keep], valid.loc[keep, 'model_name'].astype(str)))
+        return self._view('identifier_to_model', build)
+
+    def model_to_identifier(self) -> Dict[str, str]:
+        """모델명 → 식별번호 (식별번호 없는 모델 제외)"""
+        def build():
+            return {model: identifier for identifier, model in reversed(list(self.identifier_to_model().items()))}
+        return self._view('model_to_identifier', build)
+
+    # ========================================================================
+    # main_materials 파생 뷰
+    # ========================================================================
+
+    def _main_materials(self) -> pd.DataFrame:
+        return self.data.get('main_materials', pd.DataFrame())
+
+    def pipe_length_table(self) -> Dict[str, float]:
+        """규격 키 → 원자재 길이(m) (같은 규격은 첫 행 우선, 길이가 없거나 0 이하면 기본 6m)"""
+        def build():
+            main_materials = self._main_materials()
+            if main_materials.empty or '규격' not in main_materials.columns:
+                return {}
+            lengths = pd.Series(self.DEFAULT_PIPE_LENGTH_M, index=main_materials.index, dtype=float)
+            for column in self.PIPE_LENGTH_COLUMNS:
+                if column in main_materials.columns:
+                    values = pd.to_numeric(main_materials[column], errors='coerce')
+                    lengths = values.where(values > 0, self.DEFAULT_PIPE_LENGTH_M)
+                    break
+            keys = spec_key_series(main_materials, '규격')
+            first = (keys != '') & ~keys.duplicated()
+            return dict(zip(keys[first], lengths[first].astype(float)))
+        return self._view('pipe_length_table', build)
+
+    def pipe_length(self, pipe_standard: str) -> float:
+        """
+        파이프 규격의 원자재 길이(m)
+
+        규격 키(순서 무관)가 같은 행을 먼저 찾고, 없으면 규격 포함 검색 첫 행,
+        그래도 없으면 6m. 규격별 결과는 main_materials 버전이 바뀔 때까지 재사용한다.
+
+        Args:
+            pipe_standard: BOM 규격
+
+        Returns:
+            원자재 길이(m)
+        """
+        table = self._view('pipe_lengths', dict)
+        if pipe_standard not in table:
+            length = self.pipe_length_table().get(spec_key(str(pipe_standard)))
+            table[pipe_standard] = length if length is not None else self._lookup_pipe_length(pipe_standard)
+        return table[pipe_standard]
+
+    def _lookup_pipe_length(self, pipe_standard: str) -> float:
+        main_materials = self._main_materials()
+        if main_materials.empty or '규격' not in main_materials.columns:
+            return self.DEFAULT_PIPE_LENGTH_M
+
+        pipe_match = main_materials[
+            main_materials['규격'].astype(str).str.contains(str(pipe_standard), na=False, case=False, regex=False)
+        ]
+        if pipe_match.empty:
+            return self.DEFAULT_PIPE_LENGTH_M
+
+        try:
+            for column in self.PIPE_LENGTH_COLUMNS:
+                if column in pipe_match.columns:
+                    length = float(pipe_match.iloc[0][column])
+                    return length if length > 0 else self.DEFAULT_PIPE_LENGTH_M
+        except (TypeError, ValueError):
+            pass
+        return self.DEFAULT_PIPE_LENGTH_M
+
+    def _material_columns(self) -> Tuple[Optional[str], Optional[str]]:
+        columns = self._main_materials().columns
+        item_column = next((c for c in self.MATERIAL_ITEM_COLUMNS if c in columns), None)
+        spec_column = next((c for c in self.MATERIAL_SPEC_COLUMNS if c in columns), None)
+        return item_column, spec_column
+
+    def _row_material_types(self, rows: pd.DataFrame) -> pd.Series:
+        """행별 재질 ('STS' / '아연도', 재질 컬럼 순서대로 확인, 없으면 기본값)"""
+        types = pd.Series(None, index=rows.index, dtype=object)
+        for column in self.MATERIAL_TYPE_COLUMNS:
+            if column not in rows.columns:
+                continue
+            values = rows[column].map(str)
+            unresolved = types.isna()
+            types = types.mask(unresolved & values.str.upper().str.contains('STS', regex=False), 'STS')
+            types = types.mask(types.isna() & values.str.contains('아연도', regex=False), '아연도')
+        return types.fillna(self.DEFAULT_MATERIAL_TYPE)
+
+    def material_type_table(self) -> Dict[str, Dict[str, Tuple[int, str]]]:
+        """
+        재질 조회표 {'item': 품목 → (행 위치, 재질), 'spec': 규격 키 → (행 위치, 재질)}
+
+        같은 품목/규격 키는 첫 행 우선 (행 위치는 포함 검색 범위를 그 앞까지로 줄이는 데 사용)
+        """
+        def build():
+            main_materials = self._main_materials()
+            item_column, spec_column = self._material_columns()
+            if main_materials.empty or not item_column or not spec_column:
+                return {'item': {}, 'spec': {}}
+            types = self._row_material_types(main_materials).tolist()
+            positions = range(len(main_materials))
+            entries = list(zip(positions, types))
+
+            items = main_materials[item_column].astype(str).str.strip().tolist()
+            item_table: Dict[str, Tuple[int, str]] = {}
+            for item, entry in zip(items, entries):
+                item_table.setdefault(item, entry)
+
+            keys = spec_key_series(main_materials, spec_column) if spec_column == '규격' else \
+                main_materials[spec_column].map(lambda value: spec_key(str(value)))
+            spec_table: Dict[str, Tuple[int, str]] = {}
+            for key, entry in zip(keys.tolist(), entries):
+                if key:
+                    spec_table.setdefault(key, entry)
+            return {'item': item_table, 'spec': spec_table}
+        return self._view('material_type_table', build)
+
+    def material_type(self, material_name: str, standard: str) -> str:
+        """
+        발주 그룹용 재질 ('STS' / '아연도')
+
+        품목에 자재명이 포함되거나 규격에 규격이 포함된 첫 행의 재질을 쓴다 (기존 규칙).
+        규격 키가 같은 행(치수 순서만 다른 규격)도 일치로 보며, 없으면 '아연도'.
+        품목/규격 키 조회표로 가장 앞선 정확 일치 행을 찾고, 그보다 앞의 행만 포함 검색하므로
+        정확 일치보다 먼저 나온 포함 일치 행이 있으면 그 행이 우선한다.
+        (자재명, 규격)별 결과는 main_materials 버전이 바뀔 때까지 재사용한다.
+
+        Args:
+            material_name: 자재명
+            standard: 규격
+
+        Returns:
+            재질
+        """
+        memo = self._view('material_types', dict)
+        key = (material_name, standard)
+        if key not in memo:
+            table = self.material_type_table()
+            hits = [
+                entry for entry in (
+                    table['item'].get(str(material_name).strip()),
+                    table['spec'].get(spec_key(str(standard))),
+                ) if entry is not None
+            ]
+            first = min(hits) if hits else None
+            memo[key] = self._lookup_material_type(material_name, standard, first)
+        return memo[key]
+
+    def _lookup_material_type(self, material_name: str, standard: str,
+                              first: Optional[Tuple[int, str]] = None) -> str:
+        """포함 검색 첫 행의 재질 (first: 정확 일치 첫 행 (위치, 재질) - 그 앞의 행만 검색)"""
+        main_materials = self._main_materials()
+        item_column, spec_column = self._material_columns()
+        if main_materials.empty or not item_column or not spec_column:
+            return first[1] if first is not None else self.DEFAULT_MATERIAL_TYPE
+
+        if first is not None:
+            main_materials = main_materials.iloc[:first[0]]
+        material_match = main_materials[
+            main_materials[item_column].astype(str).str.contains(str(material_name), na=False, regex=False) |
+            main_materials[spec_column].astype(str).str.contains(str(standard), na=False, regex=False)
+        ]
+        if material_match.empty:
+            return first[1] if first is not None else self.DEFAULT_MATERIAL_TYPE
+        return self._row_material_types(material_match.iloc[:1]).iloc[0]
+
+    # ========================================================================
+    # sub_materials 파생 뷰
+    # ========================================================================
+
+    def sub_material_search_index(self) -> Dict[str, Any]:
+        """부자재 검색 색인 {'item': 품목, 'spec': 규격 (SubstringIndex, 소문자), 'hangul': 품목 초성/자모}"""
+        def build():
+            from utils.model_search import HangulIndex, SubstringIndex
+
+            sub_materials = self.data.get('sub_materials', pd.DataFrame())
+            items = [str(v) for v in sub_materials['품목'].tolist()] if '품목' in sub_materials.columns else []
+            specs = [str(v) for v in sub_materials['규격'].tolist()] if '규격' in sub_materials.columns else []
+            return {
+                'item': SubstringIndex(items, str.lower),
+                'spec': SubstringIndex(specs, str.lower),
+                'hangul': HangulIndex(items),
+            }
+        return self._view('sub_material_search_index', build)
+
+    def search_sub_materials(self, query: str, narrowing=None) -> List[int]:
+        """
+        부자재 검색 결과 행 위치 (sub_materials 기준)
+
+        품목/규격 부분 일치(대소문자 무시) 행을 행 순서로, 이어서
+        품목 초성/자모 일치('ㅂㅌ' → 볼트) 행을 덧붙인다.
+
+        Args:
+            query: 검색어
+            narrowing: 타이핑 중 범위 축소 상태 (QueryNarrowing, None이면 전체 조회)
+
+        Returns:
+            행 위치 목록
+        """
+        from utils.model_search import find_narrowed
+
+        query = str(query)
+        if not query:
+            return []
+        index = self.sub_material_search_index()
+        version = self.versions.get('sub_materials')
+        needle = query.lower()
+        matched = sorted(set(
+            find_narrowed(index['item'], needle, narrowing, version, ('sub', 'item')) +
+            find_narrowed(index['spec'], needle, narrowing, version, ('sub', 'spec'))
+        ))
+        seen = set(matched)
+        hangul = [pos for pos in index['hangul'].find(query, narrowing, version, 'sub') if pos not in seen]
+        return matched + hangul
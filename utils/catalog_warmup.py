@@ -0,0 +1,153 @@
+"""
+CatalogWarmer - 서버 시작 시 테넌트 카탈로그를 백그라운드에서 미리 로드/색인
+첫 사용자 요청이 카탈로그 전체 로드와 색인 구축을 기다리지 않도록 프로세스당 한 번 시작
+
+- 시작하면 설정된 테넌트를 차례로 워밍 (로드 + CatalogIndex/검색 색인 구축)
+- 이후 interval_sec마다 같은 작업을 갱신 모드로 반복 (변경분만 반영, 조회는 기다리지 않음)
+- 한 테넌트의 실패는 기록만 하고 다음 테넌트/다음 주기에 계속 진행
+- 데몬 스레드이므로 프로세스 종료를 막지 않음
+
+설정: PTOP_WARMUP_TENANTS (기본 'dooho,kukje,demo', 빈 문자열이면 비활성),
+      PTOP_WARMUP_INTERVAL_SEC (기본 300, 0이면 시작 시 한 번만)
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import os
+import threading
+import time
+
+
+DEFAULT_TENANTS = ('dooho', 'kukje', 'demo')
+WARMUP_INTERVAL_SEC = 300.0
+
+
+def warmup_tenants() -> List[str]:
+    """워밍할 테넌트 목록 (PTOP_WARMUP_TENANTS, 쉼표 구분)"""
+    value = os.getenv('PTOP_WARMUP_TENANTS')
+    if value is None:
+        return list(DEFAULT_TENANTS)
+    return [tenant.strip() for tenant in value.split(',') if tenant.strip()]
+
+
+def warmup_interval() -> float:
+    """주기 갱신 간격(초) (PTOP_WARMUP_INTERVAL_SEC, 0이면 갱신 안 함)"""
+    try:
+        return max(0.0, float(os.getenv('PTOP_WARMUP_INTERVAL_SEC', WARMUP_INTERVAL_SEC)))
+    except ValueError:
+        return WARMUP_INTERVAL_SEC
+
+
+class CatalogWarmer:
+    """
+    테넌트 카탈로그 백그라운드 워밍
+
+    Usage:
+        warmer = CatalogWarmer(['dooho', 'kukje'], warm_tenant).start()   # warm_tenant(tenant, refresh) → 버전
+        warmer.wait_ready('dooho', timeout=30)
+        warmer.status()
+    """
+
+    def __init__(self, tenants: Iterable[str], warm: Callable[[str, bool], Any],
+                 interval_sec: float = WARMUP_INTERVAL_SEC):
+        """
+        CatalogWarmer 초기화
+
+        Args:
+            tenants: 워밍할 테넌트 ID 목록
+            warm: (테넌트, 갱신 여부) → 카탈로그 버전 (실패 시 예외)
+            interval_sec: 주기 갱신 간격 (0이면 시작 시 한 번만)
+        """
+        self.tenants = list(dict.fromkeys(tenants))
+        self.warm = warm
+        self.interval_sec = interval_sec
+        self._status: Dict[str, Dict[str, Any]] = {
+            tenant: {'state': 'pending', 'version': None, 'warmed_at': None,
+                     'seconds': None, 'runs': 0, 'error': None}
+            for tenant in self.tenants
+        }
+        self._ready = {tenant: threading.Event() for tenant in self.tenants}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'CatalogWarmer':
+        """워밍 스레드 시작 (이미 실행 중이면 그대로)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='catalog-warmer', daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """워밍 스레드 종료 (진행 중인 테넌트 작업은 끝까지 실행)"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        self.run_once(refresh=False)
+        while self.interval_sec > 0 and not self._stop.wait(self.interval_sec):
+            self.run_once(refresh=True)
+
+    def run_once(self, refresh: bool = False) -> None:
+        """
+        모든 테넌트를 한 번 워밍 (스레드 없이 직접 호출 가능)
+
+        Args:
+            refresh: True면 현재 카탈로그를 유지한 채 변경분 반영 (주기 갱신)
+        """
+        for tenant in self.tenants:
+            if self._stop.is_set():
+                return
+            start = time.perf_counter()
+            try:
+                version = self.warm(tenant, refresh)
+                error = None
+            except Exception as e:
+                version = None
+                error = str(e)
+                print(f"❌ 카탈로그 워밍 오류 ({tenant}): {e}")
+            elapsed = round(time.perf_counter() - start, 3)
+
+            with self._lock:
+                status = self._status[tenant]
+                status['runs'] += 1
+                status['seconds'] = elapsed
+                status['error'] = error
+                if error is None:
+                    status.update(state='ready', version=version, warmed_at=time.time())
+                elif status['state'] != 'ready':
+                    status['state'] = 'error'  # 이전에 성공했으면 기존 카탈로그가 계속 쓰이므로 ready 유지
+            if error is None:
+                self._ready[tenant].set()
+                print(f"[INFO] 카탈로그 워밍 완료 (tenant: {tenant}, {'갱신' if refresh else '시작'}) - {elapsed:.2f}s")
+
+    def is_ready(self, tenant: str) -> bool:
+        """테넌트 워밍이 한 번이라도 끝났는지"""
+        event = self._ready.get(tenant)
+        return event is not None and event.is_set()
+
+    def wait_ready(self, tenant: str, timeout: Optional[float] = None) -> bool:
+        """
+        테넌트 워밍 완료까지 대기
+
+        Args:
+            tenant: 테넌트 ID
+            timeout: 최대 대기 시간(초, None이면 무제한)
+
+        Returns:
+            워밍 완료 여부 (워밍 대상이 아닌 테넌트면 False)
+        """
+        event = self._ready.get(tenant)
+        return event is not None and event.wait(timeout)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """테넌트별 상태 {'state', 'version', 'warmed_at', 'seconds', 'runs', 'error'}"""
+        with self._lock:
+            return {tenant: dict(status) for tenant, status in self._status.items()}
@@ -0,0 +1,198 @@
+"""
+DimensionIndex - 숫자 치수(폭/높이/두께) 정렬 색인 (카탈로그 버전당 한 번 구축)
+치수 검색을 규격 문자열의 숫자 부분 일치('2000' ⊂ '12000') 대신 이진 탐색으로 처리
+
+검색어 형식 (대소문자 무시):
+- 일치: w2000, 폭2000, h1200, 높이1200, 1500h, t2.0, 두께2
+- 범위: w1800-2200, h900~1500 (양끝 포함)
+- 근접: w~2000, h≈1250 (가장 가까운 치수의 모델)
+- 숫자만 (1000 이상): 폭 또는 높이 일치
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+import re
+
+import numpy as np
+import pandas as pd
+
+from utils.spec_parser import DIMENSION_COLUMNS, dimension_frame
+
+
+AXES = tuple(DIMENSION_COLUMNS)  # ('width', 'height', 'thickness')
+ANY_AXES = ('width', 'height')  # 축 없는 숫자 검색어가 찾는 축
+MIN_BARE_NUMBER = 1000  # 숫자만 입력했을 때 치수로 보는 하한 (식별번호/짧은 숫자 제외)
+
+_NUMBER = r'\d+(?:\.\d+)?'
+_AXIS_WORDS = {
+    'width': 'width', 'w': 'width', '폭': 'width',
+    'height': 'height', 'h': 'height', '높이': 'height',
+    't': 'thickness', '두께': 'thickness',
+}
+_PREFIX_PATTERN = re.compile(
+    rf'(?<![a-z])(width|height|폭|높이|두께|w|h|t)\s*([~≈])?\s*({_NUMBER})(?:\s*[-~]\s*({_NUMBER}))?'
+)
+_SUFFIX_PATTERN = re.compile(rf'({_NUMBER})\s*(w|h)(?![a-z])')
+
+
+class DimensionCondition(NamedTuple):
+    """치수 검색 조건 (axis None = 폭 또는 높이)"""
+    axis: Optional[str]
+    op: str  # 'exact' / 'range' / 'nearest'
+    low: float
+    high: float
+
+
+def parse_dimension_query(query: str) -> List[DimensionCondition]:
+    """
+    검색어에서 치수 조건 추출
+
+    Args:
+        query: 검색어 (예: 'W1800-2200 H1200', 'w~2000', '2000')
+
+    Returns:
+        치수 조건 목록 (치수 검색어가 아니면 빈 리스트)
+    """
+    text = str(query).strip().lower().replace('×', '*')
+    if text.isdigit():
+        value = float(text)
+        return [DimensionCondition(None, 'exact', value, value)] if value >= MIN_BARE_NUMBER else []
+
+    conditions = []
+    spans = []
+    for match in _PREFIX_PATTERN.finditer(text):
+        word, nearest, low, high = match.groups()
+        axis = _AXIS_WORDS[word]
+        low = float(low)
+        if nearest:
+            conditions.append(DimensionCondition(axis, 'nearest', low, low))
+        elif high is not None and float(high) >= low:
+            conditions.append(DimensionCondition(axis, 'range', low, float(high)))
+        else:
+            conditions.append(DimensionCondition(axis, 'exact', low, low))
+        spans.append(match.span(3))
+    for match in _SUFFIX_PATTERN.finditer(text):
+        start, end = match.span(1)
+        if any(start < span_end and span_start < end for span_start, span_end in spans):
+            continue  # 'w1500h1200'의 1500은 이미 폭
+        value = float(match.group(1))
+        conditions.append(DimensionCondition(_AXIS_WORDS[match.group(2)], 'exact', value, value))
+    return conditions
+
+
+class DimensionIndex:
+    """
+    축별 정렬 색인 (값 오름차순 + 행 위치)
+
+    Usage:
+        index = DimensionIndex(data['models'], 'model_standard')
+        positions = index.range('width', 1800, 2200)
+        positions = index.match(parse_dimension_query('w~2000 h1200'))
+    """
+
+    def __init__(self, df: pd.DataFrame, source: str):
+        """
+        DimensionIndex 초기화
+
+        Args:
+            df: 카탈로그 테이블 (dim_* 컬럼이 있으면 재사용, 없으면 source에서 추출)
+            source: 규격 원본 컬럼 (예: 'model_standard')
+        """
+        df = df if isinstance(df, pd.DataFrame) else pd.DataFrame()
+        self._values: Dict[str, np.ndarray] = {}
+        self._positions: Dict[str, np.ndarray] = {}
+        if df.empty or source not in df.columns:
+            dims = pd.DataFrame(columns=list(DIMENSION_COLUMNS.values()), dtype=float)
+        else:
+            dims = dimension_frame(df, source)
+        for axis, column in DIMENSION_COLUMNS.items():
+            values = dims[column].to_numpy(dtype=float)
+            positions = np.flatnonzero(~np.isnan(values))
+            order = np.argsort(values[positions], kind='stable')
+            self._values[axis] = values[positions][order]
+            self._positions[axis] = positions[order]
+
+    def __len__(self) -> int:
+        return max((len(values) for values in self._values.values()), default=0)
+
+    # ========================================================================
+    # 축별 조회 (행 위치, 행 순서)
+    # ========================================================================
+
+    def exact(self, axis: str, value: float) -> np.ndarray:
+        """축 값이 value인 행 위치"""
+        return self.range(axis, value, value)
+
+    def range(self, axis: str, low: float, high: float) -> np.ndarray:
+        """축 값이 low 이상 high 이하인 행 위치"""
+        values = self._values[axis]
+        start = np.searchsorted(values, low, side='left')
+        end = np.searchsorted(values, high, side='right')
+        return np.sort(self._positions[axis][start:end])
+
+    def nearest(self, axis: str, value: float, k: int = 0) -> np.ndarray:
+        """
+        value에 가장 가까운 행 위치
+
+        Args:
+            axis: 'width' / 'height' / 'thickness'
+            value: 기준 치수
+            k: 0이면 가장 가까운 치수(양쪽 동률 포함)의 모든 행 (행 순서),
+               1 이상이면 거리순 k개
+
+        Returns:
+            행 위치 배열
+        """
+        values = self._values[axis]
+        if not len(values):
+            return np.array([], dtype=int)
+        split = int(np.searchsorted(values, value))
+        if k <= 0:
+            below = values[split - 1] if split > 0 else None
+            above = values[split] if split < len(values) else None
+            distance = min(abs(value - v) for v in (below, above) if v is not None)
+            return self.range(axis, value - distance, value + distance)
+
+        # 양쪽으로 넓혀가며 거리순 k개
+        left, right = split - 1, split
+        picked = []
+        while len(picked) < k and (left >= 0 or right < len(values)):
+            if right >= len(values) or (left >= 0 and value - values[left] <= values[right] - value):
+                picked.append(left)
+                left -= 1
+            else:
+                picked.append(right)
+                right += 1
+        return self._positions[axis][picked]
+
+    # ========================================================================
+    # 검색 조건
+    # ========================================================================
+
+    def find(self, condition: DimensionCondition) -> np.ndarray:
+        """조건 하나의 행 위치 (axis None이면 폭/높이 합집합)"""
+        axes = ANY_AXES if condition.axis is None else (condition.axis,)
+        found = []
+        for axis in axes:
+            if condition.op == 'nearest':
+                found.append(self.nearest(axis, condition.low))
+            else:
+                found.append(self.range(axis, condition.low, condition.high))
+        return found[0] if len(found) == 1 else np.union1d(*found)
+
+    def match(self, conditions: List[DimensionCondition]) -> List[int]:
+        """
+        모든 조건을 만족하는 행 위치 (축이 다른 조건은 교집합)
+
+        Args:
+            conditions: parse_dimension_query() 결과
+
+        Returns:
+            행 위치 목록 (행 순서, 조건이 없으면 빈 리스트)
+        """
+        positions = None
+        for condition in conditions:
+            found = self.find(condition)
+            positions = found if positions is None else np.intersect1d(positions, found)
+            if not len(positions):
+                break
+        return [] if positions is None else positions.tolist()
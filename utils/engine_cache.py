@@ -0,0 +1,313 @@
+"""
+EngineCache - PtopEngine 읽기 캐시 (read-through)
+테넌트/테이블 단위 TTL + 크기 제한 LRU
+
+- 키: (tenant_id, table, key)  예) ('dooho', 'bom', 'DH001')
+- 쓰기 경로는 영향받는 키만 무효화 (예: 한 모델의 BOM)
+- 만료/LRU 제거되면 안 되는 상태(증분 동기화 상태 등)는 pin()으로 별도 보관
+- 같은 키의 동시 미적중은 loader 한 번으로 병합 (SingleFlight, 테넌트/테이블별 무효화 세대 단위)
+- 프로세스 전체에서 공유 (Streamlit 세션 간 재사용), 스레드 안전
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+import threading
+import time
+
+import pandas as pd
+
+from utils.single_flight import SingleFlight
+
+
+class EngineCache:
+    """
+    테넌트/테이블 단위 TTL LRU 캐시
+
+    Usage:
+        cache = get_engine_cache()
+        bom = cache.get_or_load('dooho', 'bom', 'DH001', lambda: fetch_bom('DH001'))
+        cache.invalidate('dooho', 'bom', 'DH001')
+        cache.stats('dooho')
+        cache.flight_stats('dooho')                # 동시 조회 병합/대기 시간
+    """
+
+    DEFAULT_TTL_SEC = 300  # 기본 유효시간 (5분)
+    DEFAULT_MAX_ENTRIES = 1024  # 전체 항목 수 상한 (초과 시 LRU 제거)
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_sec: float = DEFAULT_TTL_SEC,
+                 table_ttl_sec: Optional[Dict[str, float]] = None):
+        """
+        EngineCache 초기화
+
+        Args:
+            max_entries: 최대 항목 수
+            ttl_sec: 기본 유효시간(초)
+            table_ttl_sec: 테이블별 유효시간 덮어쓰기 {table: 초}
+        """
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.table_ttl_sec = dict(table_ttl_sec or {})
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[Tuple[str, str], Dict[str, int]] = {}
+        # pin()한 항목 - TTL/LRU 대상이 아님 (invalidate()/clear()로만 제거)
+        self._pinned: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.RLock()
+        self._flights = SingleFlight()
+        # 무효화 세대 - 무효화 전에 시작한 조회와 병합/저장하지 않음 (무효화한 범위만 증가)
+        self._epoch = 0  # clear()마다
+        self._tenant_generations: Dict[str, int] = {}  # invalidate(tenant)마다
+        self._table_generations: Dict[Tuple[str, str], int] = {}  # invalidate(tenant, table[, key])마다
+
+    # ========================================================================
+    # 조회 / 저장
+    # ========================================================================
+
+    def get(self, tenant: str, table: str, key: str) -> Tuple[bool, Any]:
+        """
+        캐시 조회
+
+        Returns:
+            (적중 여부, 값) - 만료된 항목은 제거 후 미적중 처리
+        """
+        entry_key = (tenant, table, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(entry_key)
+                self._count(tenant, table, 'hits')
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[entry_key]
+                self._count(tenant, table, 'expired')
+            self._count(tenant, table, 'misses')
+            return False, None
+
+    def set(self, tenant: str, table: str, key: str, value: Any, ttl_sec: Optional[float] = None) -> None:
+        """캐시 저장 (상한 초과 시 가장 오래 사용하지 않은 항목부터 제거)"""
+        ttl = ttl_sec if ttl_sec is not None else self.table_ttl_sec.get(table, self.ttl_sec)
+        entry_key = (tenant, table, key)
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                (old_tenant, old_table, _), _ = self._entries.popitem(last=False)
+                self._count(old_tenant, old_table, 'evictions')
+
+    def get_or_load(self, tenant: str, table: str, key: str, loader: Callable[[], Any],
+                    ttl_sec: Optional[float] = None, copy: bool = True) -> Any:
+        """
+        read-through 조회: 미적중이면 loader() 결과를 저장 후 반환
+
+        loader에서 발생한 예외는 캐시하지 않고 그대로 전달한다.
+        같은 키가 동시에 미적중이면 loader는 한 번만 실행되고 나머지는 그 결과를 기다린다.
+
+        Args:
+            copy: True면 호출자가 수정해도 캐시가 오염되지 않도록 사본 반환
+                (DataFrame/dict/list)
+        """
+        hit, value = self.get(tenant, table, key)
+        if not hit:
+            entry_key = (tenant, table, key)
+            with self._lock:
+                generation = self._scope_generation(tenant, table)
+
+            def load():
+                with self._lock:
+                    entry = self._entries.get(entry_key)
+                    if entry is not None and entry[0] > time.monotonic():
+                        return entry[1]  # 앞선 병합 조회가 방금 저장
+                loaded = loader()
+                with self._lock:
+                    if self._scope_generation(tenant, table) == generation:
+                        self.set(tenant, table, key, loaded, ttl_sec)
+                return loaded
+
+            value = self.coalesce(tenant, table, key, load)
+        return self._detach(value) if copy else value
+
+    def get_pinned(self, tenant: str, table: str, key: str) -> Tuple[bool, Any]:
+        """
+        pin()한 항목 조회
+
+        Returns:
+            (있는지 여부, 값)
+        """
+        with self._lock:
+            entry_key = (tenant, table, key)
+            if entry_key in self._pinned:
+                return True, self._pinned[entry_key]
+            return False, None
+
+    def pin(self, tenant: str, table: str, key: str, value: Any,
+            generation: Optional[Tuple[int, int, int]] = None) -> bool:
+        """
+        만료/LRU 제거 없이 보관 (캐시 항목이 많아져도 밀려나지 않음)
+
+        Args:
+            generation: generation()으로 받아 둔 무효화 세대 (그 사이 무효화됐으면 저장하지 않음)
+
+        Returns:
+            저장했는지 여부
+        """
+        with self._lock:
+            if generation is not None and self._scope_generation(tenant, table) != generation:
+                return False
+            self._pinned[(tenant, table, key)] = value
+            return True
+
+    def generation(self, tenant: str, table: str) -> Tuple[int, int, int]:
+        """(tenant, table)의 현재 무효화 세대 (pin()의 generation 인자용)"""
+        with self._lock:
+            return self._scope_generation(tenant, table)
+
+    def coalesce(self, tenant: str, table: str, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        캐시를 거치지 않는 조회의 동시 실행 병합 (테넌트/테이블 무효화 세대가 같은 같은 키끼리만)
+
+        Args:
+            tenant: 테넌트 ID
+            table: 테이블명
+            key: 조회 키 (버전/워터마크 등 결과를 구분하는 값 포함)
+            fn: 조회 함수
+
+        Returns:
+            fn() 결과 (병합된 호출끼리 공유하므로 수정 금지)
+        """
+        with self._lock:
+            generation = self._scope_generation(tenant, table)
+        return self._flights.do((tenant, table, key, generation), fn)
+
+    def _scope_generation(self, tenant: str, table: str) -> Tuple[int, int, int]:
+        """(tenant, table)의 무효화 세대 (락을 잡은 상태에서 호출)"""
+        return (self._epoch, self._tenant_generations.get(tenant, 0),
+                self._table_generations.get((tenant, table), 0))
+
+    @staticmethod
+    def _detach(value: Any) -> Any:
+        """캐시 값의 사본 생성"""
+        if isinstance(value, pd.DataFrame):
+            return value.copy()
+        if isinstance(value, dict):
+            return dict(value)
+        if isinstance(value, list):
+            return list(value)
+        return value
+
+    # ========================================================================
+    # 무효화 / 통계
+    # ========================================================================
+
+    def invalidate(self, tenant: str, table: Optional[str] = None, key: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            tenant: 테넌트 ID
+            table: None이면 테넌트 전체
+            key: None이면 테이블 전체
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            targets = [
+                k for k in self._entries
+                if k[0] == tenant and (table is None or k[1] == table) and (key is None or k[2] == key)
+            ]
+            for k in targets:
+                del self._entries[k]
+                self._count(k[0], k[1], 'invalidations')
+            pinned = [
+                k for k in self._pinned
+                if k[0] == tenant and (table is None or k[1] == table) and (key is None or k[2] == key)
+            ]
+            for k in pinned:
+                del self._pinned[k]
+                self._count(k[0], k[1], 'invalidations')
+            if table is None:
+                self._tenant_generations[tenant] = self._tenant_generations.get(tenant, 0) + 1
+            else:
+                self._table_generations[(tenant, table)] = self._table_generations.get((tenant, table), 0) + 1
+            return len(targets) + len(pinned)
+
+    def clear(self) -> None:
+        """전체 캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self._counters.clear()
+            self._epoch += 1
+            self._tenant_generations.clear()
+            self._table_generations.clear()
+        self._flights.clear()
+
+    def stats(self, tenant: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        테이블별 적중/미적중 통계
+
+        Returns:
+            {'tenant/table': {'hits', 'misses', 'hit_rate', 'entries', ...}}
+        """
+        with self._lock:
+            entries: Dict[Tuple[str, str], int] = {}
+            for t, table, _ in list(self._entries) + list(self._pinned):
+                entries[(t, table)] = entries.get((t, table), 0) + 1
+
+            result = {}
+            for (t, table), counter in self._counters.items():
+                if tenant is not None and t != tenant:
+                    continue
+                lookups = counter.get('hits', 0) + counter.get('misses', 0)
+                result[f"{t}/{table}"] = {
+                    **counter,
+                    'hit_rate': round(counter.get('hits', 0) / lookups, 3) if lookups else 0.0,
+                    'entries': entries.get((t, table), 0),
+                }
+            return result
+
+    def flight_stats(self, tenant: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        키별 동시 조회 병합 통계 (무효화 세대 합산)
+
+        Returns:
+            {'tenant/table/key': {'calls', 'runs', 'shared', 'wait_sec', 'max_wait_sec', ...}}
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        flights = self._flights.stats(lambda k: tenant is None or k[0] == tenant)
+        for (t, table, key, _), stats in flights.items():
+            merged = result.setdefault(f"{t}/{table}/{key}", {})
+            for name, value in stats.items():
+                if name.startswith('max_'):
+                    merged[name] = max(merged.get(name, 0), value)
+                elif name != 'avg_wait_sec':
+                    merged[name] = merged.get(name, 0) + value
+        for merged in result.values():
+            merged.update({name: round(value, 4) for name, value in merged.items() if isinstance(value, float)})
+            merged['avg_wait_sec'] = round(merged['wait_sec'] / merged['shared'], 4) if merged['shared'] else 0.0
+        return result
+
+    def _count(self, tenant: str, table: str, name: str) -> None:
+        counter = self._counters.setdefault((tenant, table), {})
+        counter[name] = counter.get(name, 0) + 1
+
+
+# ========================================================================
+# 프로세스 공유 인스턴스
+# ========================================================================
+
+_engine_cache: Optional[EngineCache] = None
+_engine_cache_lock = threading.Lock()
+
+
+def get_engine_cache() -> EngineCache:
+    """
+    프로세스 공유 EngineCache 반환 (최초 호출 시 생성)
+
+    Returns:
+        EngineCache 인스턴스
+    """
+    global _engine_cache
+    with _engine_cache_lock:
+        if _engine_cache is None:
+            _engine_cache = EngineCache()
+        return _engine_cache
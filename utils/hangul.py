@@ -0,0 +1,96 @@
+"""
+한글 자모 유틸리티 - 초성/자모 분해 검색용 변환
+'ㅊㅇ' → 차양, 'ㅈㅈㄱ' → 자전거보관대, '자저' (입력 중인 음절) → 자전거 매칭에 사용
+
+- decompose_jamo: 음절을 호환 자모로 분해 (겹받침/이중모음도 분해)
+- chosung: 음절별 초성 (한글이 아닌 글자는 그대로)
+- is_chosung_query: 초성(자음)만으로 된 검색어인지
+"""
+
+from functools import lru_cache
+
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+JUNGSUNG_COUNT = 21
+JONGSUNG_COUNT = 28
+
+CHOSUNG_LIST = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSUNG_LIST = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSUNG_LIST = ' ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
+
+# 이중모음/겹받침 → 구성 자모 (입력 중인 음절도 앞부분이 일치하도록)
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+CONSONANTS = set('ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ')
+
+
+def _is_syllable(char: str) -> bool:
+    return HANGUL_BASE <= ord(char) <= HANGUL_END
+
+
+def _is_jamo(char: str) -> bool:
+    return 0x3131 <= ord(char) <= 0x3163
+
+
+@lru_cache(maxsize=8192)
+def decompose_jamo(text: str) -> str:
+    """
+    자모 분해 문자열 (소문자, 공백 제거)
+
+    Args:
+        text: 원문 (예: '차양')
+
+    Returns:
+        자모 문자열 (예: 'ㅊㅏㅇㅑㅇ')
+    """
+    out = []
+    for char in str(text).lower():
+        if char.isspace():
+            continue
+        if _is_syllable(char):
+            code = ord(char) - HANGUL_BASE
+            jong = code % JONGSUNG_COUNT
+            jung = (code // JONGSUNG_COUNT) % JUNGSUNG_COUNT
+            cho = code // (JONGSUNG_COUNT * JUNGSUNG_COUNT)
+            parts = CHOSUNG_LIST[cho] + JUNGSUNG_LIST[jung] + (JONGSUNG_LIST[jong] if jong else '')
+            out.append(''.join(COMPOUND_JAMO.get(part, part) for part in parts))
+        else:
+            out.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(out)
+
+
+@lru_cache(maxsize=8192)
+def chosung(text: str) -> str:
+    """
+    초성 문자열 (소문자, 공백 제거, 한글이 아닌 글자는 그대로)
+
+    Args:
+        text: 원문 (예: '자전거보관대')
+
+    Returns:
+        초성 문자열 (예: 'ㅈㅈㄱㅂㄱㄷ')
+    """
+    out = []
+    for char in str(text).lower():
+        if char.isspace():
+            continue
+        if _is_syllable(char):
+            out.append(CHOSUNG_LIST[(ord(char) - HANGUL_BASE) // (JONGSUNG_COUNT * JUNGSUNG_COUNT)])
+        else:
+            out.append(char)
+    return ''.join(out)
+
+
+def is_chosung_query(query: str) -> bool:
+    """초성(자음)만으로 된 검색어인지 (공백 무시)"""
+    chars = [char for char in str(query) if not char.isspace()]
+    return bool(chars) and all(char in CONSONANTS for char in chars)
+
+
+def has_hangul(text: str) -> bool:
+    """한글 음절 또는 자모가 포함되어 있는지"""
+    return any(_is_syllable(char) or _is_jamo(char) for char in str(text))
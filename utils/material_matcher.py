@@ -0,0 +1,222 @@
+"""
+MaterialMatcher - 전개된 BOM의 자재 단가/완전규격 일괄 매칭
+main_materials는 (품목, 규격 키) 해시 인덱스로 조인하고, 남은 행만 sub_materials에서 찾는다
+
+매칭 우선순위 (기존 행 단위 조회와 동일):
+1. main_materials: 품목 == 카테고리 and 규격 키 일치 (첫 행)
+2. sub_materials: 품목에 자재명 포함 (대소문자 무시, 첫 행)
+3. sub_materials: 정규화 규격에 BOM 규격 포함 (첫 행)
+4. 매칭 실패 → 빈 결과 + 미매칭 리포트
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.spec_parser import normalize_spec, spec_key, spec_key_series, spec_norm_series
+
+
+LOOKUP_COLUMNS = ['category', 'standard', 'material_name']
+RESULT_COLUMNS = ['완전규격', '단가', '품목', '규격']
+DEFAULT_PIPE_LENGTH_M = 6.0
+PIPE_WORDS = ('PIPE', '파이프')
+
+# 미매칭 사유
+REASON_SPEC_MISSING = '카테고리 있음, 규격 불일치 (부자재에도 없음)'
+REASON_NOT_FOUND = '주자재/부자재 모두 없음'
+
+
+def _is_pipe_category(category: str) -> bool:
+    upper = category.upper()
+    return any(word in upper for word in PIPE_WORDS)
+
+
+class MaterialMatcher:
+    """
+    자재 일괄 매칭기 (카탈로그 버전당 한 번 생성)
+
+    Usage:
+        matcher = MaterialMatcher(data['main_materials'], data['sub_materials'])
+        matches = matcher.match(exploded[['category', 'standard', 'material_name']])
+        report = MaterialMatcher.unmatched_report(matches)
+    """
+
+    def __init__(self, main_materials: Optional[pd.DataFrame], sub_materials: Optional[pd.DataFrame]):
+        """
+        MaterialMatcher 초기화
+
+        Args:
+            main_materials: load_data()['main_materials'] (품목/규격/단가/파이프길이(m))
+            sub_materials: load_data()['sub_materials'] (품목/규격/단가)
+        """
+        # main_materials: (품목, 규격 키) → 첫 행
+        self._main_index = pd.DataFrame()
+        self._main_categories = set()
+        if isinstance(main_materials, pd.DataFrame) and not main_materials.empty and '품목' in main_materials.columns:
+            keyed = pd.DataFrame({
+                '_category': main_materials['품목'].astype(str).str.strip(),
+                '_spec_key': spec_key_series(main_materials, '규격') if '규격' in main_materials.columns else '',
+                '_main_spec': main_materials['규격'] if '규격' in main_materials.columns else np.nan,
+                '_main_item': main_materials['품목'],
+                '_main_price': main_materials['단가'] if '단가' in main_materials.columns else np.nan,
+                '_pipe_length': (main_materials['파이프길이(m)'] if '파이프길이(m)' in main_materials.columns
+                                 else DEFAULT_PIPE_LENGTH_M),
+            }, index=main_materials.index)
+            self._main_categories = set(keyed['_category'])
+            keyed = keyed[keyed['_spec_key'] != '']
+            self._main_index = keyed.drop_duplicates(['_category', '_spec_key']).reset_index(drop=True)
+
+        self.sub_materials = sub_materials if isinstance(sub_materials, pd.DataFrame) else pd.DataFrame()
+        self._sub_names: Optional[pd.Series] = None
+        self._sub_specs: Optional[pd.Series] = None
+        if not self.sub_materials.empty:
+            if '품목' in self.sub_materials.columns:
+                self._sub_names = self.sub_materials['품목'].astype(str).str.lower()
+            if '규격' in self.sub_materials.columns:
+                self._sub_specs = spec_norm_series(self.sub_materials, '규격')
+
+        # 부분 포함 검색 결과 (자재명/규격별 첫 행 위치, 없으면 -1)
+        self._sub_by_name: Dict[str, int] = {}
+        self._sub_by_spec: Dict[str, int] = {}
+
+    # ========================================================================
+    # 일괄 매칭
+    # ========================================================================
+
+    def match(self, lookups: pd.DataFrame) -> pd.DataFrame:
+        """
+        조회 키 전체를 한 번에 매칭
+
+        Args:
+            lookups: category/standard/material_name 컬럼을 가진 DataFrame
+
+        Returns:
+            lookups와 같은 인덱스의 DataFrame
+            (완전규격, 단가, 품목, 규격, source: 'main'/'sub'/'', reason: 미매칭 사유)
+        """
+        n = len(lookups)
+        result = pd.DataFrame({
+            'category': lookups['category'].values,
+            'standard': lookups['standard'].values,
+            'material_name': lookups['material_name'].values,
+            '완전규격': [''] * n,
+            '단가': [''] * n,
+            '품목': [''] * n,
+            '규격': [''] * n,
+            'source': [''] * n,
+            'reason': [''] * n,
+        }, dtype=object)
+        if n == 0:
+            result.index = lookups.index
+            return result
+
+        categories = result['category'].astype(str)
+        matched = self._match_main(result, categories)
+
+        pending = result.index[~matched]
+        if len(pending):
+            self._match_sub(result, pending)
+
+        missing = result['source'] == ''
+        if missing.any():
+            category_found = categories.str.strip().isin(self._main_categories)
+            result.loc[missing, 'reason'] = np.where(category_found[missing], REASON_SPEC_MISSING, REASON_NOT_FOUND)
+        result.index = lookups.index
+        return result
+
+    def _match_main(self, result: pd.DataFrame, categories: pd.Series) -> pd.Series:
+        if self._main_index.empty:
+            return pd.Series(False, index=result.index)
+
+        keys = pd.DataFrame({
+            '_category': categories.str.strip().values,
+            '_spec_key': [spec_key(str(s)) for s in result['standard']],
+            '_row': np.arange(len(result)),
+        })
+        hits = keys.merge(self._main_index, on=['_category', '_spec_key'], how='inner')
+        hits = hits[hits['_spec_key'] != '']
+        if hits.empty:
+            return pd.Series(False, index=result.index)
+
+        index = result.index[hits['_row'].to_numpy()]
+        is_pipe = categories.loc[index].map(_is_pipe_category).to_numpy()
+        pipe_length = hits['_pipe_length']
+        price = pd.to_numeric(hits['_main_price'], errors='coerce').fillna(0.0).astype(float)
+        divisible = pd.to_numeric(pipe_length, errors='coerce') > 0
+        price = price.where(~(is_pipe & divisible.to_numpy()), price / pd.to_numeric(pipe_length, errors='coerce'))
+        main_spec = hits['_main_spec'].astype(str).str.strip()
+        full_spec = main_spec.where(~is_pipe, main_spec + '×' + pipe_length.map(str) + 'm')
+
+        result.loc[index, '완전규격'] = full_spec.to_numpy()
+        result.loc[index, '단가'] = price.to_numpy()
+        result.loc[index, '품목'] = hits['_main_item'].to_numpy()
+        result.loc[index, '규격'] = hits['_main_spec'].to_numpy()
+        result.loc[index, 'source'] = 'main'
+        return result['source'] == 'main'
+
+    def _match_sub(self, result: pd.DataFrame, pending: pd.Index) -> None:
+        if self.sub_materials.empty:
+            return
+
+        positions = []
+        for material_name, standard in zip(result.loc[pending, 'material_name'], result.loc[pending, 'standard']):
+            pos = -1
+            if material_name and self._sub_names is not None:
+                pos = self._first_sub_by_name(str(material_name))
+            if pos < 0 and self._sub_specs is not None:
+                pos = self._first_sub_by_spec(normalize_spec(str(standard)))
+            positions.append(pos)
+
+        positions = np.asarray(positions, dtype=int)
+        found = positions >= 0
+        if not found.any():
+            return
+        rows = self.sub_materials.iloc[positions[found]]
+        index = pending[found]
+        if '단가' in rows.columns:
+            price = pd.to_numeric(rows['단가'], errors='coerce').fillna(0.0).astype(float).to_numpy()
+        else:
+            price = np.zeros(len(rows))
+        specs = rows['규격'] if '규격' in rows.columns else pd.Series('', index=rows.index)
+        result.loc[index, '완전규격'] = specs.astype(str).str.strip().to_numpy()
+        result.loc[index, '단가'] = price
+        result.loc[index, '품목'] = rows['품목'].to_numpy() if '품목' in rows.columns else ''
+        result.loc[index, '규격'] = specs.to_numpy()
+        result.loc[index, 'source'] = 'sub'
+
+    def _first_sub_by_name(self, material_name: str) -> int:
+        if material_name not in self._sub_by_name:
+            hits = np.flatnonzero(self._sub_names.str.contains(material_name.lower(), regex=False).to_numpy())
+            self._sub_by_name[material_name] = int(hits[0]) if len(hits) else -1
+        return self._sub_by_name[material_name]
+
+    def _first_sub_by_spec(self, normalized: str) -> int:
+        if normalized not in self._sub_by_spec:
+            hits = np.flatnonzero(self._sub_specs.str.contains(normalized, regex=False).to_numpy())
+            self._sub_by_spec[normalized] = int(hits[0]) if len(hits) else -1
+        return self._sub_by_spec[normalized]
+
+    # ========================================================================
+    # 단건 조회 / 리포트
+    # ========================================================================
+
+    @staticmethod
+    def unmatched_report(matches: pd.DataFrame) -> pd.DataFrame:
+        """
+        미매칭 조회 키 리포트
+
+        Args:
+            matches: match() 결과
+
+        Returns:
+            카테고리/규격/자재명/사유 DataFrame (미매칭 없으면 빈 DataFrame)
+        """
+        missing = matches[matches['source'] == '']
+        return pd.DataFrame({
+            '카테고리': missing['category'].astype(str).values,
+            '규격': missing['standard'].astype(str).values,
+            '자재명': missing['material_name'].astype(str).values,
+            '사유': missing['reason'].values,
+        })
+
@@ -0,0 +1,726 @@
+"""
+ModelSearchIndex - 모델 검색용 역색인 (카탈로그 버전당 한 번 구축)
+EnhancedModelSearch의 컬럼별 전체 스캔을 n-gram 포스팅 조회로 대체
+
+- 컬럼별 정규화 문자열 (x/X → *, 소문자)과 고유값 단위 3-gram 포스팅
+- 식별번호 검색도 같은 포스팅 사용 (숫자 부분 문자열)
+- 치수 검색(w2000, w1800-2200, w~2000)은 숫자 치수 정렬 색인 (DimensionIndex)
+- 관련도 점수는 기존 가중치 그대로, 점수 상한으로 가지치기하며 상위 k개만 힙으로 선택
+- 유사 검색: 모델명/규격/식별번호의 패딩 3-gram 포스팅으로 오타 허용 (Dice 유사도)
+- 한글 검색: 모델명/카테고리의 초성·자모 분해 포스팅 ('ㅊㅇ' → 차양, '자저' → 자전거...)
+"""
+
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Tuple
+import heapq
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.catalog_index import table_version
+from utils.dimension_index import DimensionIndex, parse_dimension_query
+from utils.engine_cache import EngineCache
+from utils.hangul import chosung, decompose_jamo, has_hangul, is_chosung_query
+
+
+SEARCH_COLUMNS = ['model_name', 'category', 'model_standard', '식별번호', 'description']
+NGRAM_SIZE = 3
+INDEX_CACHE_SIZE = 4  # 보관할 카탈로그 버전(인덱스) 수
+QUERY_CACHE_SIZE = 512  # 최근 검색어 → 결과 행 위치 LRU 크기 (전체 테넌트 합)
+QUERY_CACHE_TTL_SEC = 600
+
+# 관련도 가중치 (EnhancedModelSearch와 동일)
+TYPE_SCORES = {'identifier': 100, 'dimension': 80, 'partial': 50}
+COLUMN_WEIGHTS = {'model_name': 30, 'category': 20, 'model_standard': 25, '식별번호': 35, 'description': 10}
+SIMILARITY_WEIGHT = 50
+CONTAINS_BONUS = 20
+
+# 유사(오타 허용) 검색
+FUZZY_COLUMNS = ['model_name', 'model_standard', '식별번호']
+FUZZY_THRESHOLD = 0.45  # 3-gram Dice 유사도 하한
+_FUZZY_STRIP_PATTERN = re.compile(r'[\s\-_./]+')
+
+# 한글(초성/자모) 검색
+HANGUL_COLUMNS = ['model_name', 'category']
+HANGUL_MATCH_SCORE = 40  # 일치 검색(partial 50)보다 낮은 순위
+
+
+
+def normalize_search_string(s) -> str:
+    """검색 문자열 정규화: x 와 * 를 모두 * 로 통일, 소문자"""
+    if not isinstance(s, str):
+        return str(s)
+    return s.replace('x', '*').replace('X', '*').lower()
+
+
+def _ngrams(text: str, n: int = NGRAM_SIZE) -> set:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def fuzzy_key(text: str) -> str:
+    """유사 검색 키 (정규화 + 공백/하이픈/구분자 제거: 'DAL01-2000' → 'dal012000')"""
+    return _FUZZY_STRIP_PATTERN.sub('', normalize_search_string(text))
+
+
+def fuzzy_grams(key: str) -> set:
+    """패딩 3-gram (짧은 문자열/앞뒤 글자도 비교되도록 양끝에 공백 패딩)"""
+    return _ngrams(f"  {key} ") if key else set()
+
+
+class SubstringIndex:
+    """
+    컬럼 하나의 부분 일치 색인 (정규화 고유값 + n-gram 포스팅, 고유값 id → 행 위치 목록)
+
+    Usage:
+        index = SubstringIndex(models['model_name'].astype(str).tolist())
+        index.find('dal')          # 'dal'을 포함하는 행 위치
+        index.find('dal0', rows)   # rows 안에서만 확인 (검색어가 길어질 때)
+    """
+
+    def __init__(self, values: List[str], normalize: Callable[[str], str] = normalize_search_string):
+        """
+        SubstringIndex 초기화
+
+        Args:
+            values: 행 순서의 원문 문자열 목록
+            normalize: 색인/검색어 정규화 함수
+        """
+        self.raw_values: List[str] = values
+        self.raw_lower: List[str] = [value.lower() for value in values]
+        normalized = [normalize(value) for value in values]
+
+        self.uniques: List[str] = []
+        self.rows: List[List[int]] = []
+        self.row_uids: List[int] = []
+        unique_ids: Dict[str, int] = {}
+        for pos, text in enumerate(normalized):
+            uid = unique_ids.get(text)
+            if uid is None:
+                uid = unique_ids[text] = len(self.uniques)
+                self.uniques.append(text)
+                self.rows.append([])
+            self.rows[uid].append(pos)
+            self.row_uids.append(uid)
+
+        self.postings: Dict[str, List[int]] = {}
+        for uid, text in enumerate(self.uniques):
+            for gram in _ngrams(text):
+                self.postings.setdefault(gram, []).append(uid)
+
+        # 유사 검색용 포스팅은 첫 유사 검색 때 구축
+        self._fuzzy_sizes: Optional[List[int]] = None
+        self._fuzzy_postings: Dict[str, List[int]] = {}
+
+    def find(self, needle: str, within: Optional[List[int]] = None) -> List[int]:
+        """
+        정규화 값에 needle을 포함하는 행 위치 (행 순서)
+
+        Args:
+            needle: 정규화된 검색어
+            within: 후보 행 위치 (행 순서, None이면 전체) - needle을 포함하는 행이 모두 들어 있어야 함
+        """
+        if within is not None:
+            uniques, row_uids = self.uniques, self.row_uids
+            return [pos for pos in within if needle in uniques[row_uids[pos]]]
+        if len(needle) < NGRAM_SIZE:
+            candidates = range(len(self.uniques))
+        else:
+            grams = sorted(_ngrams(needle), key=lambda g: len(self.postings.get(g, ())))
+            if not grams or grams[0] not in self.postings:
+                return []
+            candidate_set = set(self.postings[grams[0]])
+            for gram in grams[1:]:
+                candidate_set.intersection_update(self.postings[gram])
+                if not candidate_set:
+                    return []
+            candidates = candidate_set
+
+        positions: List[int] = []
+        for uid in candidates:
+            if needle in self.uniques[uid]:
+                positions.extend(self.rows[uid])
+        positions.sort()
+        return positions
+
+    def prepare_fuzzy(self) -> None:
+        """유사 검색용 포스팅 구축 (이미 있으면 그대로)"""
+        if self._fuzzy_sizes is None:
+            self._build_fuzzy()
+
+    def _build_fuzzy(self) -> None:
+        postings: Dict[str, List[int]] = {}
+        sizes = []
+        for uid, text in enumerate(self.uniques):
+            grams = fuzzy_grams(fuzzy_key(text))
+            sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(uid)
+        self._fuzzy_postings = postings
+        self._fuzzy_sizes = sizes
+
+    def find_similar(self, query_grams: set, threshold: float) -> Dict[int, float]:
+        """
+        3-gram Dice 유사도가 threshold 이상인 행 {행 위치: 유사도}
+
+        query와 3-gram을 하나 이상 공유하는 고유값만 비교한다.
+        """
+        self.prepare_fuzzy()
+        if not query_grams:
+            return {}
+
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for uid in self._fuzzy_postings.get(gram, ()):
+                shared[uid] = shared.get(uid, 0) + 1
+
+        similar: Dict[int, float] = {}
+        query_size = len(query_grams)
+        for uid, count in shared.items():
+            similarity = 2.0 * count / (query_size + self._fuzzy_sizes[uid])
+            if similarity >= threshold:
+                for pos in self.rows[uid]:
+                    similar[pos] = similarity
+        return similar
+
+
+class QueryNarrowing:
+    """
+    타이핑 중 검색 범위 축소 상태 (검색창/세션별로 하나)
+
+    새 검색어가 이전 검색어를 포함하면(예: 'da' → 'dal') 새 검색어를 포함하는 행은
+    이전 검색어의 결과 안에 모두 있으므로, 이전 결과 행만 다시 확인한다.
+    카탈로그 버전이 바뀌면 상태를 버린다.
+
+    Usage:
+        narrowing = st.session_state.setdefault('quote_search_narrowing', QueryNarrowing(tenant_id))
+        index.search(query, narrowing=narrowing)
+    """
+
+    MAX_NEEDLES = 4  # 색인(컬럼)별로 기억할 최근 검색어 수
+
+    def __init__(self, tenant_id: Optional[str] = None):
+        """
+        QueryNarrowing 초기화
+
+        Args:
+            tenant_id: 이 상태를 쓰는 테넌트 ID (테넌트가 바뀌면 호출자가 새로 생성)
+        """
+        self.tenant_id = tenant_id
+        self.version: Optional[str] = None
+        self._needles: Dict[Tuple[str, ...], List[Tuple[str, List[int]]]] = {}
+        self.narrowed = 0  # 이전 결과 안에서만 확인한 횟수
+        self.full = 0  # 전체 색인을 조회한 횟수
+
+    def find(self, version: Optional[str], key: Tuple[str, ...], index: SubstringIndex, needle: str) -> List[int]:
+        """
+        index.find(needle) - 이전 검색어 결과로 범위를 줄여서 조회
+
+        Args:
+            version: 색인의 카탈로그(테이블) 버전
+            key: 색인 식별자 (예: ('partial', 'model_name'))
+            index: SubstringIndex
+            needle: 정규화된 검색어
+
+        Returns:
+            행 위치 목록 (행 순서)
+        """
+        if version != self.version:
+            self._needles.clear()
+            self.version = version
+
+        previous = self._needles.get(key, [])
+        within = None
+        for prev_needle, rows in previous:
+            if prev_needle in needle and (within is None or len(rows) < len(within)):
+                within = rows
+        if within is None:
+            self.full += 1
+        else:
+            self.narrowed += 1
+        rows = index.find(needle, within)
+
+        self._needles[key] = ([(needle, rows)] + [p for p in previous if p[0] != needle])[:self.MAX_NEEDLES]
+        return rows
+
+
+def find_narrowed(index: SubstringIndex, needle: str, narrowing: Optional[QueryNarrowing],
+                  version: Optional[str], key: Tuple[str, ...]) -> List[int]:
+    """index.find(needle) - narrowing이 있으면 이전 검색어 결과 안에서만 확인"""
+    if narrowing is None:
+        return index.find(needle)
+    return narrowing.find(version, key, index, needle)
+
+
+class HangulIndex:
+    """
+    초성/자모 분해 부분 일치 색인 (한글 검색어 전용)
+
+    Usage:
+        index = HangulIndex(sub_materials['품목'].astype(str).tolist())
+        index.find('ㅂㅌ')   # 볼트가 포함된 행 위치
+    """
+
+    def __init__(self, values: List[str]):
+        """
+        HangulIndex 초기화
+
+        Args:
+            values: 행 순서의 원문 문자열 목록
+        """
+        self.chosung = SubstringIndex(values, chosung)
+        self.jamo = SubstringIndex(values, decompose_jamo)
+
+    def find(self, query: str, narrowing: Optional[QueryNarrowing] = None,
+             version: Optional[str] = None, scope: str = '') -> List[int]:
+        """
+        초성 검색어는 초성 문자열에서, 그 외 한글 검색어는 자모 분해 문자열에서 부분 일치
+
+        Args:
+            query: 검색어 (한글이 없으면 빈 결과)
+            narrowing: 타이핑 중 범위 축소 상태 (None이면 전체 조회)
+            version: 색인 버전 (narrowing 상태 무효화 판단용)
+            scope: narrowing 상태에서 이 색인을 구분할 이름
+
+        Returns:
+            행 위치 목록 (행 순서)
+        """
+        query = str(query).strip()
+        if not query or not has_hangul(query):
+            return []
+        if is_chosung_query(query):
+            return find_narrowed(self.chosung, chosung(query), narrowing, version, ('chosung', scope))
+        return find_narrowed(self.jamo, decompose_jamo(query), narrowing, version, ('jamo', scope))
+
+
+class ModelSearchIndex:
+    """
+    모델 검색 역색인
+
+    Usage:
+        index = ModelSearchIndex(data['models'])
+        results = index.search('W2000', max_results=50)
+    """
+
+    def __init__(self, models_df: pd.DataFrame, version: Optional[str] = None):
+        """
+        ModelSearchIndex 초기화
+
+        Args:
+            models_df: load_data()['models']
+            version: models 테이블 버전 (None이면 계산)
+        """
+        self.models_df = models_df if isinstance(models_df, pd.DataFrame) else pd.DataFrame()
+        self.version = version or table_version(self.models_df)
+        self.columns: Dict[str, SubstringIndex] = {
+            column: SubstringIndex([str(value) for value in self.models_df[column].tolist()])
+            for column in SEARCH_COLUMNS if column in self.models_df.columns
+        }
+        self._dedupe_keys = self._build_dedupe_keys()
+        # 중복 제거 키의 정수 ID (행 위치 배열로 모델 단위 집계)
+        key_ids: Dict[object, int] = {}
+        self._dedupe_ids = np.array([key_ids.setdefault(key, len(key_ids)) for key in self._dedupe_keys],
+                                    dtype=np.int64)
+        self._lengths: Dict[str, np.ndarray] = {}
+        # 한글/치수 검색 색인은 첫 한글/치수 검색 때 구축 (워밍에서는 prepare()로 미리 구축)
+        self._hangul: Optional[Dict[str, HangulIndex]] = None
+        self._dimensions: Optional[DimensionIndex] = None
+
+    def _build_dedupe_keys(self) -> List[object]:
+        """중복 제거 키 (model_id, 없으면 model_name, NULL이면 행별로 구분)"""
+        n = len(self.models_df)
+        ids = self.models_df['model_id'].tolist() if 'model_id' in self.models_df.columns else [''] * n
+        names = self.models_df['model_name'].tolist() if 'model_name' in self.models_df.columns else [''] * n
+        keys = []
+        for pos, (model_id, model_name) in enumerate(zip(ids, names)):
+            if pd.notna(model_id) and model_id:
+                keys.append(model_id)
+            elif pd.notna(model_name) and model_name:
+                keys.append(model_name)
+            else:
+                keys.append(('__row__', pos))
+        return keys
+
+    def __len__(self) -> int:
+        return len(self.models_df)
+
+    def prepare(self) -> 'ModelSearchIndex':
+        """
+        첫 검색 때 구축하던 색인을 미리 구축 (백그라운드 워밍용)
+
+        초성/자모 색인, 유사 검색 포스팅, 치수 색인, 점수 상한용 값 길이
+
+        Returns:
+            self
+        """
+        self._hangul_indexes()
+        for column in FUZZY_COLUMNS:
+            if column in self.columns:
+                self.columns[column].prepare_fuzzy()
+        self.dimension_index()
+        for column in self.columns:
+            self._value_lengths(column)
+        return self
+
+    # ========================================================================
+    # 검색
+    # ========================================================================
+
+    def search(self, query: str, max_results: int = 50, fuzzy: bool = False,
+               narrowing: Optional[QueryNarrowing] = None, tenant: Optional[str] = None) -> pd.DataFrame:
+        """
+        통합 검색 (식별번호 / 치수 / 컬럼 부분 일치)
+
+        Args:
+            query: 검색어
+            max_results: 최대 결과 수
+            fuzzy: True면 일치 결과가 없을 때 유사(오타 허용) 검색 결과 반환
+            narrowing: 타이핑 중 범위 축소 상태 (검색창별 QueryNarrowing, None이면 매번 전체 조회)
+            tenant: 테넌트 ID (지정하면 테넌트별 최근 검색 결과 LRU 사용)
+
+        Returns:
+            관련도 내림차순 모델 DataFrame (동점은 먼저 찾은 모델 우선, 없으면 빈 DataFrame)
+            한글 검색어는 일치 결과 뒤에 초성/자모 일치 결과를 덧붙임
+            유사 검색 결과는 attrs['match_mode'] == 'fuzzy'
+        """
+        if not query or not query.strip():
+            return self.models_df.head(20)
+
+        query = query.strip()
+
+        def run():
+            return self.ranked_positions(query, max_results, fuzzy, narrowing)
+
+        if tenant:
+            positions, mode = cached_search_positions(
+                tenant, 'model_search', self.version, f"{max_results}|{int(fuzzy)}|{query}", run
+            )
+        else:
+            positions, mode = run()
+        if not positions:
+            return pd.DataFrame()
+        result = self.models_df.iloc[list(positions)].reset_index(drop=True)
+        if mode == 'fuzzy':
+            result.attrs['match_mode'] = 'fuzzy'
+        return result
+
+    def ranked_positions(self, query: str, max_results: int = 50, fuzzy: bool = False,
+                         narrowing: Optional[QueryNarrowing] = None) -> Tuple[Tuple[int, ...], str]:
+        """
+        search()의 결과 행 위치와 검색 방식
+
+        Returns:
+            (행 위치 tuple, 'exact' 또는 'fuzzy')
+        """
+        positions = self.search_positions(query, max_results, narrowing)
+        if len(positions) < max_results:
+            positions += self.hangul_positions(query, max_results - len(positions), exclude=positions,
+                                               narrowing=narrowing)
+        if not positions and fuzzy:
+            return tuple(self.fuzzy_positions(query, max_results)), 'fuzzy'
+        return tuple(positions), 'exact'
+
+    def hangul_positions(self, query: str, max_results: int = 50, exclude: Optional[List[int]] = None,
+                         narrowing: Optional[QueryNarrowing] = None) -> List[int]:
+        """
+        초성/자모 검색 결과 행 위치 (모델명/카테고리, 관련도 순)
+
+        Args:
+            query: 검색어 (한글이 없으면 빈 결과)
+            max_results: 최대 결과 수
+            exclude: 이미 찾은 행 위치 (같은 모델은 제외)
+            narrowing: 타이핑 중 범위 축소 상태
+
+        Returns:
+            행 위치 목록
+        """
+        if max_results <= 0 or not has_hangul(query):
+            return []
+        hits = [
+            ('initial', column, index.find(query, narrowing, self.version, column))
+            for column, index in self._hangul_indexes().items()
+        ]
+        return self._top_positions(hits, query.lower(), max_results,
+                                   type_scores={'initial': HANGUL_MATCH_SCORE}, exclude=exclude)
+
+    def fuzzy_search(self, query: str, max_results: int = 50,
+                     threshold: float = FUZZY_THRESHOLD) -> pd.DataFrame:
+        """
+        유사(오타 허용) 검색 - 모델명/규격/식별번호 3-gram 유사도 순
+
+        'DLA01-2000', 'DAL012000' 처럼 철자가 바뀌거나 구분자가 빠진 검색어도 찾는다.
+
+        Args:
+            query: 검색어
+            max_results: 최대 결과 수
+            threshold: Dice 유사도 하한 (0~1)
+
+        Returns:
+            유사도 내림차순 모델 DataFrame (attrs['match_mode'] == 'fuzzy', 없으면 빈 DataFrame)
+        """
+        positions = self.fuzzy_positions(query, max_results, threshold)
+        if not positions:
+            return pd.DataFrame()
+        result = self.models_df.iloc[positions].reset_index(drop=True)
+        result.attrs['match_mode'] = 'fuzzy'
+        return result
+
+    def fuzzy_positions(self, query: str, max_results: int = 50,
+                        threshold: float = FUZZY_THRESHOLD) -> List[int]:
+        """fuzzy_search()의 결과 행 위치 목록"""
+        query_grams = fuzzy_grams(fuzzy_key(str(query).strip()))
+        best: Dict[object, List] = {}
+        for column in FUZZY_COLUMNS:
+            if column not in self.columns:
+                continue
+            for pos, similarity in self.columns[column].find_similar(query_grams, threshold).items():
+                key = self._dedupe_keys[pos]
+                entry = best.get(key)
+                if entry is None or similarity > entry[0] or (similarity == entry[0] and pos < entry[1]):
+                    best[key] = [similarity, pos]
+        top = heapq.nsmallest(max_results, best.values(), key=lambda entry: (-entry[0], entry[1]))
+        return [pos for _, pos in top]
+
+    def search_positions(self, query: str, max_results: int = 50,
+                         narrowing: Optional[QueryNarrowing] = None) -> List[int]:
+        """일치 검색(식별번호/치수/부분 일치) 결과 행 위치 목록"""
+        return self._top_positions(self._hits(query, narrowing), query.lower(), max_results)
+
+    def _hits(self, query: str, narrowing: Optional[QueryNarrowing] = None) -> List[Tuple[str, str, List[int]]]:
+        """(match_type, 컬럼, 행 위치 목록) - 기존 검색 순서(식별번호 → 치수 → 컬럼)"""
+        def find(column: str, needle: str) -> List[int]:
+            return find_narrowed(self.columns[column], needle, narrowing, self.version, ('model', column))
+
+        hits = []
+        if query.isdigit() and '식별번호' in self.columns:
+            hits.append(('identifier', '식별번호', find('식별번호', query.lower())))
+
+        conditions = parse_dimension_query(query)
+        if conditions and 'model_standard' in self.columns:
+            hits.append(('dimension', 'model_standard', self.dimension_index().match(conditions)))
+
+        normalized_query = normalize_search_string(query)
+        for column in self.columns:
+            hits.append(('partial', column, find(column, normalized_query)))
+        return hits
+
+    def _hangul_indexes(self) -> Dict[str, HangulIndex]:
+        """모델명/카테고리 초성·자모 색인 (처음 호출할 때 구축)"""
+        if self._hangul is None:
+            self._hangul = {
+                column: HangulIndex(self.columns[column].raw_values)
+                for column in HANGUL_COLUMNS if column in self.columns
+            }
+        return self._hangul
+
+    def dimension_index(self) -> DimensionIndex:
+        """model_standard의 폭/높이/두께 정렬 색인 (dim_* 컬럼이 있으면 재사용)"""
+        if self._dimensions is None:
+            self._dimensions = DimensionIndex(self.models_df, 'model_standard')
+        return self._dimensions
+
+    def _top_positions(self, hits, query_lower: str, max_results: int,
+                       type_scores: Optional[Dict[str, int]] = None,
+                       exclude: Optional[List[int]] = None) -> List[int]:
+        """
+        관련도 상위 max_results개 모델의 행 위치 (모델별 첫 발견 행)
+
+        모델 점수는 일치한 컬럼 중 최고 관련도, 동점은 먼저 찾은 모델 우선.
+        일치 행마다 점수 상한(유형 + 컬럼 가중치 + 길이로 본 최대 유사도 + 포함 보너스)을 먼저 구하고,
+        상한이 높은 모델부터 실제 유사도를 계산하다가 상한이 현재 k번째 점수에 못 미치면 중단한다.
+
+        Args:
+            hits: _hits() 결과 [(match_type, 컬럼, 행 위치 목록)]
+            query_lower: 소문자 검색어
+            max_results: 최대 결과 수
+            type_scores: match_type별 점수 (None이면 TYPE_SCORES)
+            exclude: 제외할 행 위치 (같은 모델 전체 제외)
+
+        Returns:
+            행 위치 목록 (관련도 내림차순)
+        """
+        type_scores = type_scores or TYPE_SCORES
+        hits = [(match_type, column, positions) for match_type, column, positions in hits if len(positions)]
+        if max_results <= 0 or not hits:
+            return []
+
+        # 일치 행 단위 배열 (발견 순서대로 이어 붙임)
+        sizes = [len(p) for _, _, p in hits]
+        positions = np.concatenate([np.asarray(p, dtype=np.int64) for _, _, p in hits])
+        hit_no = np.repeat(np.arange(len(hits)), sizes)
+        bases = np.array([type_scores.get(match_type, 0) + COLUMN_WEIGHTS.get(column, 0)
+                          for match_type, column, _ in hits], dtype=float)[hit_no]
+        ends = np.cumsum(sizes)
+        lengths = np.concatenate([self._value_lengths(column)[positions[end - size:end]]
+                                  for (_, column, _), size, end in zip(hits, sizes, ends)])
+        # real_quick_ratio()와 같은 길이 상한, 더하는 순서도 _value_score와 같게 맞춤 (동점 판정)
+        query_len = len(query_lower)
+        ratio_bound = 2.0 * np.minimum(lengths, query_len) / (lengths + query_len)
+        bounds = bases + (ratio_bound * SIMILARITY_WEIGHT + CONTAINS_BONUS)
+
+        # 모델별로 묶음 (안정 정렬이므로 묶음 첫 행 = 첫 발견 행), 모델 상한 = 묶음 내 최대 상한
+        keys = self._dedupe_ids[positions]
+        hit_order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[hit_order]
+        group_start = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1], True])
+        first = hit_order[group_start[:-1]]
+        model_bounds = np.maximum.reduceat(bounds[hit_order], group_start[:-1])
+        if exclude:
+            excluded = np.isin(sorted_keys[group_start[:-1]], self._dedupe_ids[np.asarray(exclude, dtype=np.int64)])
+            model_bounds[excluded] = -np.inf
+
+        candidates = np.lexsort((first, -model_bounds)).tolist()
+        model_bounds, first, group_start = model_bounds.tolist(), first.tolist(), group_start.tolist()
+        values = [self.columns[column].raw_lower for _, column, _ in hits]
+        cache: Dict[str, float] = {}
+        top: List[Tuple[float, int, int]] = []  # (점수, -발견 순서, 행 위치) 최소 힙
+        for model in candidates:
+            bound = model_bounds[model]
+            if bound == -np.inf:
+                break
+            order = first[model]
+            if len(top) >= max_results:
+                floor, floor_order = top[0][0], -top[0][1]
+                if bound < floor or (bound == floor and order > floor_order):
+                    break  # 이후 모델은 상한이 더 낮음
+            else:
+                floor = -np.inf
+
+            start, end = group_start[model], group_start[model + 1]
+            if end - start == 1:
+                group = [int(hit_order[start])]
+            else:
+                group = hit_order[start:end]
+                group = group[np.argsort(-bounds[group], kind='stable')].tolist()
+            best = None
+            for hit in group:
+                if best is not None and bounds[hit] <= best:
+                    break
+                base = bases[hit]
+                score = self._value_score(values[hit_no[hit]][positions[hit]], query_lower, cache, floor - base)
+                if score is not None and (best is None or base + score > best):
+                    best = base + score
+            if best is None:
+                continue
+            entry = (float(best), -order, int(positions[order]))
+            if len(top) < max_results:
+                heapq.heappush(top, entry)
+            elif entry[:2] > top[0][:2]:
+                heapq.heapreplace(top, entry)
+        return [pos for _, _, pos in sorted(top, reverse=True)]
+
+    def _value_lengths(self, column: str) -> np.ndarray:
+        """컬럼 값(소문자) 길이 배열"""
+        lengths = self._lengths.get(column)
+        if lengths is None:
+            lengths = np.fromiter((len(value) for value in self.columns[column].raw_lower),
+                                  dtype=np.int64, count=len(self.columns[column].raw_lower))
+            self._lengths[column] = lengths
+        return lengths
+
+    @staticmethod
+    def _value_score(match_value: str, query_lower: str, cache: Dict[str, float],
+                     minimum: float = float('-inf')) -> Optional[float]:
+        """
+        검색어와 값의 유사도 점수 (SequenceMatcher 비율 × 가중치 + 포함 보너스)
+
+        Args:
+            minimum: 이 점수에 못 미치는 것이 확실하면 계산 생략 (quick_ratio 상한으로 판단)
+
+        Returns:
+            점수 (생략했으면 None)
+        """
+        score = cache.get(match_value)
+        if score is None:
+            bonus = CONTAINS_BONUS if query_lower in match_value or match_value in query_lower else 0
+            matcher = SequenceMatcher(None, query_lower, match_value)
+            if matcher.quick_ratio() * SIMILARITY_WEIGHT + bonus < minimum:
+                return None
+            score = matcher.ratio() * SIMILARITY_WEIGHT + bonus
+            cache[match_value] = score
+        return score
+
+
+# ============================================================================
+# 버전별 인덱스 캐시 (프로세스 공유)
+# ============================================================================
+
+_index_cache: "OrderedDict[str, ModelSearchIndex]" = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def get_model_search_index(models_df: pd.DataFrame, version: Optional[str] = None) -> ModelSearchIndex:
+    """
+    models 버전별 검색 인덱스 (같은 버전이면 재사용, 최근 INDEX_CACHE_SIZE개 보관)
+
+    Args:
+        models_df: load_data()['models']
+        version: models 테이블 버전 (None이면 내용으로 계산)
+
+    Returns:
+        ModelSearchIndex
+    """
+    version = version or table_version(models_df if isinstance(models_df, pd.DataFrame) else pd.DataFrame())
+    with _index_lock:
+        index = _index_cache.get(version)
+        if index is not None:
+            _index_cache.move_to_end(version)
+            return index
+
+    index = ModelSearchIndex(models_df, version)
+    with _index_lock:
+        _index_cache[version] = index
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+# ============================================================================
+# 테넌트별 최근 검색 결과 LRU
+# ============================================================================
+
+_query_cache: Optional[EngineCache] = None
+_query_versions: Dict[Tuple[str, str], Optional[str]] = {}
+_query_lock = threading.Lock()
+
+
+def get_query_cache() -> EngineCache:
+    """검색 결과 LRU (프로세스 공유, 키: (tenant, scope, '버전|검색어'))"""
+    global _query_cache
+    with _query_lock:
+        if _query_cache is None:
+            _query_cache = EngineCache(max_entries=QUERY_CACHE_SIZE, ttl_sec=QUERY_CACHE_TTL_SEC)
+        return _query_cache
+
+
+def cached_search_positions(tenant: str, scope: str, version: Optional[str], query_key: str,
+                            search: Callable[[], object]) -> object:
+    """
+    테넌트별 최근 검색 결과 조회 (미적중이면 search() 결과 저장)
+
+    scope의 색인 버전이 바뀌면 그 테넌트/scope의 저장된 결과를 모두 버린다.
+
+    Args:
+        tenant: 테넌트 ID
+        scope: 검색 종류 (예: 'model_search', 'sub_material_search')
+        version: 검색 대상 테이블 버전
+        query_key: 검색어 (+ 옵션) 키
+        search: 실제 검색 함수 (결과는 수정하지 않는 tuple 권장)
+
+    Returns:
+        search() 결과
+    """
+    cache = get_query_cache()
+    with _query_lock:
+        previous = _query_versions.get((tenant, scope))
+        _query_versions[(tenant, scope)] = version
+    if previous is not None and previous != version:
+        cache.invalidate(tenant, scope)
+    return cache.get_or_load(tenant, scope, f"{version}|{query_key}", search, copy=False)
+
+
+def query_cache_stats(tenant: Optional[str] = None) -> Dict[str, Dict[str, object]]:
+    """검색 결과 LRU 적중률 통계 {'tenant/scope': {'hits', 'misses', 'hit_rate', 'entries', ...}}"""
+    return get_query_cache().stats(tenant)
@@ -7,10 +7,15 @@ Multi-tenant 지원:
 - 모든 데이터베이스 쿼리는 tenant_id 필터링 적용
 """
 
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+import numpy as np
 import pandas as pd
 from supabase import Client
 import re
+import time
+
+from utils.engine_cache import EngineCache, get_engine_cache
 
 
 class PtopEngine:
@@ -34,39 +39,177 @@ class PtopEngine:
     # 상수
     PIPE_STANDARD_LENGTH_M = 6.0  # PIPE 발주 단위 (6m)
     VAT_RATE = 0.1  # 부가세율 10%
-
-    def __init__(self, supabase_client: Client, tenant_id: str):
+    BOM_FETCH_CHUNK_SIZE = 100  # get_boms() in_ 필터당 모델 수 (URL 길이 제한 대비)
+    BOM_WRITE_CHUNK_SIZE = 500  # add/upsert_bom_items() 요청당 행 수
+    BOM_DELETE_CHUNK_SIZE = 50  # delete_bom_items() or_ 필터당 키 수 (URL 길이 제한 대비)
+    BOM_CONFLICT_KEYS = 'tenant_id,model_id,material_name,standard'  # BOM upsert 충돌 기준
+    PRICE_TABLES = ('main_materials', 'sub_materials', 'inventory')  # 단가 조회 우선순위
+    PRICE_INDEX_TTL_SEC = 300  # 단가 인덱스 재사용 시간 (5분)
+    PAGE_SIZE = 1000  # iter_table() 페이지 크기 상한 (PostgREST 기본 max-rows)
+    TABLE_KEYS = {'models': 'model_id', 'inventory': 'item_id'}  # keyset 페이징 키 (기본 'id')
+    CATALOG_TABLES = ('models', 'pricing', 'main_materials', 'sub_materials', 'inventory')  # load_data 대상
+    CATALOG_ORDER = {'models': 'model_name', 'pricing': 'model_name'}  # 카탈로그 정렬 컬럼 (기본 'product_name')
+    SYNC_WATERMARK_COLUMN = 'updated_at'  # 증분 동기화 기준 컬럼
+    SYNC_TOMBSTONE_COLUMN = 'deleted_at'  # soft-delete 컬럼 (값이 있으면 삭제된 행)
+    SYNC_RECONCILE_SEC = 3600  # 키 대조(하드 삭제 반영) 주기 (1시간)
+
+    # 컬럼 프로필: 화면별로 실제 사용하는 컬럼만 조회 (profile=None이면 '*')
+    # - catalog-min: 모델 존재 확인 (add_bom_item 등)
+    # - editor: BOM 편집기 화면 컬럼 (v092 모델 검색/BOM 조회)
+    # 카탈로그(load_data)는 sync_table()의 전체 행 증분 동기화를 사용하므로 프로필 없음
+    COLUMN_PROFILES = {
+        'catalog-min': {
+            'models': 'model_id,model_name',
+        },
+        'editor': {
+            'models': 'model_id,model_name,category,model_standard',
+            'bom': 'model_id,material_name,standard,quantity,unit,category,created_at,updated_at',
+        },
+    }
+
+    def __init__(self, supabase_client: Client, tenant_id: str, cache: Optional[EngineCache] = None):
         """
         PtopEngine 초기화
 
         Args:
             supabase_client: Supabase 클라이언트 인스턴스
             tenant_id: 고객사 ID ('dooho', 'kukje' 등)
+            cache: 읽기 캐시 (None이면 프로세스 공유 캐시 사용)
         """
         self.db = supabase_client
         self.tenant = tenant_id
+        self.cache = cache if cache is not None else get_engine_cache()
+
+    # ========================================================================
+    # 테이블 스트리밍 조회 (keyset 페이징)
+    # ========================================================================
+
+    def iter_table(self, table: str, filters: Optional[List[Tuple]] = None, columns: str = '*',
+                   page_size: int = PAGE_SIZE, key: Optional[str] = None,
+                   prefetch: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        테넌트 테이블을 페이지 단위로 스트리밍 조회 (keyset 페이징)
+
+        OFFSET 대신 정렬 키의 마지막 값 이후(key > last)를 조회하므로
+        PostgREST 행 수 제한에 잘리지 않고, 페이지 수와 무관하게 일정한 비용으로
+        다음 페이지를 가져온다. prefetch=True면 현재 페이지를 처리하는 동안
+        백그라운드 스레드에서 다음 페이지를 미리 조회한다.
+
+        Args:
+            table: ptop 스키마 테이블명
+            filters: 추가 필터 [(메서드, 인자...), ...]
+                예) [('ilike', 'model_name', '%DAL%'), ('in_', 'model_id', ['DH001'])]
+            columns: 조회 컬럼 (콤마 구분, 정렬 키는 조회 후 제외)
+            page_size: 페이지 크기 (PAGE_SIZE 초과 시 PAGE_SIZE로 제한)
+            key: 정렬 키 (None이면 TABLE_KEYS, 기본 'id')
+            prefetch: 다음 페이지 선조회 여부
+
+        Yields:
+            페이지 DataFrame (정렬 키 오름차순)
+        """
+        key = key or self.TABLE_KEYS.get(table, 'id')
+        page_size = max(1, min(int(page_size), self.PAGE_SIZE))
+        drop_key = columns != '*' and key not in [c.strip() for c in columns.split(',')]
+        if drop_key:
+            columns = f'{columns},{key}'
+
+        def fetch_page(after) -> List[Dict]:
+            query = self.db.schema('ptop').table(table)\
+                .select(columns)\
+                .eq('tenant_id', self.tenant)
+            for method, *args in (filters or []):
+                query = getattr(query, method)(*args)
+            if after is not None:
+                query = query.gt(key, after)
+            return query.order(key).limit(page_size).execute().data or []
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            rows = fetch_page(None)
+            while rows:
+                has_more = len(rows) >= page_size
+                last_key = rows[-1].get(key)
+                next_page = executor.submit(fetch_page, last_key) if (executor and has_more) else None
+
+                page = pd.DataFrame(rows)
+                yield page.drop(columns=[key]) if drop_key else page
+
+                if not has_more or last_key is None:
+                    break
+                rows = next_page.result() if next_page else fetch_page(last_key)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _read_table(self, table: str, filters: Optional[List[Tuple]] = None, columns: str = '*',
+                    order_by: Optional[str] = None) -> pd.DataFrame:
+        """
+        iter_table() 전체 페이지를 하나의 DataFrame으로 수집
+
+        Args:
+            order_by: 수집 후 정렬할 컬럼 (안정 정렬)
+
+        Returns:
+            DataFrame (조회 결과가 없으면 빈 DataFrame)
+        """
+        pages = list(self.iter_table(table, filters=filters, columns=columns, prefetch=True))
+        if not pages:
+            return pd.DataFrame()
+        df = pd.concat(pages, ignore_index=True)
+        if order_by and order_by in df.columns:
+            df = df.sort_values(order_by, kind='stable', na_position='last').reset_index(drop=True)
+        return df
+
+    def profile_columns(self, table: str, profile: Optional[str] = None) -> str:
+        """
+        컬럼 프로필의 select 컬럼 문자열
+
+        Args:
+            table: 테이블명
+            profile: COLUMN_PROFILES 키 (None이거나 테이블이 정의되지 않은 프로필이면 '*')
+
+        Returns:
+            콤마 구분 컬럼 문자열
+
+        Raises:
+            ValueError: 알 수 없는 프로필
+        """
+        if profile is None:
+            return '*'
+        if profile not in self.COLUMN_PROFILES:
+            raise ValueError(f"알 수 없는 컬럼 프로필: {profile}")
+        return self.COLUMN_PROFILES[profile].get(table, '*')
+
+    @staticmethod
+    def _profile_key(key: str, profile: Optional[str]) -> str:
+        """프로필별 캐시 키 (같은 조회라도 컬럼이 다르면 별도 항목)"""
+        return key if profile is None else f'{key}@{profile}'
 
     # ========================================================================
     # 모델 관리
     # ========================================================================
 
-    def get_model_by_id(self, model_id: str) -> Optional[Dict]:
+    def get_model_by_id(self, model_id: str, profile: Optional[str] = None) -> Optional[Dict]:
         """
         모델 ID로 모델 정보 조회
 
         Args:
             model_id: 모델 ID (예: 'DH001')
+            profile: 컬럼 프로필 (None이면 전체 컬럼)
 
         Returns:
             모델 정보 딕셔너리 또는 None
         """
-        try:
+        def _load():
             result = self.db.schema('ptop').table('models')\
-                .select('*')\
+                .select(self.profile_columns('models', profile))\
                 .eq('tenant_id', self.tenant)\
                 .eq('model_id', model_id)\
                 .execute()
             return result.data[0] if result.data else None
+
+        try:
+            return self.cache.get_or_load(self.tenant, 'models', self._profile_key(f'id:{model_id}', profile), _load)
         except Exception as e:
             print(f"❌ get_model_by_id 오류: {e}")
             return None
@@ -81,37 +224,37 @@ class PtopEngine:
         Returns:
             모델 정보 딕셔너리 또는 None
         """
-        try:
+        def _load():
             result = self.db.schema('ptop').table('models')\
                 .select('*')\
                 .eq('tenant_id', self.tenant)\
                 .eq('model_name', model_name)\
                 .execute()
             return result.data[0] if result.data else None
+
+        try:
+            return self.cache.get_or_load(self.tenant, 'models', f'name:{model_name}', _load)
         except Exception as e:
             print(f"❌ get_model_by_name 오류: {e}")
             return None
 
-    def search_models(self, keyword: str = '') -> pd.DataFrame:
+    def search_models(self, keyword: str = '', profile: Optional[str] = None) -> pd.DataFrame:
         """
         모델 검색 (키워드 기반)
 
         Args:
             keyword: 검색 키워드 (빈 문자열이면 전체 조회)
+            profile: 컬럼 프로필 (None이면 전체 컬럼)
 
         Returns:
             모델 목록 DataFrame
         """
-        try:
-            query = self.db.schema('ptop').table('models')\
-                .select('*')\
-                .eq('tenant_id', self.tenant)
+        def _load():
+            filters = [('ilike', 'model_name', f'%{keyword}%')] if keyword else []
+            return self._read_table('models', filters=filters, columns=self.profile_columns('models', profile), order_by='model_name')
 
-            if keyword:
-                query = query.ilike('model_name', f'%{keyword}%')
-
-            result = query.order('model_name').execute()
-            return pd.DataFrame(result.data)
+        try:
+            return self.cache.get_or_load(self.tenant, 'models', self._profile_key(f'search:{keyword}', profile), _load)
         except Exception as e:
             print(f"❌ search_models 오류: {e}")
             return pd.DataFrame()
@@ -139,17 +282,69 @@ class PtopEngine:
         Returns:
             BOM DataFrame
         """
-        try:
+        def _load():
             result = self.db.schema('ptop').table('bom')\
                 .select('*')\
                 .eq('tenant_id', self.tenant)\
                 .eq('model_id', model_id)\
                 .execute()
             return pd.DataFrame(result.data)
+
+        try:
+            return self.cache.get_or_load(self.tenant, 'bom', str(model_id), _load)
         except Exception as e:
             print(f"❌ get_bom 오류: {e}")
             return pd.DataFrame()
 
+    def get_boms(self, model_ids: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        여러 모델의 BOM 일괄 조회 (in_ 필터, 청크 단위)
+
+        견적 항목마다 get_bom()을 호출하면 모델 수만큼 왕복이 발생하므로,
+        모델 ID를 BOM_FETCH_CHUNK_SIZE 단위로 묶어 한 번에 조회한다.
+        캐시에 있는 모델은 조회 대상에서 제외한다.
+
+        Args:
+            model_ids: 모델 ID 목록 (중복 허용)
+
+        Returns:
+            {model_id(str): BOM DataFrame} 딕셔너리
+            (BOM이 없는 모델은 빈 DataFrame)
+        """
+        unique_ids = list(dict.fromkeys(str(mid) for mid in model_ids if mid is not None and str(mid) != ''))
+        boms = {mid: pd.DataFrame() for mid in unique_ids}
+
+        missing_ids = []
+        for mid in unique_ids:
+            hit, cached = self.cache.get(self.tenant, 'bom', mid)
+            if hit:
+                boms[mid] = cached.copy()
+            else:
+                missing_ids.append(mid)
+        if not missing_ids:
+            return boms
+
+        rows = []
+        try:
+            for start in range(0, len(missing_ids), self.BOM_FETCH_CHUNK_SIZE):
+                chunk = missing_ids[start:start + self.BOM_FETCH_CHUNK_SIZE]
+                for page in self.iter_table('bom', filters=[('in_', 'model_id', chunk)]):
+                    rows.extend(page.to_dict('records'))
+        except Exception as e:
+            print(f"❌ get_boms 오류: {e}")
+            return boms
+
+        fetched = {mid: pd.DataFrame() for mid in missing_ids}
+        if rows:
+            bom_all = pd.DataFrame(rows)
+            for mid, group in bom_all.groupby(bom_all['model_id'].astype(str), sort=False):
+                fetched[mid] = group.reset_index(drop=True)
+
+        for mid, bom in fetched.items():
+            self.cache.set(self.tenant, 'bom', mid, bom)
+            boms[mid] = bom.copy()
+        return boms
+
     def calculate_bom_for_span(self, model_id: str, span_count: int) -> pd.DataFrame:
         """
         경간 수에 따른 BOM 계산 (핵심 로직!)
@@ -166,39 +361,89 @@ class PtopEngine:
         if bom_base.empty:
             return bom_base
 
+        return self._apply_span_quantities(bom_base, span_count)
+
+    def calculate_bom_for_spans(self, span_plan: pd.DataFrame) -> pd.DataFrame:
+        """
+        여러 모델의 경간 수에 따른 BOM 일괄 계산 (견적 전체 전개)
+
+        BOM은 get_boms()로 한 번에 조회하고, span_plan과 한 번의 merge로
+        (견적 행 × BOM 행) 전개 후 수량을 벡터 연산으로 계산한다.
+
+        Args:
+            span_plan: 'model_id', 'span_count' 컬럼을 가진 DataFrame
+                (그 외 컬럼은 결과에 그대로 전달됨, BOM 컬럼명과 겹치지 않아야 함)
+
+        Returns:
+            전개된 BOM DataFrame (span_plan 행 순서 → BOM 행 순서,
+            total_quantity, order_quantity, amount 포함)
+        """
+        if span_plan is None or span_plan.empty:
+            return pd.DataFrame()
+
+        boms = self.get_boms(span_plan['model_id'].tolist())
+        frames = [bom for bom in boms.values() if not bom.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        bom_all = pd.concat(frames, ignore_index=True)
+        bom_all['_model_key'] = bom_all['model_id'].astype(str)
+        plan = span_plan.drop(columns=['model_id'])
+        plan['_model_key'] = span_plan['model_id'].astype(str)
+
+        # left merge + indicator: 견적 행 순서를 그대로 유지 (BOM 없는 행만 제외)
+        exploded = plan.merge(bom_all, on='_model_key', how='left', sort=False, indicator=True)
+        exploded = exploded[exploded['_merge'] == 'both'].drop(columns=['_model_key', '_merge']).reset_index(drop=True)
+        return self._apply_span_quantities(exploded, exploded['span_count'])
+
+    def _apply_span_quantities(self, bom_df: pd.DataFrame, span_count) -> pd.DataFrame:
+        """
+        BOM DataFrame에 경간 배수, PIPE 환산, 금액 컬럼 추가 (벡터 연산)
+
+        Args:
+            bom_df: BOM DataFrame (quantity, category, unit_price)
+            span_count: 경간 수 (스칼라 또는 행별 Series)
+
+        Returns:
+            total_quantity, order_quantity, amount가 추가된 DataFrame
+        """
         # 1. 경간당 수량 * 경간 수 = 총 필요 수량
-        bom_base['total_quantity'] = bom_base['quantity'] * span_count
+        bom_df['total_quantity'] = pd.to_numeric(bom_df['quantity'], errors='coerce') * span_count
 
         # 2. PIPE 환산 (6m 단위로 올림)
-        bom_base['order_quantity'] = bom_base.apply(
-            lambda row: self._convert_pipe_quantity(row['total_quantity'], row.get('category', ''))
-            if 'PIPE' in str(row.get('category', '')).upper()
-            else row['total_quantity'],
-            axis=1
+        bom_df['order_quantity'] = bom_df['total_quantity'].where(
+            ~self._is_pipe_category(bom_df),
+            self._convert_pipe_quantity(bom_df['total_quantity'])
         )
 
         # 3. 금액 계산
-        bom_base['unit_price'] = bom_base['unit_price'].fillna(0)
-        bom_base['amount'] = bom_base['order_quantity'] * bom_base['unit_price']
-
-        return bom_base
-
-    def _convert_pipe_quantity(self, total_m: float, category: str) -> float:
+        if 'unit_price' in bom_df.columns:
+            bom_df['unit_price'] = pd.to_numeric(bom_df['unit_price'], errors='coerce').fillna(0)
+        else:
+            bom_df['unit_price'] = 0.0
+        bom_df['amount'] = bom_df['order_quantity'] * bom_df['unit_price']
+
+        return bom_df
+
+    @staticmethod
+    def _is_pipe_category(bom_df: pd.DataFrame) -> pd.Series:
+        """카테고리에 'PIPE'가 포함된 행 마스크"""
+        if 'category' not in bom_df.columns:
+            return pd.Series(False, index=bom_df.index)
+        return bom_df['category'].fillna('').astype(str).str.upper().str.contains('PIPE', regex=False)
+
+    def _convert_pipe_quantity(self, total_m: pd.Series) -> pd.Series:
         """
         PIPE 수량을 6m 단위(EA)로 환산
 
         Args:
-            total_m: 총 미터 수
-            category: 자재 카테고리
+            total_m: 총 미터 수 Series
 
         Returns:
-            올림 처리된 EA 수량
+            올림 처리된 EA 수량 Series (NaN/0 이하는 0)
         """
-        if pd.isna(total_m) or total_m <= 0:
-            return 0
-
-        # 올림 처리: -(-x // y) = ceil(x / y)
-        return -(-total_m // self.PIPE_STANDARD_LENGTH_M)
+        pipes = np.ceil(total_m / self.PIPE_STANDARD_LENGTH_M)
+        return pipes.where(total_m > 0, 0)
 
     def add_bom_item(self, model_id: str, material_data: Dict) -> bool:
         """
@@ -221,28 +466,17 @@ class PtopEngine:
         """
         try:
             # 모델 존재 확인
-            model = self.get_model_by_id(model_id)
+            model = self.get_model_by_id(model_id, profile='catalog-min')
             if not model:
                 print(f"❌ 모델 {model_id}를 찾을 수 없습니다.")
                 return False
 
             # BOM 데이터 준비
-            bom_data = {
-                'tenant_id': self.tenant,
-                'model_id': model_id,
-                'model_name': model.get('model_name'),
-                'material_name': material_data.get('material_name'),
-                'standard': material_data.get('standard'),
-                'quantity': material_data.get('quantity', 0),
-                'unit': material_data.get('unit', 'EA'),
-                'category': material_data.get('category'),
-                'material_type': material_data.get('material_type'),
-                'notes': material_data.get('notes', ''),
-                'unit_price': material_data.get('unit_price')
-            }
+            bom_data = self._bom_row(model_id, model.get('model_name'), material_data)
 
             # Supabase에 삽입
             self.db.schema('ptop').table('bom').insert(bom_data).execute()
+            self.invalidate_bom(model_id)
             print(f"✅ BOM 항목 추가 완료: {material_data.get('material_name')}")
             return True
 
@@ -270,6 +504,7 @@ class PtopEngine:
                 'material_name': material_name,
                 'standard': standard
             }).execute()
+            self.invalidate_bom(model_id)
 
             print(f"✅ BOM 항목 삭제 완료: {material_name} ({standard})")
             return True
@@ -278,13 +513,197 @@ class PtopEngine:
             print(f"❌ delete_bom_item 오류: {e}")
             return False
 
+    def _bom_row(self, model_id: str, model_name: Optional[str], material_data: Dict) -> Dict:
+        """BOM 테이블 행 구성 (add_bom_item / 일괄 API 공용)"""
+        return {
+            'tenant_id': self.tenant,
+            'model_id': model_id,
+            'model_name': model_name,
+            'material_name': material_data.get('material_name'),
+            'standard': material_data.get('standard'),
+            'quantity': material_data.get('quantity', 0),
+            'unit': material_data.get('unit', 'EA'),
+            'category': material_data.get('category'),
+            'material_type': material_data.get('material_type'),
+            'notes': material_data.get('notes', ''),
+            'unit_price': material_data.get('unit_price')
+        }
+
+    def add_bom_items(self, model_id: str, materials: List[Dict]) -> List[Dict]:
+        """
+        BOM 항목 일괄 추가 (모델 확인 1회 + 청크당 insert 1회)
+
+        Args:
+            model_id: 모델 ID
+            materials: 자재 정보 목록 (add_bom_item의 material_data와 같은 형식)
+
+        Returns:
+            입력 순서대로 행별 결과 목록
+            [{'material_name', 'standard', 'status': 'inserted'|'failed'|'skipped', 'error'}]
+        """
+        return self._write_bom_items(model_id, materials, upsert=False)
+
+    def upsert_bom_items(self, model_id: str, materials: List[Dict]) -> List[Dict]:
+        """
+        BOM 항목 일괄 업서트 (tenant_id, model_id, material_name, standard 기준)
+
+        같은 (자재명, 규격)이 여러 번 있으면 마지막 행이 반영되고
+        앞선 행은 'skipped'로 표시된다. 업서트가 실패한 청크(충돌 키 unique 제약이
+        없는 테이블 등)는 insert 경로로 재시도하고 그 결과('inserted')를 기록한다.
+
+        Args:
+            model_id: 모델 ID
+            materials: 자재 정보 목록 (add_bom_item의 material_data와 같은 형식)
+
+        Returns:
+            입력 순서대로 행별 결과 목록
+            [{'material_name', 'standard', 'status': 'upserted'|'inserted'|'failed'|'skipped', 'error'}]
+        """
+        return self._write_bom_items(model_id, materials, upsert=True)
+
+    def _write_bom_items(self, model_id: str, materials: List[Dict], upsert: bool) -> List[Dict]:
+        """add_bom_items / upsert_bom_items 공용 구현"""
+        done_status = 'upserted' if upsert else 'inserted'
+        outcomes = [
+            {'material_name': m.get('material_name'), 'standard': m.get('standard'), 'status': None, 'error': None}
+            for m in materials
+        ]
+        if not outcomes:
+            return outcomes
+
+        def fail_all(indices, error):
+            for i in indices:
+                outcomes[i].update(status='failed', error=error)
+
+        # 모델 존재 확인 (1회)
+        model = self.get_model_by_id(model_id, profile='catalog-min')
+        if not model:
+            fail_all(range(len(outcomes)), f"모델 {model_id}를 찾을 수 없습니다.")
+            return outcomes
+
+        # 행 구성 (자재명 없는 행 제외, 업서트는 같은 키의 마지막 행만 전송)
+        pending = {}
+        for i, material in enumerate(materials):
+            if not str(material.get('material_name') or '').strip():
+                outcomes[i].update(status='skipped', error='자재명 없음')
+                continue
+            row_key = (material.get('material_name'), material.get('standard')) if upsert else i
+            if row_key in pending:
+                outcomes[pending[row_key]].update(status='skipped', error='같은 자재/규격의 뒤 행으로 대체')
+            pending[row_key] = i
+
+        indices = sorted(pending.values())
+        for start in range(0, len(indices), self.BOM_WRITE_CHUNK_SIZE):
+            chunk = indices[start:start + self.BOM_WRITE_CHUNK_SIZE]
+            rows = [self._bom_row(model_id, model.get('model_name'), materials[i]) for i in chunk]
+            if upsert:
+                try:
+                    self.db.schema('ptop').table('bom').upsert(rows, on_conflict=self.BOM_CONFLICT_KEYS).execute()
+                    for i in chunk:
+                        outcomes[i]['status'] = done_status
+                    continue
+                except Exception as e:
+                    # 충돌 키 unique 제약이 없는 테이블 등 - insert 경로로 재시도
+                    print(f"⚠️ upsert_bom_items 업서트 실패, insert로 재시도: {e}")
+            self._insert_bom_chunk(chunk, rows, outcomes)
+
+        self.invalidate_bom(model_id)
+        ok = sum(1 for o in outcomes if o['status'] in ('upserted', 'inserted'))
+        print(f"✅ BOM 항목 일괄 {'업서트' if upsert else '추가'}: {ok}/{len(outcomes)}건")
+        return outcomes
+
+    def _insert_bom_chunk(self, chunk: List[int], rows: List[Dict], outcomes: List[Dict]):
+        """
+        청크 insert 1회, 실패하면 행별 insert로 재시도해 행별 결과 기록
+
+        Args:
+            chunk: outcomes 인덱스 목록
+            rows: chunk와 같은 순서의 BOM 행
+            outcomes: 결과 목록 (status/error를 채움)
+        """
+        try:
+            self.db.schema('ptop').table('bom').insert(rows).execute()
+            for i in chunk:
+                outcomes[i]['status'] = 'inserted'
+            return
+        except Exception as e:
+            print(f"❌ add_bom_items 오류 (행별 재시도): {e}")
+
+        for i, row in zip(chunk, rows):
+            try:
+                self.db.schema('ptop').table('bom').insert(row).execute()
+                outcomes[i]['status'] = 'inserted'
+            except Exception as e:
+                outcomes[i].update(status='failed', error=str(e))
+
+    def delete_bom_items(self, model_id: str, keys: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        BOM 항목 일괄 삭제 (청크당 delete 1회, or_ 필터)
+
+        Args:
+            model_id: 모델 ID
+            keys: [(자재명, 규격), ...]
+
+        Returns:
+            입력 순서대로 행별 결과 목록
+            [{'material_name', 'standard', 'status': 'deleted'|'not_found'|'failed', 'error'}]
+        """
+        outcomes = [
+            {'material_name': name, 'standard': standard, 'status': None, 'error': None}
+            for name, standard in keys
+        ]
+        if not outcomes:
+            return outcomes
+
+        unique_keys = list(dict.fromkeys((name, standard) for name, standard in keys))
+        deleted = set()
+        failed = {}
+        for start in range(0, len(unique_keys), self.BOM_DELETE_CHUNK_SIZE):
+            chunk = unique_keys[start:start + self.BOM_DELETE_CHUNK_SIZE]
+            condition = ','.join(
+                f"and(material_name.eq.{self._quote_filter_value(name)},"
+                f"standard.eq.{self._quote_filter_value(standard)})"
+                for name, standard in chunk
+            )
+            try:
+                result = self.db.schema('ptop').table('bom').delete()\
+                    .eq('tenant_id', self.tenant)\
+                    .eq('model_id', model_id)\
+                    .or_(condition)\
+                    .execute()
+                deleted.update((r.get('material_name'), r.get('standard')) for r in (result.data or []))
+            except Exception as e:
+                print(f"❌ delete_bom_items 오류: {e}")
+                failed.update({k: str(e) for k in chunk})
+
+        for outcome in outcomes:
+            row_key = (outcome['material_name'], outcome['standard'])
+            if row_key in failed:
+                outcome.update(status='failed', error=failed[row_key])
+            else:
+                outcome['status'] = 'deleted' if row_key in deleted else 'not_found'
+
+        self.invalidate_bom(model_id)
+        print(f"✅ BOM 항목 일괄 삭제: {len(deleted)}/{len(unique_keys)}건")
+        return outcomes
+
+    @staticmethod
+    def _quote_filter_value(value) -> str:
+        """PostgREST 필터 값 인용 (쉼표/마침표/괄호가 포함된 규격 대비)"""
+        text = '' if value is None else str(value)
+        return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+    def invalidate_bom(self, model_id: str) -> None:
+        """한 모델의 BOM 캐시만 무효화 (BOM 쓰기 후 호출)"""
+        self.cache.invalidate(self.tenant, 'bom', str(model_id))
+
     # ========================================================================
     # 자재 단가 조회
     # ========================================================================
 
     def find_material_price(self, material_name: str, standard: str) -> Optional[float]:
         """
-        주자재/부자재 단가 조회
+        주자재/부자재/재고 단가 조회 (main → sub → inventory 순, resolve_prices() 한 쌍 조회)
 
         Args:
             material_name: 자재명
@@ -293,61 +712,92 @@ class PtopEngine:
         Returns:
             단가 또는 None
         """
-        # 1. main_materials 검색
-        price = self._find_main_material_price(material_name, standard)
-        if price is not None:
-            return price
-
-        # 2. sub_materials 검색
-        price = self._find_sub_material_price(material_name, standard)
-        if price is not None:
-            return price
+        price = self.resolve_prices([(material_name, standard)])['unit_price'].iloc[0]
+        return None if pd.isna(price) else float(price)
 
-        # 3. inventory 검색
-        price = self._find_inventory_price(material_name, standard)
-        return price
+    def resolve_prices(self, pairs: List[Tuple[str, str]], refresh: bool = False) -> pd.DataFrame:
+        """
+        자재 단가 일괄 조회 (테넌트 단가 인덱스 사용)
 
-    def _find_main_material_price(self, material_name: str, standard: str) -> Optional[float]:
-        """주자재 단가 조회"""
-        try:
-            result = self.db.schema('ptop').table('main_materials')\
-                .select('unit_price')\
-                .eq('tenant_id', self.tenant)\
-                .eq('product_name', material_name)\
-                .eq('standard', standard)\
-                .execute()
+        find_material_price()와 같은 우선순위(main → sub → inventory)로
+        여러 (자재명, 규격) 쌍을 한 번에 해석한다. 인덱스는 증분 동기화 중인
+        카탈로그 원본 테이블(load_data와 같은 행)로 만들고, 동기화 전인 테이블만
+        한 번씩 조회한다. 동기화 상태가 바뀌거나 PRICE_INDEX_TTL_SEC가 지나면 다시 만든다.
 
-            return result.data[0]['unit_price'] if result.data else None
-        except:
-            return None
+        Args:
+            pairs: [(자재명, 규격), ...]
+            refresh: True면 인덱스를 다시 구축
 
-    def _find_sub_material_price(self, material_name: str, standard: str) -> Optional[float]:
-        """부자재 단가 조회"""
-        try:
-            result = self.db.schema('ptop').table('sub_materials')\
-                .select('unit_price')\
-                .eq('tenant_id', self.tenant)\
-                .eq('product_name', material_name)\
-                .eq('standard', standard)\
-                .execute()
+        Returns:
+            입력 순서와 동일한 DataFrame
+            (material_name, standard, unit_price, price_source)
+            찾지 못한 행은 unit_price=NaN, price_source=None
+        """
+        index = self._get_price_index(refresh)
+
+        resolved = pd.DataFrame(list(pairs), columns=['material_name', 'standard'])
+        resolved['unit_price'] = np.nan
+        resolved['price_source'] = None
+        if resolved.empty:
+            return resolved
+
+        keys = self._price_keys(resolved['material_name'], resolved['standard'])
+        for table in self.PRICE_TABLES:
+            found = keys.map(index.get(table, {}))
+            fill = resolved['unit_price'].isna() & found.notna()
+            resolved.loc[fill, 'unit_price'] = found[fill]
+            resolved.loc[fill, 'price_source'] = table
+
+        return resolved
+
+    def invalidate_price_index(self) -> None:
+        """단가 인덱스 폐기 (자재 단가 수정 후 호출)"""
+        self.cache.invalidate(self.tenant, 'price_index')
+
+    def _get_price_index(self, refresh: bool = False) -> Dict[str, Dict[str, float]]:
+        """테넌트 단가 인덱스 반환 (동기화 상태별, 만료/미구축 시 재구축)"""
+        if refresh:
+            self.invalidate_price_index()
+        syncs = {table: self.sync_info(table) for table in self.PRICE_TABLES}
+        version = ','.join(
+            f"{table}@{sync['watermark']}#{sync['rows']}" if sync is not None else f"{table}@db"
+            for table, sync in syncs.items()
+        )
+        return self.cache.get_or_load(
+            self.tenant, 'price_index', version,
+            lambda: {table: self._build_price_index(table, syncs[table]) for table in self.PRICE_TABLES},
+            ttl_sec=self.PRICE_INDEX_TTL_SEC, copy=False
+        )
 
-            return result.data[0]['unit_price'] if result.data else None
-        except:
-            return None
+    def _build_price_index(self, table: str, sync: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+        """
+        테이블 하나의 {정규화 키: 단가} 인덱스 구축
 
-    def _find_inventory_price(self, material_name: str, standard: str) -> Optional[float]:
-        """재고 단가 조회"""
+        동기화 중인 원본 테이블이 있으면 그대로 쓰고, 없으면 필요한 컬럼만 한 번 조회한다.
+        같은 키가 여러 행이면 첫 행을 사용하고, 단가가 없는 행은 제외한다.
+        """
         try:
-            result = self.db.schema('ptop').table('inventory')\
-                .select('unit_price')\
-                .eq('tenant_id', self.tenant)\
-                .eq('product_name', material_name)\
-                .eq('standard', standard)\
-                .execute()
-
-            return result.data[0]['unit_price'] if result.data else None
-        except:
-            return None
+            if sync is not None:
+                rows = sync['frame']
+            else:
+                rows = self._read_table(table, columns='product_name,standard,unit_price')
+            rows = rows.reindex(columns=['product_name', 'standard', 'unit_price'])
+        except Exception as e:
+            print(f"❌ 단가 인덱스 구축 오류 ({table}): {e}")
+            return {}
+
+        rows['unit_price'] = pd.to_numeric(rows['unit_price'], errors='coerce')
+        rows = rows.dropna(subset=['unit_price'])
+        rows['_key'] = self._price_keys(rows['product_name'], rows['standard'])
+        rows = rows.drop_duplicates('_key', keep='first')
+        return dict(zip(rows['_key'], rows['unit_price'].astype(float)))
+
+    @staticmethod
+    def _price_keys(names: pd.Series, standards: pd.Series) -> pd.Series:
+        """정규화 키: 공백 정리 + 대문자화한 '자재명|규격'"""
+        def _norm(values: pd.Series) -> pd.Series:
+            return values.astype(object).fillna('').astype(str).str.split().str.join(' ').str.upper()
+        return _norm(names) + '|' + _norm(standards)
 
     # ========================================================================
     # 가격 조회
@@ -363,14 +813,16 @@ class PtopEngine:
         Returns:
             단가 또는 None
         """
-        try:
+        def _load():
             result = self.db.schema('ptop').table('pricing')\
                 .select('unit_price')\
                 .eq('tenant_id', self.tenant)\
                 .eq('model_name', model_name)\
                 .execute()
-
             return result.data[0]['unit_price'] if result.data else None
+
+        try:
+            return self.cache.get_or_load(self.tenant, 'pricing', f'price:{model_name}', _load)
         except Exception as e:
             print(f"❌ get_model_price 오류: {e}")
             return None
@@ -385,16 +837,12 @@ class PtopEngine:
         Returns:
             가격표 DataFrame
         """
-        try:
-            query = self.db.schema('ptop').table('pricing')\
-                .select('*')\
-                .eq('tenant_id', self.tenant)
+        def _load():
+            filters = [('ilike', 'model_name', f'%{keyword}%')] if keyword else []
+            return self._read_table('pricing', filters=filters, order_by='model_name')
 
-            if keyword:
-                query = query.ilike('model_name', f'%{keyword}%')
-
-            result = query.order('model_name').execute()
-            return pd.DataFrame(result.data)
+        try:
+            return self.cache.get_or_load(self.tenant, 'pricing', f'search:{keyword}', _load)
         except Exception as e:
             print(f"❌ search_pricing 오류: {e}")
             return pd.DataFrame()
@@ -447,52 +895,317 @@ class PtopEngine:
 
     def search_main_materials(self, keyword: str = '') -> pd.DataFrame:
         """주자재 검색"""
-        try:
-            query = self.db.schema('ptop').table('main_materials')\
-                .select('*')\
-                .eq('tenant_id', self.tenant)
+        def _load():
+            filters = [('ilike', 'product_name', f'%{keyword}%')] if keyword else []
+            return self._read_table('main_materials', filters=filters, order_by='product_name')
 
-            if keyword:
-                query = query.ilike('product_name', f'%{keyword}%')
-
-            result = query.order('product_name').execute()
-            return pd.DataFrame(result.data)
+        try:
+            return self.cache.get_or_load(self.tenant, 'main_materials', f'search:{keyword}', _load)
         except Exception as e:
             print(f"❌ search_main_materials 오류: {e}")
             return pd.DataFrame()
 
     def search_sub_materials(self, keyword: str = '') -> pd.DataFrame:
         """부자재 검색"""
-        try:
-            query = self.db.schema('ptop').table('sub_materials')\
-                .select('*')\
-                .eq('tenant_id', self.tenant)
+        def _load():
+            filters = [('ilike', 'product_name', f'%{keyword}%')] if keyword else []
+            return self._read_table('sub_materials', filters=filters, order_by='product_name')
 
-            if keyword:
-                query = query.ilike('product_name', f'%{keyword}%')
-
-            result = query.order('product_name').execute()
-            return pd.DataFrame(result.data)
+        try:
+            return self.cache.get_or_load(self.tenant, 'sub_materials', f'search:{keyword}', _load)
         except Exception as e:
             print(f"❌ search_sub_materials 오류: {e}")
             return pd.DataFrame()
 
     def search_inventory(self, keyword: str = '') -> pd.DataFrame:
         """재고 검색"""
+        def _load():
+            filters = [('or_', f'product_name.ilike.%{keyword}%,standard.ilike.%{keyword}%,item_id.ilike.%{keyword}%')] if keyword else []
+            return self._read_table('inventory', filters=filters, order_by='product_name')
+
         try:
-            query = self.db.schema('ptop').table('inventory')\
-                .select('*')\
-                .eq('tenant_id', self.tenant)
+            return self.cache.get_or_load(self.tenant, 'inventory', f'search:{keyword}', _load)
+        except Exception as e:
+            print(f"❌ search_inventory 오류: {e}")
+            return pd.DataFrame()
+
+    def upsert_sub_material(self, material_data: Dict) -> bool:
+        """
+        부자재 등록/갱신 (tenant_id, product_name, standard 기준 UPSERT)
 
-            if keyword:
-                query = query.or_(f'product_name.ilike.%{keyword}%,standard.ilike.%{keyword}%,item_id.ilike.%{keyword}%')
+        UPSERT를 지원하지 않으면 INSERT로 폴백한다.
+        성공 시 부자재 캐시와 단가 인덱스를 무효화하고 부자재 증분 동기화 상태를 초기화한다
+        (payload에 updated_at이 없으므로 변경분 조회로는 갱신된 단가를 찾지 못함).
 
-            result = query.order('product_name').execute()
-            return pd.DataFrame(result.data)
+        Args:
+            material_data: 부자재 정보 딕셔너리
+                {'product_name', 'standard', 'unit', 'unit_price', 'notes', 'supplier'}
+
+        Returns:
+            성공 여부
+        """
+        row = {
+            'tenant_id': self.tenant,
+            'product_name': material_data.get('product_name'),
+            'standard': material_data.get('standard'),
+            'unit': material_data.get('unit'),
+            'unit_price': material_data.get('unit_price'),
+            'notes': material_data.get('notes'),
+            'supplier': material_data.get('supplier') or None,
+        }
+        table = self.db.schema('ptop').table('sub_materials')
+        try:
+            table.upsert(row, on_conflict='tenant_id,product_name,standard').execute()
+        except Exception:
+            try:
+                self.db.schema('ptop').table('sub_materials').insert(row).execute()
+            except Exception as e:
+                print(f"❌ upsert_sub_material 오류: {e}")
+                return False
+
+        self.cache.invalidate(self.tenant, 'sub_materials')
+        self.reset_sync('sub_materials')
+        self.invalidate_price_index()
+        return True
+
+    # ========================================================================
+    # 카탈로그 일괄 로드 (병렬)
+    # ========================================================================
+
+    def iter_catalog(self, tables: Optional[List[str]] = None, max_workers: Optional[int] = None,
+                     incremental: bool = False) -> Iterator[Tuple[str, pd.DataFrame, float]]:
+        """
+        카탈로그 테이블을 병렬 조회하여 도착 순서대로 반환
+
+        테이블별 조회는 스레드 풀에서 동시에 실행되므로 전체 소요 시간은
+        합이 아니라 가장 느린 테이블 기준이 된다. 각 결과는 완료되는 즉시
+        반환되므로 호출자는 나머지를 기다리지 않고 후처리(컬럼 변환 등)를 할 수 있다.
+
+        Args:
+            tables: 조회할 테이블 목록 (None이면 CATALOG_TABLES)
+            max_workers: 동시 조회 수 (None이면 테이블 수)
+            incremental: True면 sync_table()로 변경분만 조회
+
+        Yields:
+            (테이블명, DataFrame, 소요 시간(초))
+        """
+        loaders = {
+            'models': self.get_all_models,
+            'pricing': self.search_pricing,
+            'main_materials': self.search_main_materials,
+            'sub_materials': self.search_sub_materials,
+            'inventory': self.search_inventory,
+        }
+        tables = [t for t in (tables or self.CATALOG_TABLES) if t in loaders]
+        if not tables:
+            return
+
+        def timed(table: str) -> Tuple[pd.DataFrame, float]:
+            start = time.perf_counter()
+            df = self.sync_table(table) if incremental else loaders[table]()
+            return df, time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(tables)) as executor:
+            futures = {executor.submit(timed, table): table for table in tables}
+            for future in as_completed(futures):
+                df, elapsed = future.result()
+                yield futures[future], df, elapsed
+
+    # ========================================================================
+    # 증분 동기화 (updated_at 워터마크)
+    # ========================================================================
+
+    def sync_table(self, table: str) -> pd.DataFrame:
+        """
+        카탈로그 테이블 증분 동기화
+
+        첫 호출은 전체 조회 후 updated_at 최댓값(워터마크)을 기억하고,
+        이후에는 워터마크 이후 변경된 행만 조회하여 보관 중인 DataFrame에 병합한다.
+        - 변경 행: 행 키(TABLE_KEYS, 기본 'id') 기준으로 교체/추가
+        - soft-delete: SYNC_TOMBSTONE_COLUMN 값이 있는 행은 제거
+        - 하드 삭제: SYNC_RECONCILE_SEC 주기로 키 컬럼만 조회하여 없는 행 제거
+        병합 결과는 search_*('') 캐시에도 반영된다.
+
+        테이블에 updated_at 컬럼이 없으면 매번 전체 조회한다.
+        같은 워터마크에서 동시에 들어온 동기화는 한 번만 조회하고 결과를 공유한다.
+
+        Args:
+            table: 카탈로그 테이블명 (CATALOG_TABLES)
+
+        Returns:
+            동기화된 전체 DataFrame (이름순 정렬)
+        """
+        try:
+            generation = self.cache.generation(self.tenant, 'catalog_sync')
+            hit, state = self.cache.get_pinned(self.tenant, 'catalog_sync', table)
+            if not hit:
+                state = None
+            version = state['watermark'] if state is not None else None
+            frame = self.cache.coalesce(self.tenant, 'catalog_sync', f"{table}@{version}",
+                                        lambda: self._sync(table, state, generation))
+            return frame.copy()
         except Exception as e:
-            print(f"❌ search_inventory 오류: {e}")
+            print(f"❌ sync_table 오류 ({table}): {e}")
             return pd.DataFrame()
 
+    def _sync(self, table: str, state: Optional[Dict[str, Any]],
+              generation: Tuple[int, int, int]) -> pd.DataFrame:
+        """동기화 1회 실행 + 상태/검색 캐시 저장 (상태를 읽은 뒤 reset_sync()됐으면 저장하지 않음)"""
+        if state is not None and state['watermark'] is not None:
+            state = self._sync_delta(table, state)
+        else:
+            state = self._sync_full(table)
+        frame = state['frame']
+        # 동기화 상태는 LRU 밖에 보관 (BOM 등 다른 항목에 밀려 전체 재조회되지 않도록)
+        if self.cache.pin(self.tenant, 'catalog_sync', table, state, generation):
+            self.cache.set(self.tenant, table, 'search:', frame)
+        return frame
+
+    def reset_sync(self, table: Optional[str] = None) -> None:
+        """
+        증분 동기화 상태 초기화 (다음 sync_table()은 전체 조회)
+
+        엔진이 카탈로그 테이블에 쓴 뒤에도 호출한다 - 쓰기가 updated_at을 바꾸지 않으면
+        (DB 트리거가 없으면) 변경분 조회로는 수정된 행을 찾을 수 없다.
+        """
+        self.cache.invalidate(self.tenant, 'catalog_sync', table)
+
+    def sync_info(self, table: str) -> Optional[Dict[str, Any]]:
+        """
+        증분 동기화 상태 요약
+
+        Returns:
+            {'frame': 보관 중인 원본 DataFrame (수정 금지), 'watermark', 'rows',
+             'changed': 마지막 동기화에서 내용이 바뀌었는지} - 동기화 전이면 None
+        """
+        hit, state = self.cache.get_pinned(self.tenant, 'catalog_sync', table)
+        if not hit:
+            return None
+        return {
+            'frame': state['frame'],
+            'watermark': state['watermark'],
+            'rows': len(state['frame']),
+            'changed': state.get('changed', True),
+        }
+
+    def seed_sync(self, table: str, frame: pd.DataFrame, watermark: Optional[str]) -> None:
+        """
+        저장해 둔 원본 테이블로 증분 동기화 상태 복원 (프로세스 재시작 후 스냅샷에서)
+
+        다음 sync_table()은 워터마크 이후 변경분만 조회하고,
+        프로세스가 내려가 있던 동안의 하드 삭제를 반영하도록 키 대조도 바로 실행한다.
+
+        Args:
+            table: 카탈로그 테이블명
+            frame: 스냅샷의 원본 DataFrame (_sync_full 결과와 같은 형식)
+            watermark: 스냅샷 시점의 updated_at 최댓값
+        """
+        self.cache.pin(self.tenant, 'catalog_sync', table, {
+            'frame': frame,
+            'watermark': watermark,
+            'reconciled_at': time.monotonic() - self.SYNC_RECONCILE_SEC,
+            'last_delta_rows': 0,
+            'changed': False,
+        })
+
+    def _sync_full(self, table: str) -> Dict[str, Any]:
+        """전체 조회로 동기화 상태 생성"""
+        frame = self._drop_tombstones(self._read_table(table))
+        return {
+            'frame': self._sort_catalog(table, frame),
+            'watermark': self._max_watermark(frame),
+            'reconciled_at': time.monotonic(),
+            'last_delta_rows': len(frame),
+            'changed': True,
+        }
+
+    def _sync_delta(self, table: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """워터마크 이후 변경분 병합 (+ 주기적 키 대조)"""
+        key = self.TABLE_KEYS.get(table, 'id')
+        frame = state['frame']
+        rows_before = len(frame)
+        added = False
+
+        # 같은 시각에 커밋된 행을 놓치지 않도록 gte로 조회 (키 기준 병합이라 중복 무해)
+        changed = self._read_table(table, filters=[('gte', self.SYNC_WATERMARK_COLUMN, state['watermark'])])
+        if not changed.empty and key not in changed.columns:
+            return self._sync_full(table)  # 행 키가 없으면 병합 불가
+        if not changed.empty:
+            changed = changed.drop_duplicates(key, keep='last')
+            live = self._drop_tombstones(changed)
+            added = bool((~live[key].isin(frame[key])).any())
+            frame = pd.concat([frame[~frame[key].isin(changed[key])], live], ignore_index=True)
+
+        reconciled_at = state['reconciled_at']
+        if time.monotonic() - reconciled_at >= self.SYNC_RECONCILE_SEC and key in frame.columns:
+            keys = self._read_table(table, columns=key)
+            if key in keys.columns:
+                frame = frame[frame[key].isin(keys[key])]
+            reconciled_at = time.monotonic()
+
+        watermark = self._max_watermark(changed) or state['watermark']
+        return {
+            'frame': self._sort_catalog(table, frame),
+            'watermark': watermark,
+            'reconciled_at': reconciled_at,
+            'last_delta_rows': len(changed),
+            # gte 조회라 마지막 행은 항상 다시 오므로, 워터마크 이동/새 키/삭제로 변경 여부 판단
+            'changed': watermark != state['watermark'] or added or len(frame) != rows_before,
+        }
+
+    def _drop_tombstones(self, df: pd.DataFrame) -> pd.DataFrame:
+        """soft-delete 된 행 제외"""
+        if df.empty or self.SYNC_TOMBSTONE_COLUMN not in df.columns:
+            return df
+        return df[df[self.SYNC_TOMBSTONE_COLUMN].isna()]
+
+    def _max_watermark(self, df: pd.DataFrame) -> Optional[str]:
+        """updated_at 최댓값 (원본 문자열 그대로 반환, 컬럼이 없으면 None)"""
+        column = self.SYNC_WATERMARK_COLUMN
+        if df.empty or column not in df.columns:
+            return None
+        parsed = pd.to_datetime(df[column], utc=True, errors='coerce')
+        if parsed.isna().all():
+            return None
+        return df[column].loc[parsed.idxmax()]
+
+    def _sort_catalog(self, table: str, df: pd.DataFrame) -> pd.DataFrame:
+        """search_*('')와 같은 이름순 정렬"""
+        order_by = self.CATALOG_ORDER.get(table, 'product_name')
+        if order_by in df.columns:
+            df = df.sort_values(order_by, kind='stable', na_position='last')
+        return df.reset_index(drop=True)
+
+    # ========================================================================
+    # 캐시 관리
+    # ========================================================================
+
+    def invalidate_table(self, table: str) -> None:
+        """테이블 단위 캐시 무효화 (외부에서 직접 수정한 경우 - 증분 동기화 상태 포함)"""
+        self.cache.invalidate(self.tenant, table)
+        if table in self.CATALOG_TABLES:
+            self.reset_sync(table)
+        if table in self.PRICE_TABLES:
+            self.invalidate_price_index()
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        현재 테넌트의 테이블별 캐시 적중/미적중 통계
+
+        Returns:
+            {'tenant/table': {'hits', 'misses', 'hit_rate', 'entries', ...}}
+        """
+        return self.cache.stats(self.tenant)
+
+    def flight_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        현재 테넌트의 키별 동시 조회 병합 통계
+
+        Returns:
+            {'tenant/table/key': {'calls', 'runs', 'shared', 'wait_sec', 'max_wait_sec', 'avg_wait_sec', ...}}
+        """
+        return self.cache.flight_stats(self.tenant)
+
     # ========================================================================
     # 향후 확장 기능 (Placeholder)
     # ========================================================================
@@ -0,0 +1,344 @@
+"""
+SharedCatalog - 테넌트/버전별 프로세스 공유 읽기 전용 카탈로그
+load_data()가 호출마다 st.cache_data 사본(언피클)을 만드는 대신 같은 DataFrame을 공유
+
+- 조회: view() → 테이블별 얕은 사본 dict (copy-on-write: 수정하는 순간 그 사본만 복사, 원본 불변)
+- 수정: 쓰기 경로가 invalidate(tenant, tables) → 다음 조회 때 바뀐 테이블만 다시 읽어 fork()
+  (나머지 테이블과 해당 테이블에 의존하지 않는 파생 객체는 새 버전과 공유)
+- 파생 객체(CatalogIndex, CatalogViews, MaterialMatcher)도 버전당 한 번만 생성
+- 동시 로드는 (테넌트, 버전, 무효화 세대)별로 한 번만 실행하고 나머지 세션은 결과를 기다림 (대기 시간 통계)
+- 프로세스 전체에서 공유 (Streamlit 세션 간 재사용), 스레드 안전
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import threading
+
+import pandas as pd
+
+from utils.catalog_index import catalog_version, table_version
+from utils.single_flight import SingleFlight
+
+
+VERSIONS_PER_TENANT = 2  # 테넌트별로 보관할 카탈로그 버전 수 (이전 뷰를 들고 있는 세션용)
+
+
+class CatalogLoad(NamedTuple):
+    """카탈로그 로더 결과 (CatalogRegistry.get_or_load의 load_tables 반환값)"""
+    tables: Dict[str, pd.DataFrame]
+    timings: Dict[str, float]
+    memory_report: Dict[str, Dict[str, Any]]
+    table_versions: Dict[str, str]  # 이미 알고 있는 테이블 버전 (예: 스냅샷), 나머지는 계산
+
+
+def _enable_copy_on_write() -> bool:
+    """pandas copy-on-write 사용 가능 여부 (pandas 2.x는 옵션으로 켠다, 3.x는 기본)"""
+    major = int(pd.__version__.split('.')[0])
+    if major >= 3:
+        return True
+    try:
+        pd.set_option('mode.copy_on_write', True)
+        return True
+    except (KeyError, ValueError):
+        return False
+
+
+COPY_ON_WRITE = _enable_copy_on_write()
+
+
+def _view_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """공유 DataFrame의 읽기용 사본 (copy-on-write면 데이터 복사 없음)"""
+    return df.copy(deep=not COPY_ON_WRITE)
+
+
+class SharedCatalog:
+    """
+    읽기 전용 카탈로그 한 버전
+
+    Usage:
+        catalog = SharedCatalog('dooho', tables)
+        data = catalog.view()                      # load_data()와 같은 dict
+        index = catalog.derived('catalog_index', lambda: CatalogIndex(data), tables=('models', 'pricing'))
+        newer = catalog.fork({'sub_materials': new_sub_df})
+    """
+
+    def __init__(self, tenant: str, tables: Dict[str, pd.DataFrame],
+                 load_timings: Optional[Dict[str, float]] = None,
+                 table_versions: Optional[Dict[str, str]] = None,
+                 memory_report: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        SharedCatalog 초기화
+
+        Args:
+            tenant: 테넌트 ID
+            tables: 컬럼 변환이 끝난 테이블 {테이블: DataFrame} (이후 수정 금지)
+            load_timings: 테이블별 로드 시간 (load_data()['load_timings'])
+            table_versions: 이미 계산된 테이블 버전 (없는 테이블만 계산)
+            memory_report: 테이블별 메모리 압축 리포트 (catalog_compaction.compact_frame)
+        """
+        self.tenant = tenant
+        self.tables: Dict[str, pd.DataFrame] = dict(tables)
+        known = table_versions or {}
+        self.table_versions: Dict[str, str] = {
+            table: known.get(table) or table_version(df) for table, df in self.tables.items()
+        }
+        self.version = catalog_version(self.tables, self.table_versions)
+        self.load_timings: Dict[str, float] = dict(load_timings or {})
+        self.memory_report: Dict[str, Dict[str, Any]] = dict(memory_report or {})
+        # 파생 객체 {이름: (의존 테이블 또는 None, 값)}
+        self._derived: Dict[str, Tuple[Optional[Tuple[str, ...]], Any]] = {}
+        self._lock = threading.Lock()
+
+    def view(self) -> Dict[str, Any]:
+        """
+        load_data() 형식의 읽기용 dict (호출마다 새 dict, DataFrame은 copy-on-write 사본)
+
+        Returns:
+            {테이블: DataFrame, 'load_timings', 'memory_report', 'table_versions', 'catalog_version'}
+        """
+        data: Dict[str, Any] = {table: _view_frame(df) for table, df in self.tables.items()}
+        data['load_timings'] = dict(self.load_timings)
+        data['memory_report'] = dict(self.memory_report)
+        data['table_versions'] = dict(self.table_versions)
+        data['catalog_version'] = self.version
+        return data
+
+    def fork(self, tables: Dict[str, pd.DataFrame],
+             load_timings: Optional[Dict[str, float]] = None,
+             memory_report: Optional[Dict[str, Dict[str, Any]]] = None,
+             table_versions: Optional[Dict[str, str]] = None) -> 'SharedCatalog':
+        """
+        일부 테이블만 교체한 새 버전 (나머지 테이블은 복사 없이 공유)
+
+        Args:
+            tables: 교체할 테이블 {테이블: DataFrame}
+            load_timings: 교체한 테이블의 로드 시간
+            memory_report: 교체한 테이블의 메모리 압축 리포트
+            table_versions: 교체한 테이블 중 버전을 이미 아는 테이블 (나머지는 계산)
+
+        Returns:
+            새 SharedCatalog (내용이 같으면 버전도 같음)
+        """
+        known = table_versions or {}
+        changed = {table: known.get(table) or table_version(df) for table, df in tables.items()}
+        versions = {**self.table_versions, **changed}
+        catalog = SharedCatalog(self.tenant, {**self.tables, **tables},
+                                {**self.load_timings, **(load_timings or {})}, versions,
+                                {**self.memory_report, **(memory_report or {})})
+
+        # 바뀐 테이블에 의존하지 않는 파생 객체는 그대로 넘김
+        changed_tables = {table for table, version in changed.items() if self.table_versions.get(table) != version}
+        with self._lock:
+            for name, (depends, value) in self._derived.items():
+                if depends is not None and not changed_tables.intersection(depends):
+                    catalog._derived[name] = (depends, value)
+        return catalog
+
+    def derived(self, name: str, build: Callable[[], Any], tables: Optional[Iterable[str]] = None) -> Any:
+        """
+        버전당 한 번만 만드는 파생 객체 (세션 간 공유, 읽기 전용으로 사용)
+
+        Args:
+            name: 파생 객체 이름
+            build: 생성 함수
+            tables: 의존 테이블 (지정하면 다른 테이블만 바뀐 fork()에 그대로 넘김)
+
+        Returns:
+            파생 객체
+        """
+        with self._lock:
+            entry = self._derived.get(name)
+        if entry is not None:
+            return entry[1]
+        value = build()
+        with self._lock:
+            entry = self._derived.setdefault(name, (tuple(tables) if tables is not None else None, value))
+        return entry[1]
+
+    def nbytes(self) -> int:
+        """공유 테이블 메모리 사용량 (bytes, 문자열 포함)"""
+        return int(sum(df.memory_usage(index=True, deep=True).sum() for df in self.tables.values()))
+
+
+class CatalogRegistry:
+    """
+    테넌트별 현재 카탈로그 + 최근 버전 보관소
+
+    Usage:
+        registry = get_catalog_registry()
+        catalog = registry.get_or_load('dooho', load_tables)   # load_tables(None 또는 [테이블]) → CatalogLoad
+        registry.invalidate('dooho', ['sub_materials'])        # 쓰기 후
+        registry.refresh('dooho', load_tables)                 # 백그라운드 갱신 (조회는 기다리지 않음)
+    """
+
+    def __init__(self, versions_per_tenant: int = VERSIONS_PER_TENANT):
+        self.versions_per_tenant = versions_per_tenant
+        self._current: Dict[str, SharedCatalog] = {}
+        self._recent: Dict[str, List[SharedCatalog]] = {}
+        self._stale: Dict[str, Optional[set]] = {}  # None = 전체 다시 로드
+        self._generations: Dict[str, int] = {}  # invalidate()마다 증가 (로드 중 무효화 유실 방지)
+        self._lock = threading.RLock()
+        self._tenant_locks: Dict[str, threading.Lock] = {}
+        self._flights = SingleFlight()
+
+    def _tenant_lock(self, tenant: str) -> threading.Lock:
+        with self._lock:
+            return self._tenant_locks.setdefault(tenant, threading.Lock())
+
+    def current(self, tenant: str) -> Optional[SharedCatalog]:
+        """테넌트의 현재 카탈로그 (없으면 None)"""
+        with self._lock:
+            return self._current.get(tenant)
+
+    def get(self, tenant: str, version: Optional[str]) -> Optional[SharedCatalog]:
+        """테넌트의 특정 버전 카탈로그 (최근 VERSIONS_PER_TENANT개 중, 없으면 None)"""
+        if version is None:
+            return None
+        with self._lock:
+            for catalog in self._recent.get(tenant, []):
+                if catalog.version == version:
+                    return catalog
+        return None
+
+    def get_or_load(self, tenant: str,
+                    load_tables: Callable[[Optional[List[str]]], CatalogLoad]) -> SharedCatalog:
+        """
+        현재 카탈로그 반환 (없으면 전체 로드, 무효화된 테이블이 있으면 그 테이블만 다시 로드해 fork)
+
+        같은 테넌트/버전/무효화 세대의 동시 로드는 한 번만 실행하고 나머지는 결과를 기다린다
+        (flight_stats()로 대기 시간 확인). load_tables에서 발생한 예외는 기다리던 호출 모두에
+        그대로 전달한다 (실패 결과는 보관하지 않음).
+
+        Args:
+            tenant: 테넌트 ID
+            load_tables: (테이블 목록, None이면 전체) → CatalogLoad
+
+        Returns:
+            SharedCatalog
+        """
+        with self._lock:
+            catalog = self._current.get(tenant)
+            if catalog is not None and tenant not in self._stale:
+                return catalog
+            key = (tenant, catalog.version if catalog is not None else None, self._generations.get(tenant, 0))
+
+        def load() -> SharedCatalog:
+            with self._tenant_lock(tenant):
+                with self._lock:
+                    current = self._current.get(tenant)
+                    if current is not None and tenant not in self._stale:
+                        return current  # 갱신(refresh)이 먼저 끝남
+                return self._reload(tenant, load_tables)
+
+        return self._flights.do(key, load)
+
+    def refresh(self, tenant: str, load_tables: Callable[[Optional[List[str]]], CatalogLoad],
+                tables: Optional[Iterable[str]] = None) -> SharedCatalog:
+        """
+        현재 카탈로그를 그대로 제공하면서 새 버전 로드 (백그라운드 워밍/주기 갱신용)
+
+        invalidate() + get_or_load()와 달리 로드하는 동안에도 get_or_load()는
+        기다리지 않고 현재 버전을 반환하며, 로드가 끝나면 새 버전으로 교체된다.
+
+        Args:
+            tenant: 테넌트 ID
+            load_tables: (테이블 목록, None이면 전체) → CatalogLoad
+            tables: 다시 읽을 테이블 (None이면 현재 카탈로그의 전체 테이블)
+
+        Returns:
+            새 SharedCatalog (내용이 같으면 버전도 같음)
+        """
+        with self._tenant_lock(tenant):
+            catalog = self.current(tenant)
+            refresh = tables if tables is not None else (catalog.tables if catalog is not None else ())
+            return self._reload(tenant, load_tables, refresh)
+
+    def _reload(self, tenant: str, load_tables: Callable[[Optional[List[str]]], CatalogLoad],
+                refresh: Iterable[str] = ()) -> SharedCatalog:
+        """무효화된 테이블(+ refresh)을 다시 읽어 게시 (테넌트 락을 잡은 상태에서 호출)"""
+        with self._lock:
+            catalog = self._current.get(tenant)
+            stale = self._stale.get(tenant, set())
+            generation = self._generations.get(tenant, 0)
+
+        if catalog is None or stale is None:
+            loaded = load_tables(None)
+            catalog = SharedCatalog(tenant, loaded.tables, loaded.timings,
+                                    loaded.table_versions, loaded.memory_report)
+        else:
+            loaded = load_tables(sorted(stale | set(refresh)))
+            forked = catalog.fork(loaded.tables, loaded.timings, loaded.memory_report, loaded.table_versions)
+            if forked.version != catalog.version:
+                catalog = forked  # 내용이 같으면 기존 버전(파생 객체 포함)을 그대로 사용
+        self._publish(tenant, catalog, generation)
+        return catalog
+
+    def _publish(self, tenant: str, catalog: SharedCatalog, generation: int) -> None:
+        with self._lock:
+            self._current[tenant] = catalog
+            if self._generations.get(tenant, 0) == generation:
+                self._stale.pop(tenant, None)  # 로드 중에 들어온 무효화는 남겨서 다음 조회 때 반영
+            recent = [c for c in self._recent.get(tenant, []) if c.version != catalog.version]
+            self._recent[tenant] = ([catalog] + recent)[:self.versions_per_tenant]
+
+    def invalidate(self, tenant: str, tables: Optional[Iterable[str]] = None) -> None:
+        """
+        다음 조회 때 다시 로드하도록 표시 (쓰기 경로에서 호출)
+
+        Args:
+            tenant: 테넌트 ID
+            tables: 바뀐 테이블 (None이면 전체)
+        """
+        with self._lock:
+            if tenant not in self._current:
+                return
+            self._generations[tenant] = self._generations.get(tenant, 0) + 1
+            if tables is None:
+                self._stale[tenant] = None
+            elif self._stale.get(tenant, set()) is not None:
+                self._stale[tenant] = self._stale.get(tenant, set()) | set(tables)
+
+    def clear(self, tenant: Optional[str] = None) -> None:
+        """보관 중인 카탈로그 폐기 (tenant None이면 전체)"""
+        with self._lock:
+            for store in (self._current, self._recent, self._stale):
+                if tenant is None:
+                    store.clear()
+                else:
+                    store.pop(tenant, None)
+
+    def flight_stats(self, tenant: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        카탈로그 로드 병합 통계 (대기한 세션 수/대기 시간)
+
+        Returns:
+            {'tenant@버전': {'calls', 'runs', 'shared', 'wait_sec', 'max_wait_sec', 'avg_wait_sec', ...}}
+        """
+        flights = self._flights.stats(lambda key: tenant is None or key[0] == tenant)
+        return {f"{t}@{version or 'cold'}#{generation}": stats for (t, version, generation), stats in flights.items()}
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """테넌트별 현재 버전/보관 버전 수/메모리(bytes)"""
+        with self._lock:
+            return {
+                tenant: {
+                    'version': catalog.version,
+                    'versions': len(self._recent.get(tenant, [])),
+                    'stale': tenant in self._stale,
+                    'bytes': catalog.nbytes(),
+                }
+                for tenant, catalog in self._current.items()
+            }
+
+
+_catalog_registry: Optional[CatalogRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_catalog_registry() -> CatalogRegistry:
+    """프로세스 공유 CatalogRegistry (최초 호출 시 생성)"""
+    global _catalog_registry
+    if _catalog_registry is None:
+        with _registry_lock:
+            if _catalog_registry is None:
+                _catalog_registry = CatalogRegistry()
+    return _catalog_registry
@@ -0,0 +1,146 @@
+"""
+SingleFlight - 같은 키의 동시 조회를 한 번의 실행으로 병합
+여러 세션이 동시에 같은 테이블을 조회해도 Supabase에는 한 번만 요청
+
+- 키별로 먼저 들어온 호출(leader)만 실행, 나머지는 완료를 기다렸다가 같은 결과를 받음
+- 예외도 기다리던 호출 모두에게 그대로 전달 (결과는 보관하지 않음 - 캐시는 호출자 몫)
+- 키별 통계: 실행/병합 횟수, 실행 시간, 대기 시간(합계/최대)
+- 스레드 안전, 같은 스레드에서 같은 키로 재진입하면 교착되므로 주의
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+import time
+
+
+class _Flight:
+    """진행 중인 실행 하나"""
+
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    키별 동시 실행 병합
+
+    Usage:
+        flights = SingleFlight()
+        df = flights.do(('dooho', 'models', version), lambda: fetch_models())
+        flights.stats()
+    """
+
+    DEFAULT_MAX_KEYS = 1024  # 통계를 보관할 키 수 상한 (초과 시 오래된 키부터 제거)
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS):
+        """
+        SingleFlight 초기화
+
+        Args:
+            max_keys: 통계 보관 키 수
+        """
+        self.max_keys = max_keys
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._stats: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        key로 진행 중인 실행이 있으면 기다렸다가 그 결과를, 없으면 fn()을 실행
+
+        Args:
+            key: 병합 키 (예: (테넌트, 테이블, 버전))
+            fn: 실제 조회 함수
+
+        Returns:
+            fn() 결과 (병합된 호출은 같은 객체를 공유하므로 수정 금지)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.waiters += 1
+
+        start = time.perf_counter()
+        if leader:
+            try:
+                flight.value = fn()
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._flights.pop(key, None)
+                    self._record(key, time.perf_counter() - start, leader=True,
+                                 error=flight.error is not None, waiters=flight.waiters)
+                flight.done.set()
+            return flight.value
+
+        flight.done.wait()
+        with self._lock:
+            self._record(key, time.perf_counter() - start, leader=False, error=flight.error is not None)
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def in_flight(self) -> int:
+        """진행 중인 실행 수"""
+        with self._lock:
+            return len(self._flights)
+
+    def _record(self, key: Hashable, elapsed: float, leader: bool, error: bool, waiters: int = 0) -> None:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = {'calls': 0, 'runs': 0, 'shared': 0, 'errors': 0, 'max_waiters': 0,
+                     'run_sec': 0.0, 'wait_sec': 0.0, 'max_wait_sec': 0.0}
+            self._stats[key] = stats
+        self._stats.move_to_end(key)
+        stats['calls'] += 1
+        if leader:
+            stats['runs'] += 1
+            stats['run_sec'] += elapsed
+            stats['max_waiters'] = max(stats['max_waiters'], waiters)
+        else:
+            stats['shared'] += 1
+            stats['wait_sec'] += elapsed
+            stats['max_wait_sec'] = max(stats['max_wait_sec'], elapsed)
+        if error:
+            stats['errors'] += 1
+        while len(self._stats) > self.max_keys:
+            self._stats.popitem(last=False)
+
+    def stats(self, match: Optional[Callable[[Hashable], bool]] = None) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        키별 통계
+
+        Args:
+            match: 키 필터 (None이면 전체)
+
+        Returns:
+            {키: {'calls', 'runs', 'shared', 'errors', 'max_waiters',
+                  'run_sec', 'wait_sec', 'max_wait_sec', 'avg_wait_sec'}}
+        """
+        with self._lock:
+            result = {}
+            for key, stats in self._stats.items():
+                if match is not None and not match(key):
+                    continue
+                result[key] = {
+                    **{name: round(value, 4) if isinstance(value, float) else value for name, value in stats.items()},
+                    'avg_wait_sec': round(stats['wait_sec'] / stats['shared'], 4) if stats['shared'] else 0.0,
+                }
+            return result
+
+    def clear(self) -> None:
+        """통계 초기화 (진행 중인 실행은 그대로)"""
+        with self._lock:
+            self._stats.clear()
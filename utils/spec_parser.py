@@ -0,0 +1,252 @@
+"""
+규격(spec) 파서 - 규격 문자열을 한 번만 해석해 순서 무관 정규 키로 변환
+75*75*2.0T / 75x75x2.0T / Ø10 / W2000 같은 규격을 구조화된 값으로 바꾸고
+카탈로그 로드 시 models/main_materials/sub_materials에 키 컬럼으로 저장
+
+- normalize_spec: 특수문자 정규화 (x → *, ∅/Φ/φ → Ø, 대문자)
+- parse_spec: 치수(정렬)/두께/지름/폭/높이/길이/단위
+- spec_key: 순서 무관 비교 키 (같은 키 = 같은 규격)
+- width_mm: model_standard의 폭(mm)
+- spec_dimensions: 폭/높이/두께 숫자 (치수 범위 색인용)
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+import re
+
+import pandas as pd
+
+
+SPEC_CACHE_SIZE = 8192  # 규격 문자열별 파싱 결과 메모이제이션 크기
+
+# 카탈로그 테이블별 규격 원본 컬럼 (load_data 컬럼 변환 후 기준)
+SPEC_SOURCE_COLUMNS = {
+    'models': 'model_standard',
+    'main_materials': '규격',
+    'sub_materials': '규격',
+}
+SPEC_KEY_COLUMN = 'spec_key'  # 순서 무관 비교 키
+SPEC_NORM_COLUMN = 'spec_norm'  # 정규화 문자열 (부분 검색용)
+# 숫자 치수 컬럼 (mm, 없으면 NaN) - 치수 검색의 범위 색인용
+DIMENSION_COLUMNS = {'width': 'dim_width', 'height': 'dim_height', 'thickness': 'dim_thickness'}
+
+_NUMBER = r'\d+(?:\.\d+)?'
+_RECT_PATTERN = re.compile(r'(\d+)\*(\d+)\*(.+)')
+_THICKNESS_PATTERN = re.compile(rf'^({_NUMBER})\s*T$')
+_THICKNESS_ANY_PATTERN = re.compile(rf'({_NUMBER})\s*T(?![A-Z])')
+_DIAMETER_PATTERN = re.compile(rf'Ø\s*({_NUMBER})')
+_WIDTH_PATTERN = re.compile(rf'W\s*({_NUMBER})')
+_HEIGHT_PATTERN = re.compile(rf'H\s*({_NUMBER})')
+_LENGTH_PATTERN = re.compile(rf'×\s*({_NUMBER})\s*(MM|M)(?![A-Z])')
+_DIMS_PATTERN = re.compile(rf'^({_NUMBER}(?:\s*\*\s*{_NUMBER})+)')
+_WIDTH_MM_PATTERN = re.compile(r'[Ww\uFF37\ubc15]?\s*[-_×x]?\s*(\d{3,5})')
+_DIGITS_PATTERN = re.compile(r'(\d{3,5})')
+
+
+class ParsedSpec(NamedTuple):
+    """구조화된 규격 (없는 값은 None)"""
+    normalized: str
+    dims: Tuple[float, ...]  # 오름차순 정렬
+    thickness: Optional[float]
+    diameter: Optional[float]
+    width: Optional[float]
+    height: Optional[float]
+    length: Optional[float]
+    unit: Optional[str]  # 길이 단위 (M / MM)
+    key: str
+
+
+def _canonical_number(text: str) -> str:
+    """'2.0' → '2', '2.10' → '2.1', '075' → '75'"""
+    value = float(text)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _to_float(match) -> Optional[float]:
+    return float(match.group(1)) if match else None
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def normalize_spec(spec: str) -> str:
+    """
+    특수문자 정규화 (x, X → *, 지름 기호 → Ø, 대문자)
+
+    Args:
+        spec: 규격 문자열
+
+    Returns:
+        정규화된 규격
+    """
+    normalized = spec.replace('x', '*').replace('X', '*')
+    normalized = normalized.replace('∅', 'Ø').replace('Φ', 'Ø').replace('φ', 'Ø')
+    return normalized.upper()
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def spec_key(spec: str) -> str:
+    """
+    순서 무관 규격 비교 키
+
+    '가로*세로*두께' 형태는 가로/세로를 정렬하고 숫자 표기를 통일한다
+    (75x50x2.0T, 50*75*2T → 'R:50*75*2T'). 그 외 규격은 정규화 문자열을 쓴다.
+
+    Args:
+        spec: 규격 문자열
+
+    Returns:
+        비교 키 (빈 규격이면 '')
+    """
+    clean = str(spec).strip()
+    if not clean:
+        return ''
+    normalized = normalize_spec(clean)
+    rect = _RECT_PATTERN.match(normalized)
+    if rect:
+        dim1, dim2, thickness = rect.groups()
+        dims = sorted((int(dim1), int(dim2)))
+        thickness = thickness.strip()
+        thickness_match = _THICKNESS_PATTERN.match(thickness)
+        if thickness_match:
+            thickness = f"{_canonical_number(thickness_match.group(1))}T"
+        return f"R:{dims[0]}*{dims[1]}*{thickness}"
+    return f"S:{normalized}"
+
+
+def _leading_dims(normalized: str) -> Tuple[float, ...]:
+    """앞쪽 '가로*세로(*...)' 치수 (표기 순서, 두께 제외)"""
+    dims_match = _DIMS_PATTERN.match(normalized)
+    if not dims_match:
+        return ()
+    parts = dims_match.group(1).split('*')
+    if normalized[dims_match.end():].lstrip().startswith('T'):
+        parts = parts[:-1]  # 마지막 숫자는 두께 (75*75*2.0T)
+    return tuple(float(part) for part in parts)
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def parse_spec(spec: str) -> ParsedSpec:
+    """
+    규격 문자열 → 구조화된 규격
+
+    Args:
+        spec: 규격 문자열 (예: '75*75*2.0T×6m', 'Ø10', 'W2000*H1200')
+
+    Returns:
+        ParsedSpec
+    """
+    normalized = normalize_spec(str(spec).strip())
+
+    dims = tuple(sorted(_leading_dims(normalized)))
+    length_match = _LENGTH_PATTERN.search(normalized)
+    return ParsedSpec(
+        normalized=normalized,
+        dims=dims,
+        thickness=_to_float(_THICKNESS_ANY_PATTERN.search(normalized)),
+        diameter=_to_float(_DIAMETER_PATTERN.search(normalized)),
+        width=_to_float(_WIDTH_PATTERN.search(normalized)),
+        height=_to_float(_HEIGHT_PATTERN.search(normalized)),
+        length=_to_float(length_match),
+        unit=length_match.group(2) if length_match else None,
+        key=spec_key(spec),
+    )
+
+
+def specs_match(spec_a, spec_b) -> bool:
+    """두 규격이 순서 무관하게 같은지 (빈 규격은 항상 불일치)"""
+    key_a = spec_key(str(spec_a)) if spec_a is not None else ''
+    return bool(key_a) and key_a == (spec_key(str(spec_b)) if spec_b is not None else '')
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def width_mm(std: str) -> Optional[float]:
+    """
+    model_standard의 폭 숫자(3~5자리) 추출 (W/폭 접두어 우선, 없으면 첫 숫자)
+
+    Args:
+        std: model_standard
+
+    Returns:
+        폭 숫자 (없으면 None)
+    """
+    for pattern in (_WIDTH_MM_PATTERN, _DIGITS_PATTERN):
+        match = pattern.search(std)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def spec_dimensions(spec: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    규격의 폭/높이/두께 숫자 (W/H/T 표기 우선, 없으면 '가로*세로' 표기 순서)
+
+    Args:
+        spec: 규격 문자열 (예: 'W2000*H1200', '75*50*2.0T', '폭2000mm')
+
+    Returns:
+        (폭, 높이, 두께) - 없는 값은 None
+    """
+    parsed = parse_spec(spec)
+    leading = _leading_dims(parsed.normalized)
+    width = parsed.width if parsed.width is not None else (leading[0] if leading else None)
+    height = parsed.height if parsed.height is not None else (leading[1] if len(leading) > 1 else None)
+    if width is None and height is None:
+        width = width_mm(str(spec))
+    return width, height, parsed.thickness
+
+
+# ============================================================================
+# DataFrame 컬럼
+# ============================================================================
+
+def add_spec_columns(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    카탈로그 테이블에 규격 키 컬럼(spec_key, spec_norm)과 숫자 치수 컬럼(dim_*) 추가 (제자리 수정)
+
+    Args:
+        table: 테이블명 (SPEC_SOURCE_COLUMNS에 없으면 그대로 반환)
+        df: 컬럼 변환이 끝난 테이블
+
+    Returns:
+        같은 DataFrame
+    """
+    source = SPEC_SOURCE_COLUMNS.get(table)
+    if df.empty or source not in df.columns:
+        return df
+    # 증분 동기화로 행이 바뀌었을 수 있으므로 항상 다시 계산 (규격별 결과는 메모이제이션)
+    df.drop(columns=[SPEC_KEY_COLUMN, SPEC_NORM_COLUMN, *DIMENSION_COLUMNS.values()], errors='ignore', inplace=True)
+    df[SPEC_KEY_COLUMN] = spec_key_series(df, source)
+    df[SPEC_NORM_COLUMN] = spec_norm_series(df, source)
+    for column, values in dimension_frame(df, source).items():
+        df[column] = values
+    return df
+
+
+def spec_key_series(df: pd.DataFrame, source: str) -> pd.Series:
+    """규격 키 Series (spec_key 컬럼이 있으면 재사용, NULL 규격은 '')"""
+    if SPEC_KEY_COLUMN in df.columns:
+        return df[SPEC_KEY_COLUMN]
+    values = df[source]
+    return pd.Series(
+        ['' if pd.isna(v) else spec_key(str(v)) for v in values],
+        index=df.index, dtype=object,
+    )
+
+
+def spec_norm_series(df: pd.DataFrame, source: str) -> pd.Series:
+    """정규화 규격 Series (spec_norm 컬럼이 있으면 재사용)"""
+    if SPEC_NORM_COLUMN in df.columns:
+        return df[SPEC_NORM_COLUMN]
+    return df[source].map(lambda value: normalize_spec(str(value)))
+
+
+def dimension_frame(df: pd.DataFrame, source: str) -> pd.DataFrame:
+    """숫자 치수 DataFrame (dim_width/dim_height/dim_thickness, mm, 없는 값은 NaN)"""
+    columns = list(DIMENSION_COLUMNS.values())
+    if all(column in df.columns for column in columns):
+        return df[columns].astype(float)
+    rows = [
+        (None, None, None) if pd.isna(v) else spec_dimensions(str(v))
+        for v in df[source]
+    ]
+    return pd.DataFrame(rows, columns=columns, index=df.index, dtype=float)
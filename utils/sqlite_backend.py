@@ -0,0 +1,491 @@
+"""
+SqliteClient - PtopEngine 로컬 SQLite 백엔드
+Supabase(PostgREST) 쿼리 빌더와 같은 호출 형태를 SQLite로 실행
+
+- PtopEngine(SqliteClient('ptop_local.db'), tenant_id='dooho') 로 그대로 사용
+- 테이블: models, bom, pricing, main_materials, sub_materials, inventory
+- 인덱스: (tenant_id, model_id), (tenant_id, product_name, standard) 등
+- sync_tenant(): Supabase 테넌트 데이터를 로컬 DB로 미러링
+
+Usage:
+    python -m utils.sqlite_backend --tenant dooho --db ptop_local.db
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+
+
+# ========================================================================
+# 스키마
+# ========================================================================
+
+# 테이블별 기본 컬럼 (미러링 시 추가 컬럼은 자동으로 ALTER TABLE ADD COLUMN)
+TABLE_COLUMNS = {
+    'models': [
+        'id', 'tenant_id', 'model_id', 'model_name', 'category', 'model_standard',
+        'identifier_number', 'description', 'created_at', 'updated_at',
+    ],
+    'bom': [
+        'id', 'tenant_id', 'model_id', 'model_name', 'material_name', 'standard', 'quantity REAL',
+        'unit', 'category', 'material_type', 'notes', 'unit_price REAL', 'created_at', 'updated_at',
+    ],
+    'pricing': [
+        'id', 'tenant_id', 'model_name', 'standard', 'unit', 'unit_price REAL', 'created_at', 'updated_at',
+    ],
+    'main_materials': [
+        'id', 'tenant_id', 'product_name', 'standard', 'unit_length_m REAL', 'unit_price REAL',
+        'material_type', 'created_at', 'updated_at',
+    ],
+    'sub_materials': [
+        'id', 'tenant_id', 'product_name', 'standard', 'unit', 'unit_price REAL', 'supplier', 'notes',
+        'created_at', 'updated_at',
+    ],
+    'inventory': [
+        'id', 'tenant_id', 'item_id', 'product_name', 'standard', 'thickness', 'unit_length_m REAL',
+        'unit_price REAL', 'current_quantity REAL', 'unit', 'supplier', 'notes', 'created_at', 'updated_at',
+    ],
+}
+
+TABLE_INDEXES = {
+    'models': [('tenant_id', 'model_id'), ('tenant_id', 'model_name')],
+    'bom': [('tenant_id', 'model_id')],
+    'pricing': [('tenant_id', 'model_name')],
+    'main_materials': [('tenant_id', 'product_name', 'standard')],
+    'sub_materials': [('tenant_id', 'product_name', 'standard')],
+    'inventory': [('tenant_id', 'product_name', 'standard'), ('tenant_id', 'item_id')],
+}
+
+# 모든 테이블 공통: keyset 페이징(id), 증분 동기화(updated_at)
+COMMON_INDEXES = [('tenant_id', 'id'), ('tenant_id', 'updated_at')]
+
+
+class SqliteResult:
+    """PostgREST 응답과 같은 형태 (data 속성)"""
+
+    def __init__(self, data: List[Dict[str, Any]]):
+        self.data = data
+        self.count = len(data)
+
+
+# ========================================================================
+# 클라이언트
+# ========================================================================
+
+class SqliteClient:
+    """
+    Supabase Client 대용 (schema/table 쿼리 빌더)
+
+    Usage:
+        client = SqliteClient('ptop_local.db')
+        engine = PtopEngine(client, tenant_id='dooho')
+    """
+
+    def __init__(self, path: str = 'ptop_local.db'):
+        """
+        SqliteClient 초기화 (테이블/인덱스가 없으면 생성)
+
+        Args:
+            path: SQLite 파일 경로 (':memory:' 가능)
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.RLock()
+        self._columns: Dict[str, List[str]] = {}
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        """테이블 및 인덱스 생성"""
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            for table, columns in TABLE_COLUMNS.items():
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS {_ident(table)} ({", ".join(columns)})')
+                for index_columns in TABLE_INDEXES.get(table, []) + COMMON_INDEXES:
+                    name = f"idx_{table}_{'_'.join(index_columns)}"
+                    self.conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS {_ident(name)} ON {_ident(table)} ({", ".join(index_columns)})'
+                    )
+
+    def schema(self, name: str) -> 'SqliteClient':
+        """스키마 선택 (로컬 DB는 단일 스키마이므로 무시)"""
+        return self
+
+    def table(self, name: str) -> 'SqliteQuery':
+        """테이블 쿼리 빌더"""
+        return SqliteQuery(self, name)
+
+    def table_columns(self, table: str) -> List[str]:
+        """테이블 컬럼 목록 (캐시)"""
+        if table not in self._columns:
+            with self.lock:
+                rows = self.conn.execute(f'PRAGMA table_info({_ident(table)})').fetchall()
+            if not rows:
+                raise ValueError(f"테이블 없음: {table}")
+            self._columns[table] = [r['name'] for r in rows]
+        return self._columns[table]
+
+    def ensure_columns(self, table: str, columns: Sequence[str]) -> None:
+        """없는 컬럼 추가 (Supabase 쪽 컬럼이 더 많은 경우)"""
+        missing = [c for c in columns if c not in self.table_columns(table)]
+        if not missing:
+            return
+        with self.lock, self.conn:
+            for column in missing:
+                self.conn.execute(f'ALTER TABLE {_ident(table)} ADD COLUMN {_ident(column)}')
+        self._columns.pop(table, None)
+
+    def replace_tenant_rows(self, table: str, tenant_id: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        테넌트 행 전체 교체 (단일 트랜잭션)
+
+        Returns:
+            저장된 행 수
+        """
+        columns = list(dict.fromkeys(c for row in rows for c in row))
+        self.ensure_columns(table, columns)
+        with self.lock, self.conn:
+            self.conn.execute(f'DELETE FROM {_ident(table)} WHERE tenant_id = ?', (tenant_id,))
+            if rows:
+                placeholders = ', '.join('?' for _ in columns)
+                column_sql = ', '.join(f'{_ident(c)}' for c in columns)
+                self.conn.executemany(
+                    f'INSERT INTO {_ident(table)} ({column_sql}) VALUES ({placeholders})',
+                    [tuple(_to_sql_value(row.get(c)) for c in columns) for row in rows],
+                )
+        return len(rows)
+
+
+def _ident(name: str) -> str:
+    """SQL 식별자 인용"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _to_sql_value(value: Any) -> Any:
+    """dict/list는 JSON 문자열로 저장"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ========================================================================
+# 쿼리 빌더
+# ========================================================================
+
+class SqliteQuery:
+    """PostgREST 쿼리 빌더 호환 (PtopEngine이 사용하는 메서드)"""
+
+    def __init__(self, client: SqliteClient, table: str):
+        self.client = client
+        self.table = table
+        self.op = 'select'
+        self.columns = '*'
+        self.payload: Any = None
+        self.on_conflict: Optional[str] = None
+        self.where: List[str] = []
+        self.params: List[Any] = []
+        self.order_by: List[str] = []
+        self.limit_count: Optional[int] = None
+        self.offset_count: Optional[int] = None
+
+    # ---------- 조회 / 쓰기 종류 ----------
+    def select(self, columns: str = '*', **kwargs) -> 'SqliteQuery':
+        self.columns = columns
+        return self
+
+    def insert(self, payload) -> 'SqliteQuery':
+        self.op, self.payload = 'insert', payload
+        return self
+
+    def upsert(self, payload, on_conflict: Optional[str] = None, **kwargs) -> 'SqliteQuery':
+        self.op, self.payload, self.on_conflict = 'upsert', payload, on_conflict
+        return self
+
+    def update(self, payload: Dict[str, Any]) -> 'SqliteQuery':
+        self.op, self.payload = 'update', payload
+        return self
+
+    def delete(self) -> 'SqliteQuery':
+        self.op = 'delete'
+        return self
+
+    # ---------- 필터 ----------
+    def _add(self, sql: str, *params) -> 'SqliteQuery':
+        self.where.append(sql)
+        self.params.extend(params)
+        return self
+
+    def eq(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} = ?', value)
+
+    def neq(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} <> ?', value)
+
+    def gt(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} > ?', value)
+
+    def gte(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} >= ?', value)
+
+    def lt(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} < ?', value)
+
+    def lte(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} <= ?', value)
+
+    def is_(self, column: str, value) -> 'SqliteQuery':
+        return self._add(f'{_ident(column)} IS NULL' if value in (None, 'null') else f'{_ident(column)} IS NOT NULL')
+
+    def in_(self, column: str, values) -> 'SqliteQuery':
+        values = list(values)
+        if not values:
+            return self._add('0 = 1')
+        return self._add(f'{_ident(column)} IN ({", ".join("?" for _ in values)})', *values)
+
+    def ilike(self, column: str, pattern: str) -> 'SqliteQuery':
+        # SQLite LIKE는 ASCII 대소문자 무시 (PostgREST의 * 와일드카드도 허용)
+        return self._add(f'{_ident(column)} LIKE ?', pattern.replace('*', '%'))
+
+    def like(self, column: str, pattern: str) -> 'SqliteQuery':
+        return self.ilike(column, pattern)
+
+    def match(self, conditions: Dict[str, Any]) -> 'SqliteQuery':
+        for column, value in conditions.items():
+            self.eq(column, value)
+        return self
+
+    def or_(self, expression: str) -> 'SqliteQuery':
+        """PostgREST or 필터 (col.op.value / and(...) 조합)"""
+        sql, params = _compile_logic(expression, 'OR')
+        return self._add(f'({sql})', *params)
+
+    # ---------- 정렬 / 범위 ----------
+    def order(self, column: str, desc: bool = False) -> 'SqliteQuery':
+        self.order_by.append(f'{_ident(column)} {"DESC" if desc else "ASC"}')
+        return self
+
+    def limit(self, count: int) -> 'SqliteQuery':
+        self.limit_count = int(count)
+        return self
+
+    def range(self, start: int, end: int) -> 'SqliteQuery':
+        self.offset_count = int(start)
+        self.limit_count = int(end) - int(start) + 1
+        return self
+
+    # ---------- 실행 ----------
+    def execute(self) -> SqliteResult:
+        with self.client.lock:
+            if self.op == 'select':
+                return SqliteResult(self._select(self.columns))
+            with self.client.conn:
+                if self.op == 'insert':
+                    return SqliteResult([self._insert(row) for row in self._rows()])
+                if self.op == 'upsert':
+                    return SqliteResult([self._upsert(row) for row in self._rows()])
+                if self.op == 'update':
+                    return SqliteResult(self._update())
+                return SqliteResult(self._delete())
+
+    def _rows(self) -> List[Dict[str, Any]]:
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        self.client.ensure_columns(self.table, list(dict.fromkeys(c for row in rows for c in row)))
+        return rows
+
+    def _where_sql(self) -> str:
+        return f' WHERE {" AND ".join(self.where)}' if self.where else ''
+
+    def _select(self, columns: str) -> List[Dict[str, Any]]:
+        column_sql = '*' if columns.strip() == '*' else ', '.join(
+            f'{_ident(c.strip())}' for c in columns.split(',') if c.strip()
+        )
+        sql = f'SELECT {column_sql} FROM {_ident(self.table)}{self._where_sql()}'
+        if self.order_by:
+            sql += f' ORDER BY {", ".join(self.order_by)}'
+        if self.limit_count is not None or self.offset_count is not None:
+            sql += f' LIMIT {self.limit_count if self.limit_count is not None else -1}'
+            sql += f' OFFSET {self.offset_count or 0}'
+        return [dict(r) for r in self.client.conn.execute(sql, self.params).fetchall()]
+
+    def _fetch_rowid(self, rowid: int) -> Dict[str, Any]:
+        row = self.client.conn.execute(f'SELECT * FROM {_ident(self.table)} WHERE rowid = ?', (rowid,)).fetchone()
+        return dict(row) if row else {}
+
+    def _insert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        values = dict(row)
+        now = _now_iso()
+        values.setdefault('created_at', now)
+        values['updated_at'] = values.get('updated_at') or now
+        columns = list(values)
+        cursor = self.client.conn.execute(
+            f'INSERT INTO {_ident(self.table)} ({", ".join(_ident(c) for c in columns)}) '
+            f'VALUES ({", ".join("?" for _ in columns)})',
+            [_to_sql_value(values[c]) for c in columns],
+        )
+        if values.get('id') is None:
+            # Supabase의 자동 증가 id와 같은 역할 (keyset 페이징 키)
+            self.client.conn.execute(f'UPDATE {_ident(self.table)} SET id = rowid WHERE rowid = ?', (cursor.lastrowid,))
+        return self._fetch_rowid(cursor.lastrowid)
+
+    def _upsert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        keys = [k.strip() for k in (self.on_conflict or 'id').split(',')]
+        key_sql = ' AND '.join(f'{_ident(k)} IS ?' for k in keys)
+        key_params = [row.get(k) for k in keys]
+        existing = self.client.conn.execute(
+            f'SELECT rowid FROM {_ident(self.table)} WHERE {key_sql}', key_params
+        ).fetchone()
+        if existing is None:
+            return self._insert(row)
+
+        values = {c: v for c, v in row.items() if c not in keys}
+        values['updated_at'] = _now_iso()
+        self.client.conn.execute(
+            f'UPDATE {_ident(self.table)} SET {", ".join(f"{_ident(c)} = ?" for c in values)} WHERE rowid = ?',
+            [_to_sql_value(v) for v in values.values()] + [existing[0]],
+        )
+        return self._fetch_rowid(existing[0])
+
+    def _update(self) -> List[Dict[str, Any]]:
+        self.client.ensure_columns(self.table, list(self.payload))
+        values = dict(self.payload)
+        values['updated_at'] = _now_iso()
+        rowids = [r[0] for r in self.client.conn.execute(
+            f'SELECT rowid FROM {_ident(self.table)}{self._where_sql()}', self.params
+        ).fetchall()]
+        for rowid in rowids:
+            self.client.conn.execute(
+                f'UPDATE {_ident(self.table)} SET {", ".join(f"{_ident(c)} = ?" for c in values)} WHERE rowid = ?',
+                [_to_sql_value(v) for v in values.values()] + [rowid],
+            )
+        return [self._fetch_rowid(rowid) for rowid in rowids]
+
+    def _delete(self) -> List[Dict[str, Any]]:
+        deleted = self._select('*')
+        self.client.conn.execute(f'DELETE FROM {_ident(self.table)}{self._where_sql()}', self.params)
+        return deleted
+
+
+# ========================================================================
+# or/and 필터 파싱 (PostgREST 문법)
+# ========================================================================
+
+_FILTER_OPS = {'eq': '=', 'neq': '<>', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<=', 'like': 'LIKE', 'ilike': 'LIKE'}
+
+
+def _split_top_level(expression: str) -> List[str]:
+    """괄호/따옴표 밖의 쉼표 기준 분리"""
+    parts, depth, quoted, escaped, current = [], 0, False, False, []
+    for ch in expression:
+        if escaped:
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == '(':
+            depth += 1
+        elif not quoted and ch == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ',':
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(ch)
+    parts.append(''.join(current))
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', value[1:-1])
+    return value
+
+
+def _compile_logic(expression: str, joiner: str) -> Tuple[str, List[Any]]:
+    """'a.eq.1,and(b.eq.2,c.ilike.%x%)' → SQL 조건 + 파라미터"""
+    clauses, params = [], []
+    for part in _split_top_level(expression):
+        group = re.match(r'^(and|or)\((.*)\)$', part, re.S)
+        if group:
+            sql, sub_params = _compile_logic(group.group(2), group.group(1).upper())
+            clauses.append(f'({sql})')
+            params.extend(sub_params)
+            continue
+
+        column, op, value = part.split('.', 2)
+        if op == 'is':
+            clauses.append(f'{_ident(column)} IS NULL' if value == 'null' else f'{_ident(column)} IS NOT NULL')
+            continue
+        if op not in _FILTER_OPS:
+            raise ValueError(f"지원하지 않는 필터 연산: {op}")
+        value = _unquote(value)
+        if op in ('like', 'ilike'):
+            value = value.replace('*', '%')
+        clauses.append(f'{_ident(column)} {_FILTER_OPS[op]} ?')
+        params.append(value)
+    return f' {joiner} '.join(clauses) or '1 = 1', params
+
+
+# ========================================================================
+# Supabase → SQLite 미러링
+# ========================================================================
+
+def sync_tenant(supabase_client, sqlite_client: SqliteClient, tenant_id: str,
+                tables: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Supabase 테넌트 데이터를 로컬 SQLite로 미러링 (테이블별 전체 교체)
+
+    Args:
+        supabase_client: Supabase Client
+        sqlite_client: 대상 SqliteClient
+        tenant_id: 테넌트 ID
+        tables: 대상 테이블 (None이면 전체)
+
+    Returns:
+        {테이블: 저장된 행 수}
+    """
+    from utils.ptop_engine import PtopEngine
+    from utils.engine_cache import EngineCache
+
+    # 원격 조회는 공유 캐시를 거치지 않음 (항상 최신 데이터)
+    remote = PtopEngine(supabase_client, tenant_id=tenant_id, cache=EngineCache())
+    counts = {}
+    for table in (tables or list(TABLE_COLUMNS)):
+        rows = []
+        for page in remote.iter_table(table, prefetch=True):
+            rows.extend(page.astype(object).where(page.notna(), None).to_dict('records'))
+        counts[table] = sqlite_client.replace_tenant_rows(table, tenant_id, rows)
+        print(f"✅ {table}: {counts[table]}행 동기화")
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """동기화 명령: python -m utils.sqlite_backend --tenant dooho --db ptop_local.db"""
+    parser = argparse.ArgumentParser(description='Supabase 테넌트 → 로컬 SQLite 동기화')
+    parser.add_argument('--tenant', required=True, help='테넌트 ID (예: dooho)')
+    parser.add_argument('--db', default=os.getenv('PTOP_SQLITE_PATH', 'ptop_local.db'), help='SQLite 파일 경로')
+    parser.add_argument('--tables', nargs='*', choices=list(TABLE_COLUMNS), help='대상 테이블 (기본 전체)')
+    args = parser.parse_args(argv)
+
+    from supabase import create_client
+    url = os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        from app.config_supabase import SUPABASE_URL, SUPABASE_KEY
+        url, key = url or SUPABASE_URL, key or SUPABASE_KEY
+
+    counts = sync_tenant(create_client(url, key), SqliteClient(args.db), args.tenant, args.tables)
+    print(f"[INFO] 동기화 완료 ({args.tenant} → {args.db}): {sum(counts.values())}행")
+
+
+if __name__ == '__main__':
+    main()